@@ -0,0 +1,107 @@
+"""
+Benchmark Calculator.calculate_many against a Python loop over calculate.
+
+Both are compared with a bare loop calling the operations' functions, the
+arithmetic and overflow checks every row needs; what either takes beyond it
+is its per-row overhead. Batches with one operation symbol per row and with
+one symbol for the whole batch are measured.
+
+Run with: python -m benchmarks.bench_calculate_many [rows]
+"""
+
+import random
+import sys
+import timeit
+
+from calculator.calculator import Calculator
+from calculator.dispatch import add_value, divide_value, multiply_value, subtract_value
+from calculator.exceptions import CalculatorError
+
+VALUE_FUNCTIONS = {
+    "+": add_value,
+    "-": subtract_value,
+    "*": multiply_value,
+    "/": divide_value,
+}
+
+
+def build_rows(row_count: int, seed: int = 0):
+    """Build parallel operand and operator lists with a realistic mix."""
+    rng = random.Random(seed)
+    symbols = ["+", "-", "*", "/"]
+    firsts = [
+        rng.choice([rng.randint(-1000, 1000), rng.uniform(-1e6, 1e6)])
+        for _ in range(row_count)
+    ]
+    seconds = [
+        rng.choice([rng.randint(-1000, 1000), rng.uniform(-1e6, 1e6)])
+        for _ in range(row_count)
+    ]
+    operations = [rng.choice(symbols) for _ in range(row_count)]
+    return firsts, operations, seconds
+
+
+def loop_over_calculate(calculator, firsts, operations, seconds):
+    """Reference implementation: one calculate call per row."""
+    results = []
+    errors = []
+    for first, symbol, second in zip(firsts, operations, seconds):
+        try:
+            results.append(calculator.calculate(first, symbol, second))
+            errors.append(None)
+        except Exception as e:
+            results.append(None)
+            errors.append(type(e).__name__)
+    return results, errors
+
+
+def bare_loop(firsts, operations, seconds):
+    """Baseline: the operation function of each row, called directly."""
+    for first, symbol, second in zip(firsts, operations, seconds):
+        try:
+            VALUE_FUNCTIONS[symbol](first, second)
+        except CalculatorError:
+            pass
+
+
+def measure(runs, rounds: int = 7):
+    """
+    Return the best time of each run in seconds.
+
+    Runs are timed in alternating rounds so that machine noise affects all of
+    them alike.
+    """
+    best = [float("inf")] * len(runs)
+    for _ in range(rounds):
+        for index, run in enumerate(runs):
+            best[index] = min(best[index], timeit.timeit(run, number=1))
+    return best
+
+
+def main(row_count: int = 200_000) -> None:
+    """Run the benchmark and print per-row timings and overheads."""
+    calculator = Calculator()
+    firsts, mixed, seconds = build_rows(row_count)
+    print(f"rows: {row_count}")
+
+    for label, operations in [("mixed symbols", mixed), ("one symbol", "*")]:
+        symbols = [operations] * row_count if operations == "*" else operations
+        bare, loop, batch = (
+            elapsed / row_count * 1e9
+            for elapsed in measure(
+                [
+                    lambda: bare_loop(firsts, symbols, seconds),
+                    lambda: loop_over_calculate(calculator, firsts, symbols, seconds),
+                    lambda: calculator.calculate_many(firsts, operations, seconds),
+                ]
+            )
+        )
+        print(f"{label}:")
+        print(f"  bare functions: {bare:8.1f} ns/row")
+        print(f"  calculate loop: {loop:8.1f} ns/row  overhead {loop - bare:6.1f}")
+        print(f"  calculate_many: {batch:8.1f} ns/row  overhead {batch - bare:6.1f}")
+        print(f"  speedup:        {loop / batch:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,83 @@
+"""
+Benchmark columnar CSV evaluation against line-by-line batch evaluation.
+
+Evaluates the same random rows once as "a op b" text lines through
+evaluate_lines() and once as an a,op,b CSV through the columnar pipeline,
+reporting the time of each columnar stage and the memory held by the loaded
+columns compared with the same operands as Python lists.
+
+Run with: python -m benchmarks.bench_columnar [rows]
+"""
+
+import io
+import random
+import sys
+import time
+import tracemalloc
+
+from calculator import operations
+from calculator.batch import evaluate_lines, write_records
+from calculator.columnar import evaluate_columns, read_columns, write_columns
+
+
+def build_rows(row_count: int, seed: int = 0):
+    """Build random (a, op, b) rows as strings."""
+    rng = random.Random(seed)
+    return [
+        (
+            str(rng.randint(-(10**6), 10**6)),
+            rng.choice("+-*/"),
+            rng.choice(
+                [str(rng.randint(1, 999)), f"{rng.uniform(-1e3, 1e3):.4f}", "0"]
+            ),
+        )
+        for _ in range(row_count)
+    ]
+
+
+def timed(function, *args):
+    """Return (result, elapsed seconds) of a call."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main(row_count: int = 200_000) -> None:
+    """Run the benchmark and print stage timings and memory use."""
+    rows = build_rows(row_count)
+    lines = [f"{a} {op} {b}" for a, op, b in rows]
+    csv_text = "a,op,b\n" + "".join(f"{a},{op},{b}\n" for a, op, b in rows)
+    backend = "numpy" if operations.load_numpy() is not None else "python"
+    print(f"rows: {row_count}  backend: {backend}")
+
+    _, line_time = timed(write_records, evaluate_lines(lines), io.StringIO())
+    print(f"line-by-line batch:  {line_time * 1e3:8.1f} ms")
+
+    columns, read_time = timed(read_columns, io.StringIO(csv_text))
+    (results, error_codes), evaluate_time = timed(evaluate_columns, columns)
+    _, write_time = timed(write_columns, results, error_codes, io.StringIO())
+    total = read_time + evaluate_time + write_time
+    print(
+        f"columnar:            {total * 1e3:8.1f} ms  (read {read_time * 1e3:.1f}, "
+        f"evaluate {evaluate_time * 1e3:.1f}, write {write_time * 1e3:.1f})"
+    )
+
+    # Memory is traced in separate passes; tracing slows the loader down
+    tracemalloc.start()
+    loaded = read_columns(io.StringIO(csv_text))
+    columns_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    first = [float(a) for a, _, _ in rows]
+    second = [float(b) for _, _, b in rows]
+    symbols = [op for _, op, _ in rows]
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded, first, second, symbols
+    print(f"loaded columns:      {columns_bytes / 2**20:8.1f} MiB")
+    print(f"as Python lists:     {list_bytes / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
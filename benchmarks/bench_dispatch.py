@@ -0,0 +1,140 @@
+"""
+Micro-benchmark Calculator.calculate on the built-in operations.
+
+Compares the flat dispatch table of plain functions against the previous
+class-based path, which validated the symbol, fetched the Operation instance
+from a dict and called its execute() method, guarding the result with a
+generic abs() overflow check inside a try block.
+
+calculate() calls the operations' execute, which for the built-in operations
+are the *_value() functions of calculator.dispatch: a plain int or float
+result within range is returned without building a (status, value) outcome,
+and only failing or unusual calculations go through the outcome functions.
+
+Run with: python -m benchmarks.bench_dispatch
+"""
+
+import timeit
+
+from calculator.calculator import Calculator
+from calculator.exceptions import InvalidOperationError, OverflowError
+
+CASES = [
+    (5, "+", 3),
+    (123456, "-", 654321),
+    (-7, "*", 4),
+    (2.5, "*", 4.0),
+    (15, "/", -3),
+    (10.5, "-", 2.3),
+]
+
+
+class LegacyAddition:
+    """Addition.execute() as it was before the dispatch table."""
+
+    def execute(self, a, b):
+        try:
+            result = a + b
+            if abs(result) > 1e308:
+                raise OverflowError(f"Addition result {result} causes overflow")
+            return result
+        except (OverflowError, ValueError) as e:
+            raise OverflowError(f"Addition overflow: {a} + {b}") from e
+
+
+class LegacySubtraction:
+    """Subtraction.execute() as it was before the dispatch table."""
+
+    def execute(self, a, b):
+        try:
+            result = a - b
+            if abs(result) > 1e308:
+                raise OverflowError(f"Subtraction result {result} causes overflow")
+            return result
+        except (OverflowError, ValueError) as e:
+            raise OverflowError(f"Subtraction overflow: {a} - {b}") from e
+
+
+class LegacyMultiplication:
+    """Multiplication.execute() as it was before the dispatch table."""
+
+    def execute(self, a, b):
+        try:
+            result = a * b
+            if abs(result) > 1e308:
+                raise OverflowError(f"Multiplication result {result} causes overflow")
+            return result
+        except (OverflowError, ValueError) as e:
+            raise OverflowError(f"Multiplication overflow: {a} * {b}") from e
+
+
+class LegacyDivision:
+    """Division.execute() as it was before the dispatch table."""
+
+    def execute(self, a, b):
+        if b == 0:
+            raise ZeroDivisionError("Division by zero is not allowed")
+        try:
+            result = a / b
+            if abs(result) > 1e308:
+                raise OverflowError(f"Division result {result} causes overflow")
+            return result
+        except (OverflowError, ValueError) as e:
+            raise OverflowError(f"Division overflow: {a} / {b}") from e
+
+
+class LegacyCalculator:
+    """Calculator.calculate() as it was before the dispatch table."""
+
+    def __init__(self):
+        self.operations = {
+            "+": LegacyAddition(),
+            "-": LegacySubtraction(),
+            "*": LegacyMultiplication(),
+            "/": LegacyDivision(),
+        }
+
+    def is_valid_operation(self, symbol):
+        return symbol in self.operations
+
+    def calculate(self, a, operation_symbol, b):
+        if not self.is_valid_operation(operation_symbol):
+            raise InvalidOperationError(f"Invalid operation '{operation_symbol}'")
+        operation = self.operations[operation_symbol]
+        return operation.execute(a, b)
+
+
+def measure(calculators, cases, rounds: int = 7, number: int = 50_000):
+    """
+    Return the best mean latency in nanoseconds per call for each calculator.
+
+    Calculators are timed in alternating rounds so that machine noise affects
+    all of them alike.
+    """
+    best = [float("inf")] * len(calculators)
+    for _ in range(rounds):
+        for index, calculator in enumerate(calculators):
+            calculate = calculator.calculate
+
+            def run():
+                for a, symbol, b in cases:
+                    calculate(a, symbol, b)
+
+            best[index] = min(best[index], timeit.timeit(run, number=number))
+    return [elapsed / (number * len(cases)) * 1e9 for elapsed in best]
+
+
+def main() -> None:
+    """Run the benchmark and print per-call latencies."""
+    legacy_calculator, calculator = LegacyCalculator(), Calculator()
+    for case in CASES:
+        assert calculator.calculate(*case) == legacy_calculator.calculate(*case)
+
+    legacy, current = measure([legacy_calculator, calculator], CASES)
+    print(f"class dispatch:  {legacy:8.1f} ns/call")
+    print(f"dispatch table:  {current:8.1f} ns/call")
+    print(f"speedup:         {legacy / current:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
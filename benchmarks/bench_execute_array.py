@@ -0,0 +1,55 @@
+"""
+Benchmark Operation.execute_array against scalar execute() calls.
+
+Run with: python -m benchmarks.bench_execute_array [rows]
+"""
+
+import random
+import sys
+import timeit
+
+from calculator import operations
+from calculator.operations import Addition, Division, Multiplication, Subtraction
+
+
+def main(row_count: int = 1_000_000) -> None:
+    """Run the benchmark for every operation and print per-row timings."""
+    rng = random.Random(0)
+    a = [rng.uniform(-1e6, 1e6) for _ in range(row_count)]
+    b = [rng.choice([0.0, rng.uniform(-1e6, 1e6)]) for _ in range(row_count)]
+    np = operations.load_numpy()
+    backend = "numpy" if np is not None else "python"
+    if np is not None:
+        # Columns usually arrive as arrays already; measure that case too.
+        a_column = np.asarray(a)
+        b_column = np.asarray(b)
+    else:
+        a_column, b_column = a, b
+
+    print(f"rows: {row_count}  backend: {backend}")
+    for operation in (Addition(), Subtraction(), Multiplication(), Division()):
+        scalar_time = min(
+            timeit.repeat(
+                lambda: operation._execute_array_python(a, b), number=1, repeat=3
+            )
+        )
+        array_time = min(
+            timeit.repeat(lambda: operation.execute_array(a, b), number=1, repeat=3)
+        )
+        column_time = min(
+            timeit.repeat(
+                lambda: operation.execute_array(a_column, b_column),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            f"{operation.get_name():15s} scalar {scalar_time * 1e3:8.1f} ms  "
+            f"list {array_time * 1e3:8.1f} ms  "
+            f"column {column_time * 1e3:8.1f} ms  "
+            f"speedup {scalar_time / column_time:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,133 @@
+"""
+Benchmark fixed-point arithmetic against decimal.Decimal and floats.
+
+Prices with two decimal places are multiplied by rates with up to four,
+divided into instalments and summed, the kind of work finance users run at
+volume. Each variant parses the same decimal strings, so the fixed-point
+and Decimal totals must match to the last place. The column variants report
+parsing and arithmetic separately: the fixed-point columns are int64 arrays
+with each operation applied once per column.
+
+Fixed-point columns parse as fast as Decimal and compute several times
+faster. The scalar fixed-point path makes a few Python calls per parse and
+per operation, where Decimal runs in C, so it stays about twice as slow as
+Decimal; use columns for volume.
+
+Run with: python -m benchmarks.bench_fixed_point [rows]
+"""
+
+import random
+import sys
+import time
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from calculator.calculator import Calculator
+from calculator.fixed_point import FixedPoint
+from calculator.validation import InputValidator
+
+SCALE = 4
+
+
+def build_rows(row_count: int, seed: int = 0):
+    """Build (price, rate, instalments) decimal strings."""
+    rng = random.Random(seed)
+    return [
+        (
+            f"{rng.randint(1, 10**7) / 100:.2f}",
+            f"{rng.randint(1, 20_000) / 10_000:.4f}",
+            str(rng.randint(1, 36)),
+        )
+        for _ in range(row_count)
+    ]
+
+
+def fixed_point_total(rows):
+    """Compute the total with scaled ints."""
+    fixed = FixedPoint(SCALE)
+    parse, calculate = fixed.parse, fixed.calculate
+    total = 0
+    for price, rate, instalments in rows:
+        charge = calculate(parse(price), "*", parse(rate))
+        total = calculate(total, "+", calculate(charge, "/", parse(instalments)))
+    return fixed.format(total)
+
+
+def fixed_point_columns(rows):
+    """Parse the rows into scaled int columns."""
+    fixed = FixedPoint(SCALE)
+    return fixed, [fixed.parse_column(column) for column in zip(*rows)]
+
+
+def fixed_point_column_total(fixed, columns):
+    """Compute the total from scaled int columns."""
+    prices, rates, instalments = columns
+    charges, errors = fixed.calculate_columns(prices, "*", rates)
+    shares, share_errors = fixed.calculate_columns(charges, "/", instalments)
+    assert errors.count(None) == share_errors.count(None) == len(prices)
+    # Python ints, so the sum cannot wrap around
+    return fixed.format(sum(shares.tolist()))
+
+
+def decimal_columns(rows):
+    """Parse the rows into Decimal columns."""
+    return [[Decimal(cell) for cell in column] for column in zip(*rows)]
+
+
+def decimal_total(columns):
+    """Compute the total with Decimal, quantized to the same scale."""
+    unit = Decimal(1).scaleb(-SCALE)
+    total = Decimal(0)
+    for price, rate, instalments in zip(*columns):
+        charge = (price * rate).quantize(unit, ROUND_HALF_EVEN)
+        total += (charge / instalments).quantize(unit, ROUND_HALF_EVEN)
+    return str(total)
+
+
+def float_total(rows):
+    """Compute the total with floats through the ordinary calculator."""
+    calculator = Calculator()
+    parse, calculate = InputValidator.validate_number, calculator.calculate
+    total = 0
+    for price, rate, instalments in rows:
+        charge = calculate(parse(price), "*", parse(rate))
+        total = calculate(total, "+", calculate(charge, "/", parse(instalments)))
+    return f"{total:.{SCALE}f}"
+
+
+def timed(function, *args):
+    """Return (result, elapsed seconds) of a call."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print totals and timings."""
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rows = build_rows(row_count)
+    # Load NumPy before timing, as a long-running process would have
+    FixedPoint(SCALE).calculate_columns([1], "+", [1])
+
+    fixed, fixed_time = timed(fixed_point_total, rows)
+    (calculator, columns), fixed_parse_time = timed(fixed_point_columns, rows)
+    column, column_time = timed(fixed_point_column_total, calculator, columns)
+    decimals, decimal_parse_time = timed(decimal_columns, rows)
+    decimal, decimal_time = timed(decimal_total, decimals)
+    floating, float_time = timed(float_total, rows)
+    assert fixed == column == decimal, (fixed, column, decimal)
+
+    print(f"{row_count:,} rows at scale {SCALE}; parse + arithmetic")
+    print(f"fixed point:   {fixed_time * 1e3:8.1f} ms  total {fixed}")
+    print(
+        f"fixed columns: {fixed_parse_time * 1e3:8.1f} + {column_time * 1e3:6.1f} ms"
+        f"  total {column}"
+    )
+    print(
+        f"Decimal:       {decimal_parse_time * 1e3:8.1f} + {decimal_time * 1e3:6.1f} ms"
+        f"  total {decimal}"
+    )
+    print(f"float:         {float_time * 1e3:8.1f} ms  total {floating}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark evaluating one formula over many rows of variable bindings.
+
+Compares three ways of computing "price * qty - discount" for every row:
+building an expression string per row and evaluating it, binding the row's
+values with Calculator.evaluate(formula, variables), and binding whole
+columns with Calculator.evaluate_columns().
+
+Run with: python -m benchmarks.bench_formula [rows]
+"""
+
+import random
+import sys
+import time
+from array import array
+
+from calculator.calculator import Calculator
+
+FORMULA = "price * qty - discount"
+
+
+def build_columns(row_count: int, seed: int = 0):
+    """Build random price, qty and discount columns."""
+    rng = random.Random(seed)
+    return {
+        "price": array("d", (rng.uniform(0.5, 500) for _ in range(row_count))),
+        "qty": array("q", (rng.randint(1, 100) for _ in range(row_count))),
+        "discount": array("d", (rng.uniform(0, 20) for _ in range(row_count))),
+    }
+
+
+def per_row_strings(calculator: Calculator, columns):
+    """Format and evaluate an expression string for every row."""
+    return [
+        calculator.evaluate(f"{price!r} * {qty} - {discount!r}")
+        for price, qty, discount in zip(
+            columns["price"], columns["qty"], columns["discount"]
+        )
+    ]
+
+
+def per_row_bindings(calculator: Calculator, columns):
+    """Evaluate the compiled formula once per row of bound values."""
+    names = tuple(columns)
+    return [
+        calculator.evaluate(FORMULA, dict(zip(names, values)))
+        for values in zip(*columns.values())
+    ]
+
+
+def timed(function, *args):
+    """Return (result, elapsed seconds) of a call."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the time of each approach."""
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    calculator = Calculator()
+    columns = build_columns(row_count)
+
+    strings, strings_time = timed(per_row_strings, calculator, columns)
+    bindings, bindings_time = timed(per_row_bindings, calculator, columns)
+    (results, _), columns_time = timed(calculator.evaluate_columns, FORMULA, columns)
+    assert bindings == strings
+    assert list(results) == bindings
+
+    print(f"{row_count:,} rows of {FORMULA}")
+    print(f"expression strings: {strings_time * 1e3:9.1f} ms")
+    print(f"row bindings:       {bindings_time * 1e3:9.1f} ms")
+    print(f"column bindings:    {columns_time * 1e3:9.1f} ms")
+    print(f"speedup:            {strings_time / columns_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
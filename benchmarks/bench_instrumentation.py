@@ -0,0 +1,36 @@
+"""
+Benchmark the per-call cost of Calculator instrumentation.
+
+Run with: python -m benchmarks.bench_instrumentation
+"""
+
+import timeit
+
+from calculator.calculator import Calculator
+
+ROWS = [(7, "+", 3), (2.5, "*", 4), (10, "/", 4), (9, "-", 12)] * 250
+
+
+def measure(calculator: Calculator) -> float:
+    """Return the best mean nanoseconds per calculate() call."""
+    calculate = calculator.calculate
+
+    def run():
+        for first, symbol, second in ROWS:
+            calculate(first, symbol, second)
+
+    best = min(timeit.repeat(run, number=100, repeat=5))
+    return best / (100 * len(ROWS)) * 1e9
+
+
+def main() -> None:
+    """Compare calculate() with instrumentation off and on."""
+    plain = measure(Calculator())
+    instrumented = measure(Calculator(instrument=True))
+    print(f"instrumentation off: {plain:8.1f} ns/call")
+    print(f"instrumentation on:  {instrumented:8.1f} ns/call")
+    print(f"overhead:            {instrumented - plain:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
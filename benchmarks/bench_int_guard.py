@@ -0,0 +1,62 @@
+"""
+Benchmark rejecting oversized int products.
+
+Multiplies pairs of ever longer ints whose product overflows, and times the
+rejection by multiply(), which bounds the product's bit length from the
+operands, against computing the product and checking it afterwards, as
+multiply() did before. Rejection time should stay flat as operands grow while
+the compute-then-check time grows faster than linearly. A bounded
+Multiplication(max_bits=64) is timed on the same operands.
+
+Run with: python -m benchmarks.bench_int_guard [max_digits]
+"""
+
+import sys
+import time
+
+from calculator.dispatch import multiply
+from calculator.operations import Multiplication
+from calculator.status import Status
+
+
+def compute_then_check(a: int, b: int) -> bool:
+    """Return whether the product overflows, computing it first."""
+    result = a * b
+    return result.bit_length() > 1023 and abs(result) > 1e308
+
+
+def best_time(function, a: int, b: int, repeat: int = 5) -> float:
+    """Return the best of repeat timings of one call, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(a, b)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a table of timings by operand size."""
+    max_digits = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bounded = Multiplication(max_bits=64).try_execute
+
+    print(
+        f"{'digits':>10}  {'compute+check':>14}  {'multiply':>10}  {'max_bits=64':>12}"
+    )
+    digits = 1_000
+    while digits <= max_digits:
+        operand = 7 * 10 ** (digits - 1) + 1
+        assert multiply(operand, operand)[0] is Status.OVERFLOW
+        assert bounded(operand, operand)[0] is Status.OVERFLOW
+        computed = best_time(compute_then_check, operand, operand)
+        guarded = best_time(multiply, operand, operand)
+        limited = best_time(bounded, operand, operand)
+        print(
+            f"{digits:>10,}  {computed * 1e6:11.1f} us  {guarded * 1e6:7.1f} us"
+            f"  {limited * 1e6:9.1f} us"
+        )
+        digits *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark memory-mapped batch evaluation against text-mode streaming.
+
+Writes temporary expression files of increasing size and evaluates each in a
+fresh process, once by iterating over the file in text mode and once through
+write_mapped(), reporting throughput and the process's peak RSS. Peak RSS of
+the mapped run should not grow with the file size. Requires the resource
+module (Unix).
+
+Run with: python -m benchmarks.bench_mmap [megabytes ...]
+"""
+
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from calculator.batch import (
+    BATCH_BUFFER_SIZE,
+    evaluate_lines,
+    write_mapped,
+    write_records,
+)
+
+FILE_SIZES_MB = (16, 64)
+
+
+def write_input(path: str, megabytes: int, seed: int = 0) -> None:
+    """Write a file of random calculation lines of roughly the given size."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(10_000):
+        first = rng.choice([str(rng.randint(-999, 999)), f"{rng.random():.6f}"])
+        second = rng.choice([str(rng.randint(1, 999)), "0", "2.5e3"])
+        lines.append(f"{first} {rng.choice('+-*/')} {second}\n")
+    block = "".join(lines).encode("utf-8")
+    with open(path, "wb") as handle:
+        for _ in range(megabytes * 1024 * 1024 // len(block) + 1):
+            handle.write(block)
+
+
+def run(mode: str, path: str) -> None:
+    """Evaluate the file to /dev/null and print elapsed seconds and peak RSS."""
+    start = time.perf_counter()
+    with open(os.devnull, "wb") as output:
+        if mode == "mmap":
+            write_mapped(path, output)
+        else:
+            text_output = open(
+                output.fileno(), "w", buffering=BATCH_BUFFER_SIZE, closefd=False
+            )
+            with open(path, encoding="utf-8", buffering=BATCH_BUFFER_SIZE) as lines:
+                write_records(evaluate_lines(lines), text_output)
+            text_output.close()
+    elapsed = time.perf_counter() - start
+    print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def measure(mode: str, path: str):
+    """Run one mode in a fresh interpreter and return (seconds, peak RSS in KiB)."""
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_mmap", "--run", mode, path],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    elapsed, max_rss = result.stdout.split()
+    return float(elapsed), int(max_rss)
+
+
+def main(sizes=FILE_SIZES_MB) -> None:
+    """Run the benchmark over each file size and print a comparison table."""
+    print(f"{'size':>8} {'mode':>6} {'MB/s':>8} {'peak RSS':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for megabytes in sizes:
+            path = os.path.join(directory, f"input-{megabytes}.txt")
+            write_input(path, megabytes)
+            file_mb = os.path.getsize(path) / (1024 * 1024)
+            for mode in ("text", "mmap"):
+                elapsed, max_rss = measure(mode, path)
+                print(
+                    f"{megabytes:>6}MB {mode:>6} {file_mb / elapsed:8.1f} "
+                    f"{max_rss / 1024:8.1f}MB"
+                )
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run(sys.argv[2], sys.argv[3])
+    else:
+        main([int(size) for size in sys.argv[1:]] or FILE_SIZES_MB)
@@ -0,0 +1,116 @@
+"""
+Benchmark constant folding and common-subexpression elimination.
+
+Evaluates formulas with constant pieces and repeated subterms through a
+plain postfix program, which computes every operation of the formula, and
+through the program optimized for the calculator (Calculator.compile), per row
+of bindings and over whole columns.
+
+Run with: python -m benchmarks.bench_optimize [rows]
+"""
+
+import random
+import sys
+import time
+
+from calculator.calculator import Calculator
+from calculator.expression import (
+    APPLY,
+    LOAD,
+    PUSH,
+    BinaryOp,
+    Literal,
+    Program,
+    compile_expression,
+)
+
+FORMULAS = [
+    "(a + b) * (a + b) - (a + b) / 2",
+    "seconds / (3600 * 24) + days * (60 * 60 * 24) / (3600 * 24)",
+]
+
+
+def build_rows(row_count: int, seed: int = 0):
+    """Build random bindings for every variable of the formulas."""
+    rng = random.Random(seed)
+    return [
+        {
+            "a": rng.uniform(-1e3, 1e3),
+            "b": rng.randint(1, 1000),
+            "seconds": rng.randint(0, 10**7),
+            "days": rng.randint(0, 365),
+        }
+        for _ in range(row_count)
+    ]
+
+
+def unoptimized(source: str) -> Program:
+    """Compile an expression without folding or sharing anything."""
+    instructions = []
+
+    def emit(node):
+        if isinstance(node, Literal):
+            instructions.append((PUSH, node.value))
+        elif isinstance(node, BinaryOp):
+            emit(node.left)
+            emit(node.right)
+            instructions.append((APPLY, node.symbol))
+        else:
+            instructions.append((LOAD, node.name))
+
+    tree = compile_expression(source).tree
+    emit(tree)
+    return Program(source, tuple(instructions), tree)
+
+
+def timed(function, *args, repeat: int = 3):
+    """Return (result, best elapsed seconds) of repeated calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def evaluate_rows(program, calculate, rows):
+    """Evaluate a program once per row of bindings."""
+    return [program.evaluate(calculate, row) for row in rows]
+
+
+def main() -> None:
+    """Run the benchmark and print the time of each program."""
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    calculator = Calculator()
+    rows = build_rows(row_count)
+    columns = {name: [row[name] for row in rows] for name in rows[0]}
+    # Load NumPy before timing anything
+    calculator.evaluate_columns("a + b", {"a": [1], "b": [2]})
+
+    for formula in FORMULAS:
+        plain = unoptimized(formula)
+        optimized = calculator.compile(formula)
+        print(formula)
+        print(
+            f"  instructions:      {len(plain.instructions):9d} "
+            f"-> {len(optimized.instructions)}"
+        )
+
+        expected, plain_time = timed(evaluate_rows, plain, calculator.calculate, rows)
+        results, optimized_time = timed(
+            evaluate_rows, optimized, calculator.calculate, rows
+        )
+        assert results == expected
+        print(f"  rows plain:        {plain_time * 1e3:9.1f} ms")
+        print(f"  rows optimized:    {optimized_time * 1e3:9.1f} ms")
+
+        _, plain_time = timed(plain.evaluate_columns, columns, calculator.get_operation)
+        _, optimized_time = timed(
+            optimized.evaluate_columns, columns, calculator.get_operation
+        )
+        print(f"  columns plain:     {plain_time * 1e3:9.1f} ms")
+        print(f"  columns optimized: {optimized_time * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
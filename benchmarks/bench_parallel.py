@@ -0,0 +1,61 @@
+"""
+Benchmark process-pool batch evaluation across worker counts.
+
+Writes a temporary expression file and reports throughput for 1, 2, 4 and 8
+workers. Scaling depends on the number of available CPU cores.
+
+Run with: python -m benchmarks.bench_parallel [lines]
+"""
+
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from calculator.batch import evaluate_lines, write_records, write_records_parallel
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def write_input(path: str, line_count: int, seed: int = 0) -> None:
+    """Write a file of random calculation lines."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as handle:
+        for _ in range(line_count):
+            first = rng.choice([str(rng.randint(-999, 999)), f"{rng.random():.6f}"])
+            second = rng.choice([str(rng.randint(-999, 999)), "0", "2.5e3"])
+            handle.write(f"{first} {rng.choice('+-*/')} {second}\n")
+
+
+def run(path: str, workers: int) -> float:
+    """Evaluate the file with the given worker count and return elapsed seconds."""
+    output = io.StringIO()
+    start = time.perf_counter()
+    with open(path, encoding="utf-8") as lines:
+        if workers == 1:
+            write_records(evaluate_lines(lines), output)
+        else:
+            write_records_parallel(lines, output, workers=workers)
+    return time.perf_counter() - start
+
+
+def main(line_count: int = 500_000) -> None:
+    """Run the benchmark and print throughput for each worker count."""
+    print(f"lines: {line_count}  cpus: {os.cpu_count()}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "input.txt")
+        write_input(path, line_count)
+        baseline = None
+        for workers in WORKER_COUNTS:
+            elapsed = run(path, workers)
+            baseline = baseline or elapsed
+            print(
+                f"workers {workers}: {line_count / elapsed:12,.0f} lines/s  "
+                f"scaling {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
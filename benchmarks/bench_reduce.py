@@ -0,0 +1,60 @@
+"""
+Benchmark Calculator.reduce against chaining calculate() calls.
+
+Sums a stream of floats spanning many orders of magnitude both ways and
+reports the time taken and each result's error relative to math.fsum(), the
+correctly rounded sum. Chained calculate('+') calls round after every
+addition; reduce() carries a compensated total across chunks. The numbers
+are generated before timing, so both timings cover the summation only.
+
+Run with: python -m benchmarks.bench_reduce [count]
+"""
+
+import math
+import random
+import sys
+import time
+
+from calculator.calculator import Calculator
+
+
+def numbers(count: int, seed: int = 0):
+    """Yield floats of mixed sign and magnitude."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.uniform(-1, 1) * 10 ** rng.randint(-8, 8)
+
+
+def chained_sum(calculator: Calculator, values) -> float:
+    """Sum values by feeding each running total back into calculate()."""
+    total = 0
+    for value in values:
+        total = calculator.calculate(total, "+", value)
+    return total
+
+
+def timed(function, *args):
+    """Return (result, seconds) for one call."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print timings and errors."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    calculator = Calculator()
+    values = list(numbers(count))
+    exact = math.fsum(values)
+
+    chained, chained_time = timed(chained_sum, calculator, values)
+    reduced, reduce_time = timed(calculator.reduce, "+", values)
+
+    print(f"{count:,} numbers")
+    print(f"chained calculate: {chained_time:7.3f} s  error {abs(chained - exact):.3e}")
+    print(f"reduce:            {reduce_time:7.3f} s  error {abs(reduced - exact):.3e}")
+    print(f"speedup:           {chained_time / reduce_time:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Loopback load test for the asyncio calculation server.
+
+Starts a server on a free local port and drives it with the pipelining load
+generator, reporting throughput and p50/p99 latency for several pipeline
+depths. No external services are needed.
+
+Run with: python -m benchmarks.bench_server [requests]
+"""
+
+import asyncio
+import random
+import sys
+
+from calculator.server import CalculationServer, run_load
+
+PIPELINE_DEPTHS = (1, 16, 128)
+
+
+def build_requests(count: int, seed: int = 0):
+    """Build a realistic mix of simple, expression and failing requests."""
+    rng = random.Random(seed)
+    templates = ["{a} + {b}", "{a} * {b}", "{a} / {b}", "({a} - {b}) * 2", "{a} / 0"]
+    return [
+        rng.choice(templates).format(a=rng.randint(-999, 999), b=rng.randint(1, 99))
+        for _ in range(count)
+    ]
+
+
+async def benchmark(request_count: int) -> None:
+    """Run the load generator at each pipeline depth."""
+    requests = build_requests(request_count)
+    server = await CalculationServer().start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async with server:
+        for depth in PIPELINE_DEPTHS:
+            report = await run_load(
+                "127.0.0.1", port, requests, connections=4, pipeline_depth=depth
+            )
+            print(
+                f"depth {depth:4d}: {report.throughput:10,.0f} req/s  "
+                f"p50 {report.p50_latency * 1e6:9.1f} us  "
+                f"p99 {report.p99_latency * 1e6:9.1f} us"
+            )
+
+
+def main(request_count: int = 50_000) -> None:
+    """Run the benchmark."""
+    print(f"requests: {request_count}  connections: 4")
+    asyncio.run(benchmark(request_count))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
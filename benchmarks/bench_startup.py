@@ -0,0 +1,64 @@
+"""
+Benchmark cold-start latency of one-shot command-line evaluation.
+
+Times `python main.py "1 + 2"` in fresh interpreter processes and checks the
+median time spent beyond a bare interpreter start against a fixed budget.
+Exits with status 1 when the budget is exceeded.
+
+Run with: python -m benchmarks.bench_startup [--runs N] [--budget MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Sequence
+
+# Milliseconds allowed on top of a bare interpreter start
+STARTUP_BUDGET_MS = 60.0
+RUNS = 20
+
+MAIN = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py"
+)
+
+
+def time_command(command: List[str], runs: int) -> float:
+    """Return the median wall time of a command in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Measure startup and compare it with the budget."""
+    parser = argparse.ArgumentParser(description="One-shot startup benchmark")
+    parser.add_argument("--runs", type=int, default=RUNS, help="runs per command")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=STARTUP_BUDGET_MS,
+        help=f"allowed ms beyond a bare interpreter (default: {STARTUP_BUDGET_MS:g})",
+    )
+    args = parser.parse_args(argv)
+
+    interpreter = time_command([sys.executable, "-c", "pass"], args.runs)
+    one_shot = time_command([sys.executable, MAIN, "1 + 2"], args.runs)
+    overhead = one_shot - interpreter
+
+    print(f"bare interpreter:  {interpreter:7.1f} ms")
+    print(f"main.py '1 + 2':   {one_shot:7.1f} ms")
+    print(f"overhead:          {overhead:7.1f} ms (budget {args.budget:g} ms)")
+    if overhead > args.budget:
+        print("Startup budget exceeded.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Benchmark the exception-free try_* API against the raising API on dirty input.
+
+Run with: python -m benchmarks.bench_try_api [error_fraction]
+"""
+
+import random
+import sys
+import timeit
+from typing import List
+
+from calculator.calculator import Calculator
+from calculator.exceptions import CalculatorError
+from calculator.status import Status
+from calculator.validation import InputValidator
+
+ROWS = 10_000
+BAD_LINES = ["5 +", "abc + 1", "1 / 0", "2 / 0.0", "1e200 * 1e200", "1..2 - 3"]
+
+
+def build_lines(error_fraction: float, seed: int = 0) -> List[str]:
+    """Build a feed where roughly error_fraction of the rows fail."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(ROWS):
+        if rng.random() < error_fraction:
+            lines.append(rng.choice(BAD_LINES))
+        else:
+            a = rng.randint(1, 10**6)
+            b = round(rng.uniform(1, 1000), 3)
+            lines.append(f"{a} {rng.choice('+-*/')} {b}")
+    return lines
+
+
+def main(error_fraction: float = 0.25) -> None:
+    """Time both APIs over the same feed and print per-row costs."""
+    lines = build_lines(error_fraction)
+    calculator = Calculator()
+    validator = InputValidator()
+
+    def raising() -> int:
+        failures = 0
+        for line in lines:
+            try:
+                calculator.calculate(*validator.parse_calculation_input(line))
+            except CalculatorError:
+                failures += 1
+        return failures
+
+    def result_codes() -> int:
+        failures = 0
+        ok = Status.OK
+        for line in lines:
+            status, value = validator.try_parse(line)
+            if status is ok:
+                status, value = calculator.try_calculate(*value)
+            if status is not ok:
+                failures += 1
+        return failures
+
+    assert raising() == result_codes()
+    print(f"rows: {ROWS}  failing: {raising() / ROWS:.0%}")
+    for name, function in (("raising", raising), ("try_*", result_codes)):
+        best = min(timeit.repeat(function, number=5, repeat=5)) / (5 * ROWS)
+        print(f"{name:8s} {best * 1e9:8.1f} ns/row")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.25)
@@ -0,0 +1,259 @@
+"""
+Benchmark runner covering parse, validate, dispatch and CLI throughput.
+
+Each case runs a realistic input mix (integers, floats, scientific notation
+and error-heavy input) through one entry point and reports ops/sec and
+per-call latency percentiles as JSON. A saved report can be used as a baseline
+to flag regressions.
+
+Run with:
+    python -m benchmarks.runner --output baseline.json
+    python -m benchmarks.runner --compare baseline.json --threshold 0.10
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from calculator.calculator import Calculator
+from calculator.cli import CalculatorCLI
+from calculator.exceptions import CalculatorError
+from calculator.validation import InputValidator
+
+SAMPLES = 200
+CALLS_PER_SAMPLE = 50
+
+
+class Case(NamedTuple):
+    """A benchmark case: a function called once per input of a mix."""
+
+    name: str
+    function: Callable
+    inputs: Sequence
+
+
+def _numbers(kind: str, count: int, rng: random.Random) -> List[str]:
+    """Build number strings of one kind."""
+    if kind == "int":
+        return [str(rng.randint(-(10**9), 10**9)) for _ in range(count)]
+    if kind == "float":
+        return [f"{rng.uniform(-1e6, 1e6):.6f}" for _ in range(count)]
+    if kind == "scientific":
+        return [
+            f"{rng.uniform(1, 10):.3f}e{rng.randint(-30, 30)}" for _ in range(count)
+        ]
+    return [
+        rng.choice(["abc", "1.2.3", "--5", "", "1e", "0x1F", "5 5"])
+        for _ in range(count)
+    ]
+
+
+def _expressions(kind: str, count: int, rng: random.Random) -> List[str]:
+    """Build "number operation number" lines whose operands are of one kind."""
+    if kind == "errors":
+        return [
+            rng.choice(["5 +", "abc + 1", "1 / 0", "1e200 * 1e200", "2 ^ 3", ""])
+            for _ in range(count)
+        ]
+    firsts = _numbers(kind, count, rng)
+    seconds = _numbers(kind, count, rng)
+    return [f"{a} {rng.choice('+-*/')} {b}" for a, b in zip(firsts, seconds)]
+
+
+def _operands(kind: str, count: int, rng: random.Random) -> List[tuple]:
+    """Build already-parsed (first, operation, second) triples."""
+    validator = InputValidator()
+    triples = []
+    for line in _expressions(kind, count, rng):
+        try:
+            triples.append(validator.parse_calculation_input(line))
+        except CalculatorError:
+            triples.append((1, "@", 0))
+    return triples
+
+
+def _ignore_errors(function: Callable) -> Callable:
+    """Wrap a function so calculator errors count as completed calls."""
+
+    def call(*args):
+        try:
+            function(*args)
+        except CalculatorError:
+            pass
+
+    return call
+
+
+def build_cases(count: int = 1000, seed: int = 0) -> List[Case]:
+    """Build every benchmark case."""
+    rng = random.Random(seed)
+    calculator = Calculator()
+    cli = CalculatorCLI()
+    kinds = ("int", "float", "scientific", "errors")
+
+    def calculate(triple):
+        calculator.calculate(*triple)
+
+    cases = []
+    for kind in kinds:
+        cases.append(
+            Case(
+                f"validate_number[{kind}]",
+                _ignore_errors(InputValidator.validate_number),
+                _numbers(kind, count, rng),
+            )
+        )
+    for kind in kinds:
+        cases.append(
+            Case(
+                f"parse_calculation_input[{kind}]",
+                _ignore_errors(InputValidator.parse_calculation_input),
+                _expressions(kind, count, rng),
+            )
+        )
+    for kind in kinds:
+        cases.append(
+            Case(
+                f"calculate[{kind}]",
+                _ignore_errors(calculate),
+                _operands(kind, count, rng),
+            )
+        )
+    for kind in kinds:
+        cases.append(
+            Case(
+                f"process_input[{kind}]",
+                cli.process_input,
+                _expressions(kind, count, rng),
+            )
+        )
+    return cases
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Return the value at a fraction (0-1) of an ascending sequence."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run_case(
+    case: Case, samples: int = SAMPLES, calls_per_sample: int = CALLS_PER_SAMPLE
+) -> Dict[str, float]:
+    """
+    Time a case.
+
+    Each sample times calls_per_sample consecutive calls; percentiles are
+    computed over the per-call mean of each sample.
+    """
+    function = case.function
+    inputs = case.inputs
+    per_call: List[float] = []
+    total_ns = 0
+    position = 0
+
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        for _ in range(samples):
+            batch = inputs[position : position + calls_per_sample]
+            if len(batch) < calls_per_sample:
+                position = 0
+                batch = inputs[:calls_per_sample]
+            position += calls_per_sample
+
+            start = time.perf_counter_ns()
+            for item in batch:
+                function(item)
+            elapsed = time.perf_counter_ns() - start
+
+            total_ns += elapsed
+            per_call.append(elapsed / len(batch))
+            sink.seek(0)
+            sink.truncate()
+
+    per_call.sort()
+    return {
+        "ops_per_sec": samples * calls_per_sample / (total_ns / 1e9),
+        "p50_ns": _percentile(per_call, 0.50),
+        "p90_ns": _percentile(per_call, 0.90),
+        "p99_ns": _percentile(per_call, 0.99),
+    }
+
+
+def run(name_filter: Optional[str] = None, samples: int = SAMPLES) -> Dict:
+    """Run every case whose name contains name_filter and build a report."""
+    results = {}
+    for case in build_cases():
+        if name_filter and name_filter not in case.name:
+            continue
+        results[case.name] = run_case(case, samples)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Compare a report against a baseline.
+
+    Returns:
+        Descriptions of cases whose throughput dropped by more than threshold
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        ratio = result["ops_per_sec"] / previous["ops_per_sec"]
+        if ratio < 1 - threshold:
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:,.0f} ops/s vs "
+                f"{previous['ops_per_sec']:,.0f} ops/s baseline ({ratio - 1:+.1%})"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="Calculator benchmark runner")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline JSON report")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="allowed throughput drop before flagging a regression (default: 0.10)",
+    )
+    parser.add_argument("--filter", help="only run cases whose name contains this")
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="samples per case")
+    args = parser.parse_args(argv)
+
+    report = run(args.filter, args.samples)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against baseline.", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,59 @@
 """
 Calculator package initialization.
+
+Public names are imported from their submodules on first access, so importing
+the package (or a single submodule) does not load the rest of it.
 """
 
-from .calculator import Calculator
-from .exceptions import (
-    CalculatorError,
-    DivisionByZeroError,
-    InvalidInputError,
-    InvalidOperationError,
-    OverflowError,
-)
-from .operations import Addition, Division, Multiplication, Operation, Subtraction
-from .validation import InputValidator
-
-__all__ = [
-    "Calculator",
-    "CalculatorError",
-    "DivisionByZeroError",
-    "InvalidInputError",
-    "InvalidOperationError",
-    "OverflowError",
-    "Operation",
-    "Addition",
-    "Subtraction",
-    "Multiplication",
-    "Division",
-    "InputValidator",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .calculator import Calculator
+    from .exceptions import (
+        CalculatorError,
+        DivisionByZeroError,
+        InvalidInputError,
+        InvalidOperationError,
+        OverflowError,
+    )
+    from .fixed_point import FixedPoint
+    from .operations import Addition, Division, Multiplication, Operation, Subtraction
+    from .registry import OperationRegistry, register_operation
+    from .validation import CachingInputValidator, InputValidator
+
+_EXPORTS = {
+    "Calculator": ".calculator",
+    "CalculatorError": ".exceptions",
+    "DivisionByZeroError": ".exceptions",
+    "InvalidInputError": ".exceptions",
+    "InvalidOperationError": ".exceptions",
+    "OverflowError": ".exceptions",
+    "FixedPoint": ".fixed_point",
+    "Operation": ".operations",
+    "Addition": ".operations",
+    "Subtraction": ".operations",
+    "Multiplication": ".operations",
+    "Division": ".operations",
+    "OperationRegistry": ".registry",
+    "register_operation": ".registry",
+    "InputValidator": ".validation",
+    "CachingInputValidator": ".validation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including names not yet imported."""
+    return sorted(set(globals()) | set(__all__))
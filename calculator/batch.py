@@ -0,0 +1,475 @@
+"""
+Non-interactive batch evaluation of calculation streams.
+
+Expressions are read lazily from any iterable of lines, evaluated one at a
+time and written through the caller's (buffered) output stream, so memory use
+stays constant regardless of input size. Every input line produces exactly
+one output line.
+
+Large inputs can also be split into line-count chunks and evaluated in a
+process pool; chunk results are written back in input order with a bounded
+number of chunks in flight.
+
+Files can instead be memory-mapped: lines are found and simple calculations
+parsed over the mapped bytes, results go through a fixed-size output buffer,
+and pages already evaluated are released as the scan moves on, so neither
+reading nor writing copies more than one line at a time.
+"""
+
+import csv
+import io
+import json
+import mmap
+from collections import deque
+from itertools import islice
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from . import validation
+from .calculator import Calculator
+from .expression import evaluate_input
+from .metrics import OperationMetrics, timed
+from .operations import Number
+from .settings import BATCH_BUFFER_SIZE, OUTPUT_FORMATS
+from .validation import InputValidator, set_input_limits
+
+PARALLEL_CHUNK_SIZE = 10_000
+# Bytes of a mapped file evaluated between releases of its pages
+MAPPED_RELEASE_SIZE = 4 * 1024 * 1024
+
+# None where madvise() is unavailable; pages are then left to the OS
+_MADV_DONTNEED = getattr(mmap, "MADV_DONTNEED", None)
+
+Record = Tuple[str, Optional[Number], Optional[Exception]]
+
+
+def evaluate_lines(
+    lines: Iterable[str],
+    calculator: Optional[Calculator] = None,
+    validator: Optional[InputValidator] = None,
+) -> Iterator[Record]:
+    """
+    Evaluate calculation lines lazily.
+
+    Args:
+        lines: Iterable of raw input lines (trailing newlines are ignored)
+        calculator: Calculator used for evaluation
+        validator: Validator used to parse each line
+
+    Yields:
+        Tuples of (expression, result, error); exactly one of result and
+        error is None. Any exception evaluating a line, not only a
+        CalculatorError, is reported as that line's error, so one line
+        cannot end the batch.
+    """
+    calculator = calculator or Calculator()
+    validator = validator or InputValidator()
+
+    for line in lines:
+        expression = line.strip()
+        try:
+            yield expression, evaluate_input(calculator, validator, expression), None
+        except Exception as e:
+            yield expression, None, e
+
+
+def write_records(
+    records: Iterable[Record], output: TextIO, output_format: str = "plain"
+) -> int:
+    """
+    Write evaluated records to an output stream, one line per record.
+
+    Formats:
+        plain: the result, or "<ErrorClass>: <message>"
+        csv: expression,result,error,message
+        ndjson: {"expression", "result", "error", "message"} objects
+
+    Args:
+        records: Records produced by evaluate_lines()
+        output: Text stream to write to
+        output_format: One of OUTPUT_FORMATS
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ValueError: If the output format is unknown
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format '{output_format}'. "
+            f"Valid formats: {', '.join(OUTPUT_FORMATS)}"
+        )
+
+    count = 0
+
+    def counted(rows):
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    if output_format == "csv":
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerows(counted(_csv_row(record) for record in records))
+    elif output_format == "ndjson":
+        output.writelines(counted(_ndjson_line(record) for record in records))
+    else:
+        output.writelines(counted(_plain_line(record) for record in records))
+
+    return count
+
+
+def write_records_parallel(
+    lines: Iterable[str],
+    output: TextIO,
+    output_format: str = "plain",
+    workers: int = 2,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+    calculator: Optional[Calculator] = None,
+    parse_metrics: Optional[OperationMetrics] = None,
+) -> int:
+    """
+    Evaluate lines in a process pool and write results in input order.
+
+    The input is split into chunks of chunk_size lines. At most two chunks per
+    worker are in flight at any time, which bounds the memory used to hold
+    results waiting for earlier chunks to finish.
+
+    Workers evaluate with their own calculator. Given parse_metrics, they are
+    instrumented, and the metrics of every chunk are merged into
+    parse_metrics and into the stats of calculator.
+
+    Args:
+        lines: Iterable of raw input lines
+        output: Text stream to write to
+        output_format: One of OUTPUT_FORMATS
+        workers: Number of worker processes
+        chunk_size: Number of lines per chunk
+        calculator: Instrumented calculator receiving the workers' calculation
+            metrics
+        parse_metrics: Metrics receiving the workers' parse metrics; None
+            leaves the workers uninstrumented
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ValueError: If the output format, worker count or chunk size is invalid
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format '{output_format}'. "
+            f"Valid formats: {', '.join(OUTPUT_FORMATS)}"
+        )
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Worker count and chunk size must be at least 1")
+
+    # Imported here: the process pool machinery dominates this module's
+    # import time and only parallel runs need it.
+    from concurrent.futures import ProcessPoolExecutor
+
+    count = 0
+    max_in_flight = workers * 2
+    iterator = iter(lines)
+    instrument = parse_metrics is not None
+
+    # Workers need not inherit the module state that holds the input limits
+    limits = (validation.MAX_LINE_LENGTH, validation.MAX_NUMBER_DIGITS)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=set_input_limits, initargs=limits
+    ) as executor:
+        in_flight: deque = deque()
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if chunk:
+                in_flight.append(
+                    executor.submit(_evaluate_chunk, chunk, output_format, instrument)
+                )
+            if in_flight and (len(in_flight) >= max_in_flight or not chunk):
+                chunk_count, text, stats = in_flight.popleft().result()
+                output.write(text)
+                count += chunk_count
+                if stats is not None:
+                    calculation_stats, parse_stats = stats
+                    if calculator is not None:
+                        calculator.merge_stats(calculation_stats)
+                    parse_metrics.merge(parse_stats)
+            elif not chunk:
+                break
+
+    return count
+
+
+def write_mapped(
+    path: str,
+    output: BinaryIO,
+    output_format: str = "plain",
+    calculator: Optional[Calculator] = None,
+    validator: Optional[InputValidator] = None,
+    buffer_size: int = BATCH_BUFFER_SIZE,
+    release_size: int = MAPPED_RELEASE_SIZE,
+) -> int:
+    """
+    Evaluate a memory-mapped file, writing UTF-8 output through a fixed buffer.
+
+    Produces the same output as write_records(evaluate_lines(...)) over the
+    file opened in text mode, including universal newline handling. Simple
+    ASCII "number operation number" lines are found and parsed straight from
+    the mapped bytes by InputValidator.scan_bytes(); other lines are decoded
+    one at a time and evaluated as usual. Memory use does not grow with the
+    file size.
+
+    Args:
+        path: File to evaluate
+        output: Binary stream to write to
+        output_format: One of OUTPUT_FORMATS
+        calculator: Calculator used for evaluation
+        validator: Validator used for lines that are not parsed from bytes
+        buffer_size: Size of the output buffer in bytes
+        release_size: Bytes evaluated between releases of mapped pages
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ValueError: If the output format is unknown
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format '{output_format}'. "
+            f"Valid formats: {', '.join(OUTPUT_FORMATS)}"
+        )
+
+    calculator = calculator or Calculator()
+    validator = validator or InputValidator()
+
+    with open(path, "rb") as file:
+        if not file.seek(0, io.SEEK_END):
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _MADV_DONTNEED is not None:
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            mapped = _MappedLines(
+                data,
+                _OutputBuffer(output, buffer_size),
+                output_format,
+                calculator,
+                validator,
+                release_size,
+            )
+            return mapped.evaluate()
+
+
+class _MappedLines:
+    """Evaluation of one mapped file; see write_mapped()."""
+
+    def __init__(
+        self,
+        data: mmap.mmap,
+        output: "_OutputBuffer",
+        output_format: str,
+        calculator: Calculator,
+        validator: InputValidator,
+        release_size: int,
+    ):
+        self._data = data
+        self._output = output
+        self._plain = output_format == "plain"
+        self._format_record = _RECORD_FORMATTERS[output_format]
+        self._calculator = calculator
+        self._validator = validator
+        self._release_size = release_size
+        self._released = 0
+
+    def evaluate(self) -> int:
+        """Evaluate every line and return the number of records written."""
+        data = self._data
+        write = self._output.write
+        calculate = self._calculator.calculate
+        plain = self._plain
+        format_record = self._format_record
+
+        release_size = self._release_size
+
+        # Lines the validator parses from bytes are evaluated here; the lines
+        # between them go through the str parser one at a time
+        count = position = 0
+        for start, end, parsed in self._validator.scan_bytes(data):
+            if start > position:
+                count += self._evaluate_decoded(position, start)
+            if parsed is None:
+                count += self._evaluate_decoded(start, end)
+            else:
+                try:
+                    result = calculate(*parsed)
+                except Exception as e:
+                    if plain:
+                        write(f"{type(e).__name__}: {e}\n".encode("utf-8"))
+                    else:
+                        expression = data[start:end].strip().decode("ascii")
+                        write(format_record((expression, None, e)).encode("utf-8"))
+                else:
+                    if plain:
+                        # repr() and str() agree for int and float results
+                        write(b"%r\n" % (result,))
+                    else:
+                        expression = data[start:end].strip().decode("ascii")
+                        write(format_record((expression, result, None)).encode("utf-8"))
+                count += 1
+
+            position = end + 1
+            if position - self._released >= release_size:
+                self._release(position)
+
+        if position < len(data):
+            count += self._evaluate_decoded(position, len(data))
+        self._output.flush()
+        return count
+
+    def _evaluate_decoded(self, start: int, end: int) -> int:
+        """Decode and evaluate the lines between two offsets one at a time."""
+        data = self._data
+        count = 0
+        while start < end:
+            newline = data.find(b"\n", start, end)
+            line_end = end if newline == -1 else newline
+            text = data[start:line_end].decode("utf-8")
+            # A CR before the LF ends the line with it; any other CR is a line
+            # break of its own, as in text mode
+            if text.endswith("\r"):
+                text = text[:-1]
+            for record in evaluate_lines(
+                text.split("\r"), self._calculator, self._validator
+            ):
+                self._output.write(self._format_record(record).encode("utf-8"))
+                count += 1
+
+            start = line_end + 1
+            if start - self._released >= self._release_size:
+                self._release(start)
+        return count
+
+    def _release(self, position: int) -> None:
+        """Drop the pages before position from the resident set."""
+        end = position - position % mmap.PAGESIZE
+        if _MADV_DONTNEED is not None and end > self._released:
+            self._data.madvise(_MADV_DONTNEED, self._released, end - self._released)
+        self._released = end
+
+
+class _OutputBuffer:
+    """Preallocated byte buffer written to a binary stream whenever it fills."""
+
+    def __init__(self, output: BinaryIO, size: int):
+        self._output = output
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._size = size
+        self._length = 0
+
+    def write(self, data: bytes) -> None:
+        """Append data, flushing the buffer first if it does not fit."""
+        start = self._length
+        end = start + len(data)
+        if end > self._size:
+            self.flush()
+            if len(data) > self._size:
+                self._output.write(data)
+                return
+            start, end = 0, len(data)
+        self._buffer[start:end] = data
+        self._length = end
+
+    def flush(self) -> None:
+        """Write the buffered bytes to the stream."""
+        if self._length:
+            self._output.write(self._view[: self._length])
+            self._length = 0
+
+
+def _evaluate_chunk(
+    lines: List[str], output_format: str, instrument: bool = False
+) -> Tuple[int, str, Optional[Tuple[Dict, Dict]]]:
+    """
+    Evaluate one chunk in a worker process.
+
+    Returns:
+        The record count, the formatted output and, if instrumented, the
+        calculation and parse metrics snapshots
+    """
+    calculator = Calculator(instrument=instrument)
+    validator = InputValidator()
+    parse_metrics = None
+    if instrument:
+        parse_metrics = OperationMetrics()
+        validator.parse_input = timed(validator.parse_input, parse_metrics, "parse")
+    output = io.StringIO()
+    count = write_records(
+        evaluate_lines(lines, calculator, validator), output, output_format
+    )
+    stats = None
+    if parse_metrics is not None:
+        stats = (calculator.stats(), parse_metrics.snapshot())
+    return count, output.getvalue(), stats
+
+
+def _plain_line(record: Record) -> str:
+    """Format a record as a plain text line."""
+    _, result, error = record
+    if error is not None:
+        return f"{type(error).__name__}: {error}\n"
+    return f"{result}\n"
+
+
+class _ReturnWritten:
+    """File-like object whose write() returns its argument unchanged."""
+
+    @staticmethod
+    def write(text: str) -> str:
+        return text
+
+
+# csv writers return what the underlying write() returns, so this formats a
+# single row as a CSV line
+_format_csv_line = csv.writer(_ReturnWritten(), lineterminator="\n").writerow
+
+
+def _csv_line(record: Record) -> str:
+    """Format a record as a CSV line."""
+    return _format_csv_line(_csv_row(record))
+
+
+def _csv_row(record: Record) -> Tuple[str, str, str, str]:
+    """Format a record as a CSV row."""
+    expression, result, error = record
+    if error is not None:
+        return expression, "", type(error).__name__, str(error)
+    return expression, str(result), "", ""
+
+
+def _ndjson_line(record: Record) -> str:
+    """Format a record as a JSON object on a single line."""
+    expression, result, error = record
+    return (
+        json.dumps(
+            {
+                "expression": expression,
+                "result": result,
+                "error": type(error).__name__ if error is not None else None,
+                "message": str(error) if error is not None else None,
+            }
+        )
+        + "\n"
+    )
+
+
+_RECORD_FORMATTERS = {"plain": _plain_line, "csv": _csv_line, "ndjson": _ndjson_line}
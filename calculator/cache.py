@@ -0,0 +1,91 @@
+"""
+Bounded least-recently-used cache with hit statistics.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Snapshot of cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 when there were none)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """Mapping of bounded size that evicts the least recently used entry."""
+
+    _MISSING = object()
+
+    def __init__(self, max_size: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries held at once
+
+        Raises:
+            ValueError: If max_size is not positive
+        """
+        if max_size < 1:
+            raise ValueError(f"Cache size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key, marking it as recently used.
+
+        Args:
+            key: Key to look up
+            default: Value returned when the key is not cached
+
+        Returns:
+            Cached value, or default on a miss
+        """
+        value = self._entries.get(key, self._MISSING)
+        if value is self._MISSING:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return a snapshot of the cache statistics."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, len(self._entries), self.max_size
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
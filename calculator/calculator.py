@@ -2,33 +2,127 @@
 Main Calculator class that manages operations and performs calculations.
 """
 
-from typing import Dict
-
-from .exceptions import InvalidOperationError
-from .operations import (
-    Addition,
-    Division,
-    Multiplication,
-    Number,
-    Operation,
-    Subtraction,
+import time
+from functools import partial
+from itertools import chain, islice
+from math import fsum, prod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
 )
 
+from .cache import CacheInfo, LRUCache
+from .exceptions import (
+    CalculatorError,
+    InvalidInputError,
+    InvalidOperationError,
+    OverflowError,
+)
+from .expression import EXPRESSION_CACHE_SIZE, Program, compile_expression
+from .operations import Number, Operation
+from .registry import OperationRegistry, default_registry
+from .status import INVALID_OPERATION, OK, Outcome
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import OperationMetrics
+
+# Operations whose operands can be swapped without changing the result
+_COMMUTATIVE_OPERATIONS = frozenset({"+", "*"})
+# Operations Calculator.reduce() can fold a stream of numbers with
+_REDUCIBLE_OPERATIONS = ("+", "*")
+
+REDUCE_CHUNK_SIZE = 4096
+# Rows calculate_many() computes per map() call
+CALCULATE_MANY_CHUNK_SIZE = 1024
+
+_INFINITY = float("inf")
+
+
+def _apply(
+    function: Callable[[Number, Number], Number], first: Number, second: Number
+) -> Number:
+    """Call a function on two operands, for map() over rows of mixed symbols."""
+    return function(first, second)
+
 
 class Calculator:
     """Main calculator class implementing the facade pattern."""
 
-    def __init__(self):
-        """Initialize calculator with available operations."""
-        self._operations: Dict[str, Operation] = {}
-        self._register_operations()
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        instrument: bool = False,
+        registry: Optional[OperationRegistry] = None,
+    ):
+        """
+        Initialize calculator with available operations.
 
-    def _register_operations(self) -> None:
-        """Register all available operations with their symbols."""
-        operations = [Addition(), Subtraction(), Multiplication(), Division()]
+        Args:
+            cache_size: Maximum number of results kept in an LRU result cache;
+                None disables caching
+            instrument: Record per-operation call counts, error counts and
+                latency histograms, readable through stats()
+            registry: Operations to offer; defaults to the shared registry of
+                built-in, entry point and register_operation() operations
+        """
+        self._operations: OperationRegistry = (
+            registry if registry is not None else default_registry
+        )
+        # Symbol-to-function table filled as operations are first used. It
+        # holds each operation's try_execute, which for the built-in
+        # operations are the plain functions of calculator.dispatch, so a
+        # calculation is one dict lookup and one function call.
+        self._dispatch: Dict[str, Callable[[Number, Number], Outcome]] = {}
+        # The operations' raising execute, which calculate() calls straight
+        # into. It stays empty when results must go through try_calculate()
+        # for caching or metrics.
+        self._direct: Dict[str, Callable[[Number, Number], Number]] = {}
+        self._cache: Optional[LRUCache] = (
+            LRUCache(cache_size) if cache_size is not None else None
+        )
+        # Programs compiled with this calculator's operations, by source string
+        self._programs = LRUCache(EXPRESSION_CACHE_SIZE)
+        self._metrics: Optional["OperationMetrics"] = None
+        if instrument:
+            # Imported here so that uninstrumented calculators do not load it
+            from . import metrics
 
-        for operation in operations:
-            self._operations[operation.get_symbol()] = operation
+            self._metrics = metrics.OperationMetrics()
+            # Swapping the bound method keeps uninstrumented calls free of
+            # any instrumentation checks; calculate() goes through it too.
+            self.try_calculate = self._instrumented_try_calculate
+
+    def _resolve(
+        self, operation_symbol: str
+    ) -> Optional[Callable[[Number, Number], Outcome]]:
+        """
+        Add an operation to the dispatch table, loading it on first use.
+
+        Returns:
+            The operation's try_execute, or None if the symbol is not supported
+        """
+        if not self.is_valid_operation(operation_symbol):
+            return None
+        operation = self._operations[operation_symbol]
+        execute = self._dispatch[operation_symbol] = operation.try_execute
+        if self._cache is None and self._metrics is None:
+            self._direct[operation_symbol] = operation.execute
+        return execute
+
+    def _invalid_operation_message(self, operation_symbol: str) -> str:
+        """Build the error message for an unsupported operation symbol."""
+        valid_ops = ", ".join(self._operations)
+        return f"Invalid operation '{operation_symbol}'. Valid operations: {valid_ops}"
 
     def calculate(
         self, first_number: Number, operation_symbol: str, second_number: Number
@@ -49,14 +143,396 @@ class Calculator:
             DivisionByZeroError: If attempting to divide by zero
             OverflowError: If calculation results in overflow
         """
-        if not self.is_valid_operation(operation_symbol):
-            valid_ops = ", ".join(self._operations.keys())
+        execute = self._direct.get(operation_symbol)
+        if execute is not None:
+            return execute(first_number, second_number)
+        status, value = self.try_calculate(
+            first_number, operation_symbol, second_number
+        )
+        if status is OK:
+            return value
+        raise status.exception(value)
+
+    def try_calculate(
+        self, first_number: Number, operation_symbol: str, second_number: Number
+    ) -> Outcome:
+        """
+        Perform a calculation without raising for calculation errors.
+
+        Args:
+            first_number: First operand
+            operation_symbol: Symbol representing the operation (+, -, *, /)
+            second_number: Second operand
+
+        Returns:
+            (Status.OK, result), or the error status and message, e.g.
+            (Status.DIVISION_BY_ZERO, "Division by zero is not allowed")
+        """
+        execute = self._dispatch.get(operation_symbol)
+        if execute is None:
+            execute = self._resolve(operation_symbol)
+            if execute is None:
+                return INVALID_OPERATION, self._invalid_operation_message(
+                    operation_symbol
+                )
+
+        if self._cache is None or not (first_number and second_number):
+            # Zero operands bypass the cache: 0.0 and -0.0 compare equal as keys
+            # but can produce results of different sign.
+            return execute(first_number, second_number)
+
+        key = self._cache_key(first_number, operation_symbol, second_number)
+        result = self._cache.get(key)
+        if result is not None:
+            return OK, result
+
+        outcome = execute(first_number, second_number)
+        if outcome[0] is OK:
+            self._cache.put(key, outcome[1])
+        return outcome
+
+    def _instrumented_try_calculate(
+        self, first_number: Number, operation_symbol: str, second_number: Number
+    ) -> Outcome:
+        """
+        try_calculate() wrapped with call, error and latency recording.
+
+        Exceptions of operations that have no error status propagate without
+        being recorded.
+        """
+        start = time.perf_counter()
+        status, value = Calculator.try_calculate(
+            self, first_number, operation_symbol, second_number
+        )
+        elapsed = time.perf_counter() - start
+        # try_calculate() has put every valid symbol in the dispatch table;
+        # unknown symbols share one label to keep the label set bounded
+        self._metrics.record(
+            operation_symbol if operation_symbol in self._dispatch else "invalid",
+            elapsed,
+            None if status is OK else status.value,
+        )
+        return status, value
+
+    def stats(self) -> Optional[Dict[str, Dict]]:
+        """
+        Get a snapshot of the instrumentation metrics.
+
+        Returns:
+            Mapping of operation symbol to call count, error counts by
+            exception class, latency sum and latency histogram (see
+            OperationMetrics.snapshot), or None if instrumentation is disabled
+        """
+        return self._metrics.snapshot() if self._metrics is not None else None
+
+    def merge_stats(self, stats: Dict[str, Dict]) -> None:
+        """
+        Add instrumentation metrics recorded elsewhere, e.g. in a worker process.
+
+        Args:
+            stats: Result of another calculator's stats(); dropped if this
+                calculator is not instrumented
+        """
+        if self._metrics is not None:
+            self._metrics.merge(stats)
+
+    def reset_stats(self) -> None:
+        """Discard all recorded instrumentation metrics."""
+        if self._metrics is not None:
+            self._metrics.reset()
+
+    @staticmethod
+    def _cache_key(
+        first_number: Number, operation_symbol: str, second_number: Number
+    ) -> Tuple:
+        """
+        Build a result cache key.
+
+        Operand types are part of the key so that 1 and 1.0 never share an
+        entry. Operands of commutative operations are ordered so that a+b and
+        b+a map to the same entry.
+        """
+        if operation_symbol in _COMMUTATIVE_OPERATIONS and second_number < first_number:
+            first_number, second_number = second_number, first_number
+        return (
+            operation_symbol,
+            first_number.__class__,
+            first_number,
+            second_number.__class__,
+            second_number,
+        )
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """
+        Get result cache statistics.
+
+        Returns:
+            Hits, misses, evictions and size, or None if caching is disabled
+        """
+        return self._cache.info() if self._cache is not None else None
+
+    def clear_cache(self) -> None:
+        """Remove all cached results and reset the cache statistics."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def evaluate(
+        self, expression: str, variables: Optional[Mapping[str, Number]] = None
+    ) -> Number:
+        """
+        Evaluate an expression with precedence and parentheses.
+
+        Expressions are compiled with compile(), so repeated expressions are
+        evaluated without being parsed or optimized again.
+
+        Args:
+            expression: Expression such as "(1 + 2) * 3" or "price * qty"
+            variables: Value of each variable the expression names
+
+        Returns:
+            Result of the expression
+
+        Raises:
+            InvalidInputError: If the expression is malformed or a variable
+                has no value
+            DivisionByZeroError: If attempting to divide by zero
+            OverflowError: If calculation results in overflow
+        """
+        return self.compile(expression).evaluate(self.calculate, variables)
+
+    def evaluate_columns(
+        self, formula: str, columns: Mapping[str, Sequence[Number]]
+    ) -> Tuple[Any, List[Optional[str]]]:
+        """
+        Evaluate a formula over whole columns of variable values.
+
+        The formula is compiled once with compile(); each of its operations
+        then runs once over the whole column through the operation's
+        execute_array(), so failures are reported per row instead of raising.
+
+        Args:
+            formula: Expression naming variables, such as "price * qty - discount"
+            columns: Column of values for each variable
+
+        Returns:
+            Tuple of (results, error_codes). Failed rows hold NaN and the
+            class name of their first error; see Program.evaluate_columns()
+
+        Raises:
+            InvalidInputError: If the formula is malformed, a variable has no
+                column or the columns differ in length
+            InvalidOperationError: If the formula uses an unavailable operation
+        """
+        return self.compile(formula).evaluate_columns(columns, self.get_operation)
+
+    def compile(self, expression: str) -> Program:
+        """
+        Compile an expression into an optimized program for this calculator.
+
+        Operations on constants, such as "3600 * 24", are folded with this
+        calculator's operations; an operation that fails is left in place so
+        that evaluating the program still raises its error. Repeated
+        subexpressions are computed once. Programs are cached by source string.
+
+        Args:
+            expression: Expression such as "(a + b) * (a + b) / 2"
+
+        Returns:
+            The compiled program
+
+        Raises:
+            InvalidInputError: If the expression is malformed
+        """
+        program = self._programs.get(expression)
+        if program is None:
+            # Folding bypasses instrumentation: a failed fold is recorded when
+            # the program raises its error, and a folded constant is not a
+            # calculation the program performs
+            program = compile_expression(expression).optimize(
+                partial(Calculator.try_calculate, self)
+            )
+            self._programs.put(expression, program)
+        return program
+
+    def calculate_many(
+        self,
+        first_numbers: Sequence[Number],
+        operation_symbols: Union[str, Sequence[str]],
+        second_numbers: Sequence[Number],
+    ) -> Tuple[List[Optional[Number]], List[Optional[str]]]:
+        """
+        Perform a batch of calculations over parallel operand sequences.
+
+        Each distinct operation symbol is validated and resolved once for the
+        whole batch instead of once per row, and rows are computed by map() in
+        chunks. Rows go through the result cache and instrumentation like
+        calculate() calls when the calculator has them. Errors do not abort
+        the batch; they are reported per row as the name of the exception
+        class.
+
+        Args:
+            first_numbers: First operands
+            operation_symbols: One symbol per row, or a single symbol for all rows
+            second_numbers: Second operands
+
+        Returns:
+            Tuple of (results, error_codes). For failed rows the result is None
+            and the error code is the exception class name (e.g.
+            "DivisionByZeroError"); for successful rows the error code is None.
+
+        Raises:
+            InvalidInputError: If the input sequences differ in length
+        """
+        row_count = len(first_numbers)
+        if isinstance(operation_symbols, str):
+            operation_symbols = [operation_symbols] * row_count
+
+        if len(operation_symbols) != row_count or len(second_numbers) != row_count:
+            raise InvalidInputError(
+                "Batch inputs must have the same length: "
+                f"{row_count}, {len(operation_symbols)}, {len(second_numbers)}"
+            )
+
+        executors = {
+            symbol: self._row_executor(symbol) for symbol in set(operation_symbols)
+        }
+        results: List[Optional[Number]] = []
+        error_codes: List[Optional[str]] = [None] * row_count
+        # Without a cache or metrics, a chunk with a failing row can be
+        # computed again row by row to find it, as that leaves no trace
+        repeatable = self._cache is None and self._metrics is None
+        firsts, symbols, seconds = (
+            iter(first_numbers),
+            iter(operation_symbols),
+            iter(second_numbers),
+        )
+        for start in range(0, row_count, CALCULATE_MANY_CHUNK_SIZE):
+            first_chunk = list(islice(firsts, CALCULATE_MANY_CHUNK_SIZE))
+            second_chunk = list(islice(seconds, CALCULATE_MANY_CHUNK_SIZE))
+            execute_chunk = list(
+                map(executors.__getitem__, islice(symbols, CALCULATE_MANY_CHUNK_SIZE))
+            )
+            if repeatable:
+                try:
+                    if len(executors) == 1:
+                        results += map(execute_chunk[0], first_chunk, second_chunk)
+                    else:
+                        results += map(_apply, execute_chunk, first_chunk, second_chunk)
+                except CalculatorError:
+                    # extend() kept the results before the failing row
+                    del results[start:]
+                else:
+                    continue
+            for index, (execute, first, second) in enumerate(
+                zip(execute_chunk, first_chunk, second_chunk), start
+            ):
+                try:
+                    results.append(execute(first, second))
+                except CalculatorError as e:
+                    results.append(None)
+                    error_codes[index] = type(e).__name__
+
+        return results, error_codes
+
+    def _row_executor(
+        self, operation_symbol: str
+    ) -> Callable[[Number, Number], Number]:
+        """
+        Return the function calculate_many() computes rows of a symbol with.
+
+        It is the operation's execute where calculate() calls that directly.
+        Otherwise it goes through calculate(), so that rows are cached and
+        recorded like single calculations, and rows of unsupported symbols
+        raise InvalidOperationError.
+        """
+        execute = self._direct.get(operation_symbol)
+        if execute is None and self._resolve(operation_symbol) is not None:
+            execute = self._direct.get(operation_symbol)
+        if execute is not None:
+            return execute
+
+        calculate = self.calculate
+
+        def calculate_row(first_number: Number, second_number: Number) -> Number:
+            """Calculate one row through calculate()."""
+            return calculate(first_number, operation_symbol, second_number)
+
+        return calculate_row
+
+    def reduce(
+        self,
+        operation_symbol: str,
+        numbers: Iterable[Number],
+        chunk_size: int = REDUCE_CHUNK_SIZE,
+    ) -> Number:
+        """
+        Combine a stream of numbers with addition or multiplication.
+
+        The numbers are consumed in chunks of chunk_size, so generators of any
+        length are reduced in constant memory. Sums of ints are exact; sums
+        involving floats are computed with math.fsum and carry their rounding
+        error from chunk to chunk, so the result is as accurate as a single
+        fsum() over all the numbers. Overflow is checked once per chunk: a
+        running result that exceeds the limit inside a chunk and returns below
+        it by the chunk's end is not reported.
+
+        Args:
+            operation_symbol: "+" or "*"
+            numbers: Numbers to combine
+            chunk_size: Number of values consumed at a time
+
+        Returns:
+            The sum or product; 0 or 1 for no numbers. An int if every number
+            is an int.
+
+        Raises:
+            InvalidOperationError: If the operation is not "+" or "*"
+            OverflowError: If the running result exceeds the overflow limit
+            ValueError: If chunk_size is less than 1
+        """
+        if operation_symbol not in _REDUCIBLE_OPERATIONS:
             raise InvalidOperationError(
-                f"Invalid operation '{operation_symbol}'. Valid operations: {valid_ops}"
+                f"Cannot reduce with '{operation_symbol}'. "
+                f"Reducible operations: {', '.join(_REDUCIBLE_OPERATIONS)}"
             )
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
 
-        operation = self._operations[operation_symbol]
-        return operation.execute(first_number, second_number)
+        chunks = _chunked(numbers, chunk_size)
+        if operation_symbol == "+":
+            return _sum_chunks(chunks)[0]
+        return _multiply_chunks(chunks)
+
+    def product(
+        self, numbers: Iterable[Number], chunk_size: int = REDUCE_CHUNK_SIZE
+    ) -> Number:
+        """
+        Multiply a stream of numbers; see reduce().
+
+        Raises:
+            OverflowError: If the running product exceeds the overflow limit
+        """
+        return self.reduce("*", numbers, chunk_size)
+
+    def mean(
+        self, numbers: Iterable[Number], chunk_size: int = REDUCE_CHUNK_SIZE
+    ) -> float:
+        """
+        Compute the arithmetic mean of a stream of numbers in constant memory.
+
+        The sum is computed as by reduce("+"), then divided by the count.
+
+        Raises:
+            InvalidInputError: If there are no numbers
+            OverflowError: If the running sum exceeds the overflow limit
+            ValueError: If chunk_size is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        total, count = _sum_chunks(_chunked(numbers, chunk_size))
+        if not count:
+            raise InvalidInputError("Cannot take the mean of no numbers")
+        return total / count
 
     def is_valid_operation(self, operation_symbol: str) -> bool:
         """
@@ -70,6 +546,25 @@ class Calculator:
         """
         return operation_symbol in self._operations
 
+    def get_operation(self, operation_symbol: str) -> Operation:
+        """
+        Get the operation object for a symbol, e.g. to call execute_array().
+
+        Args:
+            operation_symbol: Symbol of the operation
+
+        Returns:
+            The operation registered for the symbol
+
+        Raises:
+            InvalidOperationError: If operation symbol is not supported
+        """
+        if not self.is_valid_operation(operation_symbol):
+            raise InvalidOperationError(
+                self._invalid_operation_message(operation_symbol)
+            )
+        return self._operations[operation_symbol]
+
     def get_available_operations(self) -> Dict[str, str]:
         """
         Get all available operations with their symbols and names.
@@ -78,3 +573,69 @@ class Calculator:
             Dictionary mapping symbols to operation names
         """
         return {symbol: op.get_name() for symbol, op in self._operations.items()}
+
+
+def _chunked(numbers: Iterable[Number], chunk_size: int) -> Iterator[List[Number]]:
+    """Split an iterable into lists of up to chunk_size numbers."""
+    iterator = iter(numbers)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def _sum_chunks(chunks: Iterable[List[Number]]) -> Tuple[Number, int]:
+    """
+    Sum chunks of numbers; see Calculator.reduce().
+
+    Returns:
+        Tuple of (sum, number of values)
+    """
+    count = 0
+    # Ints are summed exactly on their own. The float part is a double-double
+    # pair: high is the rounded sum so far and low its rounding error.
+    int_total = 0
+    high = low = 0.0
+    has_floats = False
+    for chunk in chunks:
+        count += len(chunk)
+        try:
+            chunk_total = sum(chunk)
+            if chunk_total.__class__ is int:
+                int_total += chunk_total
+            else:
+                has_floats = True
+                new_high = fsum(chain((high, low), chunk))
+                low = fsum(chain((high, low), chunk, (-new_high,)))
+                high = new_high
+            total = fsum((int_total, high, low)) if has_floats else int_total
+        except (ArithmeticError, ValueError):
+            # Intermediate overflow in fsum(), an int too large for a float,
+            # or infinities of both signs
+            total = _INFINITY
+        if not -1e308 <= total <= 1e308:
+            raise OverflowError(f"Sum overflow in the chunk ending at number {count}")
+    return (fsum((int_total, high, low)) if has_floats else int_total), count
+
+
+def _multiply_chunks(chunks: Iterable[List[Number]]) -> Number:
+    """Multiply chunks of numbers; see Calculator.reduce()."""
+    count = 0
+    product: Number = 1
+    for chunk in chunks:
+        count += len(chunk)
+        try:
+            product = prod(chunk, start=product)
+        except ArithmeticError:
+            # An int too large to be multiplied by a float
+            product = _INFINITY
+        if product.__class__ is int:
+            overflow = product.bit_length() > 1023 and abs(product) > 1e308
+        else:
+            # Also true for NaN from an infinity multiplied by zero
+            overflow = not -1e308 <= product <= 1e308
+        if overflow:
+            raise OverflowError(
+                f"Product overflow in the chunk ending at number {count}"
+            )
+    return product
@@ -1,9 +1,16 @@
 """Command-line interface for the calculator with REPL functionality."""
 
 import sys
-from typing import Optional
+from typing import BinaryIO, Iterable, Optional, TextIO
 
+from .batch import (
+    evaluate_lines,
+    write_mapped,
+    write_records,
+    write_records_parallel,
+)
 from .calculator import Calculator
+from .columnar import run_columnar
 from .exceptions import (
     CalculatorError,
     DivisionByZeroError,
@@ -11,16 +18,38 @@ from .exceptions import (
     InvalidOperationError,
     OverflowError,
 )
-from .validation import InputValidator
+from .expression import evaluate_input
+from .metrics import OperationMetrics, timed
+from .validation import CachingInputValidator, InputValidator
 
 
 class CalculatorCLI:
     """Command-line interface for the calculator using REPL pattern."""
 
-    def __init__(self):
-        """Initialize the CLI with calculator and validator instances."""
-        self.calculator = Calculator()
-        self.validator = InputValidator()
+    def __init__(
+        self, parse_cache_size: Optional[int] = None, instrument: bool = False
+    ):
+        """
+        Initialize the CLI with calculator and validator instances.
+
+        Args:
+            parse_cache_size: Number of input lines whose parse results are
+                memoized; None disables the parse cache
+            instrument: Record call, error and latency metrics for calculations
+                and for parsing, i.e. InputValidator.parse_input()
+        """
+        self.calculator = Calculator(instrument=instrument)
+        self.validator = (
+            CachingInputValidator(parse_cache_size)
+            if parse_cache_size is not None
+            else InputValidator()
+        )
+        self.parse_metrics: Optional[OperationMetrics] = None
+        if instrument:
+            self.parse_metrics = OperationMetrics()
+            self.validator.parse_input = timed(
+                self.validator.parse_input, self.parse_metrics, "parse"
+            )
 
     def display_welcome(self) -> None:
         """Display welcome message and instructions."""
@@ -49,16 +78,24 @@ class CalculatorCLI:
             print(f"  {operation}")
         print("Input Format: number operation number")
         print("Examples: 5 + 3, 10.5 - 2.3, 7 * 4, 15 / 3")
+        print("Expressions: (2 + 3) * 4, 10 / (1 - 3), -2 * -(1 + 1)")
         print("Commands: help, quit, exit")
         print("=" * 50)
 
+    def parse_cache_summary(self) -> Optional[str]:
+        """Describe parse cache effectiveness, or None if the cache is disabled."""
+        if not isinstance(self.validator, CachingInputValidator):
+            return None
+        info = self.validator.cache_info()
+        return (
+            f"Parse cache: {info.hits} hits, {info.misses} misses "
+            f"({info.hit_rate:.1%} hit rate), {info.evictions} evictions"
+        )
+
     def _handle_calculation(self, user_input: str) -> bool:
         """Handle calculation input and return True to continue."""
         try:
-            first_num, operation, second_num = self.validator.parse_calculation_input(
-                user_input
-            )
-            result = self.calculator.calculate(first_num, operation, second_num)
+            result = evaluate_input(self.calculator, self.validator, user_input)
             print(f"Result: {result}")
             return True
         except InvalidInputError as e:
@@ -115,9 +152,88 @@ class CalculatorCLI:
                     print("Goodbye!")
                     break
 
+            summary = self.parse_cache_summary()
+            if summary is not None:
+                print(summary)
+
         except KeyboardInterrupt:
             print("Calculator interrupted by user. Goodbye!")
             sys.exit(0)
         except Exception as e:
             print(f"Unexpected error in main loop: {e}")
             sys.exit(1)
+
+    def run_batch(
+        self,
+        lines: Iterable[str],
+        output: TextIO,
+        output_format: str = "plain",
+        workers: int = 1,
+    ) -> int:
+        """
+        Evaluate lines non-interactively, writing one result line per input line.
+
+        Args:
+            lines: Iterable of calculation lines (e.g. a file or sys.stdin)
+            output: Text stream receiving the results
+            output_format: One of "plain", "csv" or "ndjson"
+            workers: Number of worker processes; above 1, chunks of lines are
+                evaluated in a process pool and written in input order, and
+                the workers' metrics are merged into this CLI's
+
+        Returns:
+            Number of lines evaluated
+        """
+        if workers > 1:
+            return write_records_parallel(
+                lines,
+                output,
+                output_format,
+                workers,
+                calculator=self.calculator,
+                parse_metrics=self.parse_metrics,
+            )
+
+        records = evaluate_lines(lines, self.calculator, self.validator)
+        return write_records(records, output, output_format)
+
+    def run_columnar_batch(
+        self, lines: Iterable[str], output: TextIO, operation: Optional[str] = None
+    ) -> int:
+        """
+        Evaluate CSV operand columns, writing a result and an error-code column.
+
+        Args:
+            lines: CSV lines with an "a", "op", "b" header
+            output: Text stream receiving the "result", "error" CSV
+            operation: Operation symbol applied to every row instead of the
+                "op" column
+
+        Returns:
+            Number of rows evaluated
+
+        Raises:
+            InvalidInputError: If the header is missing a required column
+        """
+        return run_columnar(lines, output, operation, self.calculator)
+
+    def run_mapped_batch(
+        self, path: str, output: BinaryIO, output_format: str = "plain"
+    ) -> int:
+        """
+        Evaluate a file through a memory mapping, for inputs too large to stream.
+
+        Lines parsed straight from bytes bypass the validator, so they are not
+        counted by the parse cache or parse metrics.
+
+        Args:
+            path: File of calculation lines
+            output: Binary stream receiving the UTF-8 results
+            output_format: One of "plain", "csv" or "ndjson"
+
+        Returns:
+            Number of lines evaluated
+        """
+        return write_mapped(
+            path, output, output_format, self.calculator, self.validator
+        )
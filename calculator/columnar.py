@@ -0,0 +1,280 @@
+"""
+Columnar evaluation of CSV operand files.
+
+Operand columns are loaded into compact array.array buffers (64-bit ints while
+every cell is an integer, doubles otherwise) and the operator column into one
+byte per row, so a loaded file holds no Python object per cell. Rows are then
+grouped by operator and each group is evaluated with a single call to the
+operation's execute_array() kernel, vectorized when NumPy is installed.
+
+Rows with an int operand too large for a double are kept aside with their
+exact operands and computed one at a time with the operation's try_execute(),
+as calculate() would compute them.
+
+The output is a CSV file with a result column and an error-code column, one
+row per input row.
+"""
+
+import csv
+import sys
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, TextIO, Tuple
+
+from .calculator import Calculator
+from .exceptions import InvalidInputError, InvalidOperationError
+from .operations import Number, load_numpy
+from .status import OK
+from .validation import InputValidator
+
+FIRST_COLUMN = "a"
+OPERATION_COLUMN = "op"
+SECOND_COLUMN = "b"
+OUTPUT_HEADER = ("result", "error")
+
+# Operator codes are stored in one byte per row
+_MAX_SYMBOLS = 256
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_FLOAT_MAX = sys.float_info.max
+_NAN = float("nan")
+
+
+class Columns(NamedTuple):
+    """Operand and operator columns loaded from a CSV file."""
+
+    first: array
+    second: array
+    # Index into symbols of each row's operator
+    operations: bytearray
+    symbols: List[str]
+    # Error codes of the rows that could not be loaded, by row index
+    invalid: Dict[int, str]
+    # Operands of the rows holding an int too large for a double, by row
+    # index; the operand columns hold 0 for them
+    exact: Dict[int, Tuple[Number, Number]]
+
+
+class _NumberColumn:
+    """Operand column stored as int64 until a cell does not fit."""
+
+    def __init__(self) -> None:
+        self.values = array("q")
+
+    def append(self, value: Number) -> None:
+        """Append a value, widening the column to doubles if needed."""
+        if self.values.typecode == "q":
+            if value.__class__ is int and _INT64_MIN <= value <= _INT64_MAX:
+                self.values.append(value)
+                return
+            self.values = array("d", self.values)
+        self.values.append(value)
+
+
+def _beyond_double(value: Number) -> bool:
+    """Whether a value is an int too large to convert to a double."""
+    return value.__class__ is int and not -_FLOAT_MAX <= value <= _FLOAT_MAX
+
+
+def read_columns(lines: Iterable[str], operation: Optional[str] = None) -> Columns:
+    """
+    Load operand columns from CSV input.
+
+    The first row is a header naming the columns "a", "op" and "b"; with a
+    fixed operation the "op" column is not needed. Other columns are ignored.
+    Operand cells are parsed like calculator input; rows with an invalid or
+    missing cell are kept as error rows so that output rows stay aligned.
+
+    Args:
+        lines: CSV text lines, e.g. an open file
+        operation: Operation symbol applied to every row, instead of the
+            "op" column
+
+    Returns:
+        The loaded columns
+
+    Raises:
+        InvalidInputError: If the header is missing a required column
+    """
+    reader = csv.reader(lines)
+    header = [name.strip() for name in next(reader, [])]
+    required = [FIRST_COLUMN, SECOND_COLUMN]
+    if operation is None:
+        required.append(OPERATION_COLUMN)
+    missing = [name for name in required if name not in header]
+    if missing:
+        raise InvalidInputError(f"CSV header is missing columns: {', '.join(missing)}")
+
+    first_index = header.index(FIRST_COLUMN)
+    second_index = header.index(SECOND_COLUMN)
+    operation_index = header.index(OPERATION_COLUMN) if operation is None else None
+    width = max(first_index, second_index, operation_index or 0) + 1
+
+    first, second = _NumberColumn(), _NumberColumn()
+    operations = bytearray()
+    symbols: List[str] = [] if operation is None else [operation]
+    codes: Dict[str, int] = {symbol: code for code, symbol in enumerate(symbols)}
+    invalid: Dict[int, str] = {}
+    exact: Dict[int, Tuple[Number, Number]] = {}
+    convert_number = InputValidator.convert_number
+
+    for row_index, row in enumerate(reader):
+        if len(row) < width:
+            first.append(0)
+            second.append(0)
+            operations.append(0)
+            invalid[row_index] = InvalidInputError.__name__
+            continue
+
+        first_value = convert_number(row[first_index])
+        second_value = convert_number(row[second_index])
+        if first_value is None or second_value is None:
+            first_value = second_value = 0
+            invalid[row_index] = InvalidInputError.__name__
+        elif _beyond_double(first_value) or _beyond_double(second_value):
+            exact[row_index] = (first_value, second_value)
+            first_value = second_value = 0
+        first.append(first_value)
+        second.append(second_value)
+
+        if operation_index is None:
+            operations.append(0)
+            continue
+        symbol = row[operation_index].strip()
+        code = codes.get(symbol)
+        if code is None:
+            if len(symbols) == _MAX_SYMBOLS:
+                # No real operation set comes near this; the row cannot name
+                # a valid operation
+                operations.append(0)
+                invalid.setdefault(row_index, InvalidOperationError.__name__)
+                continue
+            code = codes[symbol] = len(symbols)
+            symbols.append(symbol)
+        operations.append(code)
+
+    return Columns(first.values, second.values, operations, symbols, invalid, exact)
+
+
+def evaluate_columns(
+    columns: Columns, calculator: Optional[Calculator] = None
+) -> Tuple[array, List[Optional[str]]]:
+    """
+    Evaluate loaded columns, one execute_array() call per distinct operator.
+
+    Args:
+        columns: Columns returned by read_columns()
+        calculator: Calculator whose operations are used
+
+    Returns:
+        Tuple of (results, error_codes): results is an array of doubles with
+        NaN in failed rows, and error_codes holds the exception class name of
+        each failed row and None elsewhere
+    """
+    calculator = calculator or Calculator()
+    row_count = len(columns.operations)
+    results = array("d", [_NAN]) * row_count
+    error_codes: List[Optional[str]] = [None] * row_count
+
+    np = load_numpy()
+    operations = columns.operations
+    if np is not None:
+        operations = np.frombuffer(operations, dtype=np.uint8)
+    for code, symbol in enumerate(columns.symbols):
+        if np is not None:
+            rows = np.flatnonzero(operations == code)
+        else:
+            rows = [
+                index for index, row_code in enumerate(operations) if row_code == code
+            ]
+        if not len(rows):
+            continue
+
+        if not calculator.is_valid_operation(symbol):
+            for index in rows:
+                error_codes[index] = InvalidOperationError.__name__
+            continue
+
+        operation = calculator.get_operation(symbol)
+        if np is not None:
+            group_results, group_codes = operation.execute_array(
+                np.asarray(columns.first)[rows], np.asarray(columns.second)[rows]
+            )
+            np.frombuffer(results, dtype=np.float64)[rows] = group_results
+        else:
+            group_results, group_codes = operation.execute_array(
+                [columns.first[index] for index in rows],
+                [columns.second[index] for index in rows],
+            )
+            for index, value in zip(rows, group_results):
+                results[index] = value
+        for position, error_code in enumerate(group_codes):
+            if error_code is not None:
+                error_codes[rows[position]] = error_code
+
+    for index, (first, second) in columns.exact.items():
+        symbol = columns.symbols[columns.operations[index]]
+        if not calculator.is_valid_operation(symbol):
+            continue
+        status, value = calculator.get_operation(symbol).try_execute(first, second)
+        if status is OK:
+            results[index] = value
+            error_codes[index] = None
+        else:
+            results[index] = _NAN
+            error_codes[index] = status.value
+
+    for index, error_code in columns.invalid.items():
+        results[index] = _NAN
+        error_codes[index] = error_code
+
+    return results, error_codes
+
+
+def write_columns(
+    results: array, error_codes: List[Optional[str]], output: TextIO
+) -> int:
+    """
+    Write a result column and an error-code column as CSV.
+
+    Args:
+        results: Results returned by evaluate_columns()
+        error_codes: Error codes returned by evaluate_columns()
+        output: Text stream to write to
+
+    Returns:
+        Number of rows written, excluding the header
+    """
+    # Neither float reprs nor exception class names ever need CSV quoting
+    output.write(",".join(OUTPUT_HEADER) + "\n")
+    output.writelines(
+        f"{result!r},\n" if error_code is None else f",{error_code}\n"
+        for result, error_code in zip(results, error_codes)
+    )
+    return len(results)
+
+
+def run_columnar(
+    lines: Iterable[str],
+    output: TextIO,
+    operation: Optional[str] = None,
+    calculator: Optional[Calculator] = None,
+) -> int:
+    """
+    Load, evaluate and write a columnar CSV file.
+
+    Args:
+        lines: CSV text lines with an "a", "op", "b" header
+        output: Text stream receiving the "result", "error" CSV
+        operation: Operation symbol applied to every row, instead of the
+            "op" column
+        calculator: Calculator whose operations are used
+
+    Returns:
+        Number of rows evaluated
+
+    Raises:
+        InvalidInputError: If the header is missing a required column
+    """
+    columns = read_columns(lines, operation)
+    results, error_codes = evaluate_columns(columns, calculator)
+    return write_columns(results, error_codes, output)
@@ -0,0 +1,229 @@
+"""
+Plain-function implementations of the built-in operations.
+
+Each function takes two operands and returns an (status, value) outcome like
+Operation.try_execute(). The operation classes use these functions as their
+try_execute(), and Calculator calls them straight from a symbol-to-function
+table, so a calculation costs a dict lookup and one function call.
+
+Overflow checks are specialized by result type. An int of at most 1023 bits
+is below 2**1023 < 1e308, so an int result's bit length is checked before any
+comparison with the float limit; float results are compared against the limit
+directly, written as literals so that both bounds are compile-time constants.
+Results of any other type keep the generic abs() check. An int beyond float
+range cannot meet a float, nor be divided into a float; the ArithmeticError
+that Python raises is reported as an overflow too.
+
+The *_value() functions are the raising counterparts that Operation.execute()
+and Calculator.calculate() use. They return the result of a plain int or float
+calculation well within range without building an outcome, and hand every
+other case to the outcome function, whose result or error they pass on, so
+both give the same results and errors.
+
+Multiplying ints costs more than linear time, so the bit length of an int
+product is bounded from the operands' bit lengths before it is computed:
+products certain to overflow are rejected without being computed, and
+bounded_multiply() applies a lower, configurable limit the same way.
+"""
+
+from typing import Any, Callable, Dict
+
+from .status import DIVISION_BY_ZERO, OK, OVERFLOW, Outcome, unwrap
+
+# The product of nonzero ints of m and n bits has m + n - 1 or m + n bits. At
+# more than 1025 bits in total it is at least 2**1024 > 1e308.
+_PRODUCT_BITS_LIMIT = 1025
+
+# Ints longer than this, which are beyond the overflow limit on their own, are
+# described by their size in error messages: converting an int to decimal
+# takes time quadratic in its length, and beyond 4300 digits Python refuses to
+# convert it at all, raising ValueError (see sys.set_int_max_str_digits()).
+_MESSAGE_INT_BITS = 1024
+
+
+def _describe(number: Any) -> Any:
+    """Return an operand as shown in error messages."""
+    if number.__class__ is int and number.bit_length() > _MESSAGE_INT_BITS:
+        return f"<{number.bit_length()}-bit int>"
+    return number
+
+
+def add(a, b) -> Outcome:
+    """Add two numbers."""
+    try:
+        result = a + b
+    except ArithmeticError:
+        return OVERFLOW, f"Addition overflow: {_describe(a)} + {_describe(b)}"
+    result_type = result.__class__
+    if result_type is int:
+        if result.bit_length() > 1023 and abs(result) > 1e308:
+            return OVERFLOW, f"Addition overflow: {_describe(a)} + {_describe(b)}"
+    elif result_type is float:
+        if result > 1e308 or result < -1e308:
+            return OVERFLOW, f"Addition overflow: {a} + {b}"
+    elif abs(result) > 1e308:
+        return OVERFLOW, f"Addition overflow: {a} + {b}"
+    return OK, result
+
+
+def subtract(a, b) -> Outcome:
+    """Subtract the second number from the first."""
+    try:
+        result = a - b
+    except ArithmeticError:
+        return OVERFLOW, f"Subtraction overflow: {_describe(a)} - {_describe(b)}"
+    result_type = result.__class__
+    if result_type is int:
+        if result.bit_length() > 1023 and abs(result) > 1e308:
+            return OVERFLOW, f"Subtraction overflow: {_describe(a)} - {_describe(b)}"
+    elif result_type is float:
+        if result > 1e308 or result < -1e308:
+            return OVERFLOW, f"Subtraction overflow: {a} - {b}"
+    elif abs(result) > 1e308:
+        return OVERFLOW, f"Subtraction overflow: {a} - {b}"
+    return OK, result
+
+
+def multiply(a, b) -> Outcome:
+    """Multiply two numbers."""
+    if a.__class__ is int and b.__class__ is int:
+        # The product has at most this many bits
+        bits = a.bit_length() + b.bit_length()
+        if bits > _PRODUCT_BITS_LIMIT and a and b:
+            return OVERFLOW, _product_overflow(a, b)
+        result = a * b
+        if bits > 1023 and abs(result) > 1e308:
+            return OVERFLOW, _product_overflow(a, b)
+        return OK, result
+
+    try:
+        result = a * b
+    except ArithmeticError:
+        return OVERFLOW, _product_overflow(a, b)
+    result_type = result.__class__
+    if result_type is float:
+        if result > 1e308 or result < -1e308:
+            return OVERFLOW, f"Multiplication overflow: {a} * {b}"
+    elif abs(result) > 1e308:
+        return OVERFLOW, f"Multiplication overflow: {a} * {b}"
+    return OK, result
+
+
+def _product_overflow(a: Any, b: Any) -> str:
+    """Build the overflow message of a product."""
+    return f"Multiplication overflow: {_describe(a)} * {_describe(b)}"
+
+
+def bounded_multiply(max_bits: int) -> Callable[[Any, Any], Outcome]:
+    """
+    Build a multiply() that also rejects int products longer than max_bits bits.
+
+    Products are rejected from the operands' bit lengths where those decide
+    it, so a rejected product of huge ints takes constant time; otherwise
+    the product has at most max_bits + 1 bits and is computed and checked.
+
+    Args:
+        max_bits: Largest bit length of an int product
+
+    Returns:
+        Function with the signature and outcomes of multiply()
+    """
+
+    def multiply_bounded(a, b) -> Outcome:
+        """Multiply two numbers, bounding the bit length of int products."""
+        if a.__class__ is int and b.__class__ is int:
+            if a.bit_length() + b.bit_length() - 1 > max_bits and a and b:
+                return OVERFLOW, _product_overflow(a, b)
+            status, result = multiply(a, b)
+            if status is OK and result.bit_length() > max_bits:
+                return OVERFLOW, _product_overflow(a, b)
+            return status, result
+        return multiply(a, b)
+
+    return multiply_bounded
+
+
+def add_value(a, b) -> Any:
+    """Add two numbers, raising the error of add() if it fails."""
+    try:
+        result = a + b
+    except ArithmeticError:
+        pass
+    else:
+        result_type = result.__class__
+        if result_type is int:
+            if result.bit_length() <= 1023:
+                return result
+        elif result_type is float and -1e308 <= result <= 1e308:
+            return result
+    return unwrap(add(a, b))
+
+
+def subtract_value(a, b) -> Any:
+    """Subtract the second number from the first, raising the error of subtract()."""
+    try:
+        result = a - b
+    except ArithmeticError:
+        pass
+    else:
+        result_type = result.__class__
+        if result_type is int:
+            if result.bit_length() <= 1023:
+                return result
+        elif result_type is float and -1e308 <= result <= 1e308:
+            return result
+    return unwrap(subtract(a, b))
+
+
+def multiply_value(a, b) -> Any:
+    """Multiply two numbers, raising the error of multiply() if it fails."""
+    if a.__class__ is int and b.__class__ is int:
+        if a.bit_length() + b.bit_length() <= 1023:
+            return a * b
+    else:
+        try:
+            result = a * b
+        except ArithmeticError:
+            pass
+        else:
+            if result.__class__ is float and -1e308 <= result <= 1e308:
+                return result
+    return unwrap(multiply(a, b))
+
+
+def divide(a, b) -> Outcome:
+    """Divide the first number by the second."""
+    if b == 0:
+        return DIVISION_BY_ZERO, "Division by zero is not allowed"
+
+    # True division never returns an int
+    try:
+        result = a / b
+    except ArithmeticError:
+        return OVERFLOW, f"Division overflow: {_describe(a)} / {_describe(b)}"
+    if result.__class__ is float:
+        if result > 1e308 or result < -1e308:
+            return OVERFLOW, f"Division overflow: {a} / {b}"
+    elif abs(result) > 1e308:
+        return OVERFLOW, f"Division overflow: {a} / {b}"
+    return OK, result
+
+
+def divide_value(a, b) -> Any:
+    """Divide the first number by the second, raising the error of divide()."""
+    try:
+        result = a / b
+    except ArithmeticError:
+        pass
+    else:
+        if result.__class__ is float and -1e308 <= result <= 1e308:
+            return result
+    return unwrap(divide(a, b))
+
+
+DISPATCH_TABLE: Dict[str, Callable[..., Outcome]] = {
+    "+": add,
+    "-": subtract,
+    "*": multiply,
+    "/": divide,
+}
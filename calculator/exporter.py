@@ -0,0 +1,239 @@
+"""
+OpenMetrics exporter for calculator instrumentation.
+
+Renders the call, error and latency metrics recorded by an instrumented
+Calculator (and, optionally, by a timed InputValidator.parse_input) in the
+OpenMetrics text format, and publishes them either from a small HTTP endpoint
+(GET /metrics) or by periodically rewriting a file for a textfile collector.
+
+Exported families:
+
+- calculator_calculations_total{op}
+- calculator_calculation_errors_total{op,error}
+- calculator_calculation_duration_seconds{op} (histogram)
+- calculator_parses_total
+- calculator_parse_errors_total{error}
+- calculator_parse_duration_seconds (histogram)
+"""
+
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from .calculator import Calculator
+from .metrics import OperationMetrics
+from .settings import DEFAULT_TEXTFILE_INTERVAL
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: Dict[str, str]) -> str:
+    """Format a label set, including the braces; empty sets format as ''."""
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs.items())
+    return "{" + body + "}"
+
+
+def _format_bound(bound: float) -> str:
+    """Format a histogram bucket bound."""
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _render_families(
+    lines: List[str],
+    prefix: str,
+    noun: str,
+    snapshot: Dict[str, Dict],
+    label_name: Optional[str],
+) -> None:
+    """
+    Append counter and histogram families for one OperationMetrics snapshot.
+
+    Args:
+        lines: Output lines to append to
+        prefix: Metric name prefix, e.g. "calculator_calculation"
+        noun: Human-readable name of what is counted, for HELP lines
+        snapshot: OperationMetrics.snapshot() result
+        label_name: Label carrying the snapshot key, or None to omit it
+    """
+
+    def base(key: str) -> Dict[str, str]:
+        return {label_name: key} if label_name else {}
+
+    lines.append(f"# TYPE {prefix}s counter")
+    lines.append(f"# HELP {prefix}s Number of {noun}s.")
+    for key, entry in sorted(snapshot.items()):
+        lines.append(f"{prefix}s_total{_labels(base(key))} {entry['calls']}")
+
+    lines.append(f"# TYPE {prefix}_errors counter")
+    lines.append(f"# HELP {prefix}_errors Number of failed {noun}s by error class.")
+    for key, entry in sorted(snapshot.items()):
+        for error, count in sorted(entry["errors"].items()):
+            labels = _labels({**base(key), "error": error})
+            lines.append(f"{prefix}_errors_total{labels} {count}")
+
+    name = f"{prefix}_duration_seconds"
+    lines.append(f"# TYPE {name} histogram")
+    lines.append(f"# UNIT {name} seconds")
+    lines.append(f"# HELP {name} Latency of {noun}s.")
+    for key, entry in sorted(snapshot.items()):
+        cumulative = 0
+        for bound, count in entry["histogram"]:
+            cumulative += count
+            labels = _labels({**base(key), "le": _format_bound(bound)})
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        lines.append(f"{name}_count{_labels(base(key))} {cumulative}")
+        lines.append(f"{name}_sum{_labels(base(key))} {entry['latency_sum']!r}")
+
+
+def render_openmetrics(
+    calculation_stats: Optional[Dict[str, Dict]],
+    parse_stats: Optional[Dict[str, Dict]] = None,
+) -> str:
+    """
+    Render metrics snapshots in the OpenMetrics text format.
+
+    Args:
+        calculation_stats: Calculator.stats() result; None renders no samples
+        parse_stats: Snapshot of the parse metrics, or None to omit the parse
+            families
+
+    Returns:
+        Exposition text ending with "# EOF"
+    """
+    lines: List[str] = []
+    _render_families(
+        lines, "calculator_calculation", "calculation", calculation_stats or {}, "op"
+    )
+    if parse_stats is not None:
+        _render_families(lines, "calculator_parse", "parse", parse_stats, None)
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: str, text: str) -> None:
+    """
+    Replace a file's contents atomically.
+
+    The text is written to a temporary file in the same directory and renamed
+    over path, so a collector never reads a partially written file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serves the exposition text at /metrics."""
+
+    def do_GET(self) -> None:
+        """Respond to a scrape."""
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        data = self.server.exporter.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+
+class MetricsExporter:
+    """Publishes a Calculator's metrics over HTTP or to a textfile."""
+
+    def __init__(
+        self,
+        calculator: Calculator,
+        parse_metrics: Optional[OperationMetrics] = None,
+    ):
+        """
+        Initialize the exporter.
+
+        Args:
+            calculator: Calculator created with instrument=True
+            parse_metrics: Metrics recorded around InputValidator.parse_input()
+        """
+        self.calculator = calculator
+        self.parse_metrics = parse_metrics
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._textfile: Optional[str] = None
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+
+    def render(self) -> str:
+        """Render the current metrics in the OpenMetrics text format."""
+        parse_stats = (
+            self.parse_metrics.snapshot() if self.parse_metrics is not None else None
+        )
+        return render_openmetrics(self.calculator.stats(), parse_stats)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """
+        Serve GET /metrics from a daemon thread.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind; 0 picks a free port
+
+        Returns:
+            The running server; its server_address holds the bound port
+        """
+        server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+        server.daemon_threads = True
+        server.exporter = self
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._server = server
+        return server
+
+    def write_textfile(self, path: str) -> None:
+        """Write the current metrics to path atomically."""
+        write_textfile(path, self.render())
+
+    def start_textfile(
+        self, path: str, interval: float = DEFAULT_TEXTFILE_INTERVAL
+    ) -> None:
+        """
+        Rewrite path every interval seconds from a daemon thread.
+
+        The file is written once immediately and once more by close().
+        """
+        self._textfile = path
+        self.write_textfile(path)
+
+        def run() -> None:
+            while not self._stop.wait(interval):
+                self.write_textfile(path)
+
+        self._writer = threading.Thread(target=run, daemon=True)
+        self._writer.start()
+
+    def close(self) -> None:
+        """Stop publishing, writing the textfile one final time."""
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if self._textfile is not None:
+            self.write_textfile(self._textfile)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
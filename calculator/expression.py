@@ -0,0 +1,577 @@
+"""
+Expression engine supporting operator precedence and parentheses.
+
+Expressions such as "(1 + 2) * 3 / -4" are tokenized, parsed with a
+precedence-climbing parser into a small syntax tree and compiled into a flat
+postfix program. Compiled programs are cached by source string, so an
+expression that has been seen before is evaluated without parsing it again.
+
+Expressions may name variables, as in "price * qty - discount". A compiled
+program is then a reusable formula: evaluate() binds the names to numbers,
+and evaluate_columns() binds them to whole columns and runs each operation
+once per column through Operation.execute_array().
+
+Identical subexpressions, as in "(a + b) * (a + b)", are compiled once: the
+first occurrence stores its result and later ones recall it. Program.optimize()
+also folds operations on constants with a calculator's own operations.
+"""
+
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from . import validation
+from .exceptions import CalculatorError, InvalidInputError, OverflowError
+from .operations import Number, Operation, load_numpy
+from .status import OK, Outcome
+from .validation import InputValidator
+
+EXPRESSION_CACHE_SIZE = 1024
+MAX_NESTING_DEPTH = 100
+
+# Binding power of each binary operator; higher binds tighter.
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2}
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:((?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|([-+*/()])|([A-Za-z_]\w*))"
+)
+
+# Program opcodes
+PUSH = "push"
+LOAD = "load"
+APPLY = "apply"
+# Save the top of the stack in the next temporary slot, keeping it on the stack
+STORE = "store"
+# Push the value of a temporary slot
+RECALL = "recall"
+
+Instruction = Tuple[str, Union[Number, str]]
+
+
+class Literal(NamedTuple):
+    """A numeric constant in an expression tree."""
+
+    value: Number
+
+
+class BinaryOp(NamedTuple):
+    """A binary operation node in an expression tree."""
+
+    symbol: str
+    left: "Node"
+    right: "Node"
+
+
+class Variable(NamedTuple):
+    """A named value bound when an expression is evaluated."""
+
+    name: str
+
+
+Node = Union[Literal, Variable, BinaryOp]
+
+Token = Tuple[str, Union[Number, str]]
+
+
+def tokenize(source: str) -> List[Token]:
+    """
+    Split an expression into ("number", value), ("symbol", text) and
+    ("name", text) tokens.
+
+    Raises:
+        InvalidInputError: If the expression is longer than the input line
+            limit or contains an unexpected character
+    """
+    InputValidator.check_line_length(source)
+    tokens: List[Token] = []
+    position = 0
+    end = len(source.rstrip())
+
+    while position < end:
+        match = _TOKEN_PATTERN.match(source, position)
+        if not match:
+            character = source[position:end].lstrip()[:1]
+            raise InvalidInputError(
+                f"Unexpected character '{character}' in expression '{source.strip()}'"
+            )
+        number_str, symbol, name = match.groups()
+        if number_str is not None:
+            tokens.append(("number", InputValidator.validate_number(number_str)))
+        elif symbol is not None:
+            tokens.append(("symbol", symbol))
+        else:
+            tokens.append(("name", name))
+        position = match.end()
+
+    return tokens
+
+
+class _Parser:
+    """Precedence-climbing parser producing an expression tree."""
+
+    def __init__(self, source: str):
+        self.source = source.strip()
+        self.tokens = tokenize(source)
+        self.position = 0
+        self.depth = 0
+
+    def parse(self) -> Node:
+        """Parse the whole token stream as one expression."""
+        if not self.tokens:
+            raise InvalidInputError("Empty expression")
+        node = self._parse_expression(1)
+        if self.position < len(self.tokens):
+            raise self._error(f"Unexpected '{self.tokens[self.position][1]}'")
+        return node
+
+    def _peek(self) -> Optional[Token]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _parse_expression(self, min_precedence: int) -> Node:
+        left = self._parse_unary()
+        while True:
+            token = self._peek()
+            if token is None or token[1] not in _PRECEDENCE:
+                return left
+            precedence = _PRECEDENCE[token[1]]
+            if precedence < min_precedence:
+                return left
+            self.position += 1
+            # Left associativity: the right operand only takes tighter operators
+            right = self._parse_expression(precedence + 1)
+            left = BinaryOp(token[1], left, right)
+
+    def _parse_unary(self) -> Node:
+        token = self._peek()
+        if token is None:
+            raise self._error("Unexpected end of expression")
+        self.position += 1
+        kind, value = token
+
+        if kind == "number":
+            return Literal(value)
+        if kind == "name":
+            return Variable(value)
+        if value in ("+", "-"):
+            operand = self._parse_nested(self._parse_unary)
+            if value == "+":
+                return operand
+            if isinstance(operand, Literal):
+                return Literal(-operand.value)
+            return BinaryOp("*", Literal(-1), operand)
+        if value == "(":
+            node = self._parse_nested(lambda: self._parse_expression(1))
+            if self._peek() != ("symbol", ")"):
+                raise self._error("Missing closing parenthesis")
+            self.position += 1
+            return node
+        raise self._error(f"Unexpected '{value}'")
+
+    def _parse_nested(self, parse: Callable[[], Node]) -> Node:
+        """Run a nested parse, bounding the recursion depth."""
+        self.depth += 1
+        if self.depth > MAX_NESTING_DEPTH:
+            raise self._error("Expression is nested too deeply")
+        node = parse()
+        self.depth -= 1
+        return node
+
+    def _error(self, message: str) -> InvalidInputError:
+        return InvalidInputError(f"{message} in expression '{self.source}'")
+
+
+def parse_expression(source: str) -> Node:
+    """
+    Parse an expression into a syntax tree.
+
+    Raises:
+        InvalidInputError: If the expression is malformed
+    """
+    return _Parser(source).parse()
+
+
+class Program:
+    """A compiled expression in flat postfix form."""
+
+    def __init__(self, source: str, instructions: Tuple[Instruction, ...], tree: Node):
+        self.source = source
+        self.instructions = instructions
+        # Syntax tree the instructions were compiled from
+        self.tree = tree
+        # Variable names in order of first use
+        self.variables: Tuple[str, ...] = tuple(
+            dict.fromkeys(
+                argument for opcode, argument in instructions if opcode is LOAD
+            )
+        )
+
+    def evaluate(
+        self,
+        calculate: Callable[[Number, str, Number], Number],
+        variables: Optional[Mapping[str, Number]] = None,
+    ) -> Number:
+        """
+        Run the program.
+
+        Args:
+            calculate: Function applying one operation, normally
+                Calculator.calculate
+            variables: Value of each variable the expression names
+
+        Returns:
+            Result of the expression
+
+        Raises:
+            InvalidInputError: If a variable has no value
+            CalculatorError: Propagated from calculate
+        """
+        bound = variables or {}
+        if self.variables:
+            self._check_bound(bound)
+        stack: List[Number] = []
+        temporaries: List[Number] = []
+        push = stack.append
+        pop = stack.pop
+        for opcode, argument in self.instructions:
+            if opcode is PUSH:
+                push(argument)
+            elif opcode is APPLY:
+                right = pop()
+                push(calculate(pop(), argument, right))
+            elif opcode is LOAD:
+                push(bound[argument])
+            elif opcode is STORE:
+                temporaries.append(stack[-1])
+            else:
+                push(temporaries[argument])
+        return stack[0]
+
+    def evaluate_columns(
+        self,
+        columns: Mapping[str, Sequence[Number]],
+        get_operation: Callable[[str], Operation],
+    ) -> Tuple[Any, List[Optional[str]]]:
+        """
+        Run the program over whole columns, one execute_array() call per operation.
+
+        Each variable is bound to a column (a list, array.array, NumPy array
+        or any other sequence) and constants are broadcast to the column
+        length; an expression without variables gives a single row. Rows
+        where an operation fails hold NaN from then on and keep the error code
+        of the first failure, so every operation keeps the overflow and
+        divide-by-zero semantics of its execute_array().
+
+        Args:
+            columns: Column of each variable the expression names; columns
+                that are not named are ignored
+            get_operation: Function resolving an operation symbol, normally
+                Calculator.get_operation
+
+        Returns:
+            Tuple of (results, error_codes) as returned by execute_array():
+            a float64 ndarray when NumPy is installed, otherwise a list
+
+        Raises:
+            InvalidInputError: If a variable has no column or the named
+                columns differ in length
+            InvalidOperationError: If an operation symbol is not available
+        """
+        self._check_bound(columns)
+        lengths = {len(columns[name]) for name in self.variables}
+        if len(lengths) > 1:
+            raise InvalidInputError(
+                "Formula columns must have the same length: "
+                + ", ".join(f"{name}={len(columns[name])}" for name in self.variables)
+            )
+        row_count = lengths.pop() if lengths else 1
+
+        np = load_numpy()
+        error_codes: List[Optional[str]] = [None] * row_count
+        stack: List[Any] = []
+        temporaries: List[Any] = []
+        push = stack.append
+        pop = stack.pop
+        for opcode, argument in self.instructions:
+            if opcode is PUSH:
+                if np is not None:
+                    push(np.full(row_count, _to_float(argument), dtype=np.float64))
+                else:
+                    push([argument] * row_count)
+            elif opcode is APPLY:
+                right = pop()
+                results, codes = get_operation(argument).execute_array(pop(), right)
+                if codes.count(None) != row_count:
+                    for index, code in enumerate(codes):
+                        if code is not None and error_codes[index] is None:
+                            error_codes[index] = code
+                push(results)
+            elif opcode is LOAD:
+                push(columns[argument])
+            elif opcode is STORE:
+                # execute_array() never modifies its operands, so a stored
+                # column can be shared
+                temporaries.append(stack[-1])
+            else:
+                push(temporaries[argument])
+
+        results = stack[0]
+        if self.instructions[-1][0] is not APPLY:
+            # A bare variable is returned as a copy, never as the caller's column
+            if np is None:
+                results = list(results)
+            else:
+                results = _float_column(results, error_codes)
+        return results, error_codes
+
+    def optimize(
+        self, try_calculate: Callable[[Number, str, Number], Outcome]
+    ) -> "Program":
+        """
+        Fold the operations on constants of this program.
+
+        Args:
+            try_calculate: Function applying one operation, normally
+                Calculator.try_calculate, so constants are folded with the
+                operations the program will run on
+
+        Returns:
+            A program with the folded constants, or this program if none
+            could be folded
+        """
+        tree = fold_constants(self.tree, try_calculate)
+        if tree is self.tree:
+            return self
+        return _Compiler(tree).compile(self.source)
+
+    def _check_bound(self, values: Mapping[str, Any]) -> None:
+        """Raise InvalidInputError for the first variable without a value."""
+        for name in self.variables:
+            if name not in values:
+                raise InvalidInputError(
+                    f"Undefined variable '{name}' in expression '{self.source}'"
+                )
+
+
+def _float_column(column: Sequence[Number], error_codes: List[Optional[str]]) -> Any:
+    """
+    Copy a column into a float64 ndarray.
+
+    Ints beyond float range hold NaN and are flagged in error_codes, as
+    execute_array() flags results that overflow.
+    """
+    np = load_numpy()
+    try:
+        return np.array(column, np.float64)
+    except ArithmeticError:
+        values = []
+        for index, value in enumerate(column):
+            try:
+                values.append(float(value))
+            except ArithmeticError:
+                values.append(float("nan"))
+                error_codes[index] = OverflowError.__name__
+        return np.array(values, np.float64)
+
+
+def _to_float(value: Number) -> float:
+    """Convert a constant to a double; ints out of range become infinities."""
+    try:
+        return float(value)
+    except ArithmeticError:
+        # The operation using the constant reports this as an overflow
+        return float("inf") if value > 0 else float("-inf")
+
+
+def _postorder(tree: Node) -> Iterator[Node]:
+    """
+    Yield every node of a tree after its operands, left operand first.
+
+    Chains such as "1 + 1 + ... + 1" make trees as deep as they are long, so
+    trees are walked with an explicit stack rather than by recursion.
+    """
+    stack: List[Tuple[Node, bool]] = [(tree, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded or not isinstance(node, BinaryOp):
+            yield node
+        else:
+            stack.append((node, True))
+            stack.append((node.right, False))
+            stack.append((node.left, False))
+
+
+def fold_constants(
+    node: Node, try_calculate: Callable[[Number, str, Number], Outcome]
+) -> Node:
+    """
+    Replace operations whose operands are both constants by their results.
+
+    Operations are never reordered, so "x + 1 + 2", which is "(x + 1) + 2",
+    keeps both additions. An operation that fails is left in place so that
+    its error is raised when the program runs, exactly as without folding.
+
+    Args:
+        node: Syntax tree to fold
+        try_calculate: Function applying one operation without raising,
+            normally Calculator.try_calculate
+
+    Returns:
+        The folded tree; node itself if nothing could be folded
+    """
+    # Folded form of each subtree, by id() of the subtree
+    folded: Dict[int, Node] = {}
+    for current in _postorder(node):
+        if not isinstance(current, BinaryOp):
+            folded[id(current)] = current
+            continue
+        left = folded[id(current.left)]
+        right = folded[id(current.right)]
+        if isinstance(left, Literal) and isinstance(right, Literal):
+            try:
+                status, value = try_calculate(left.value, current.symbol, right.value)
+            except (CalculatorError, ArithmeticError):
+                status = None
+            if status is OK:
+                folded[id(current)] = Literal(value)
+                continue
+        if left is current.left and right is current.right:
+            folded[id(current)] = current
+        else:
+            folded[id(current)] = BinaryOp(current.symbol, left, right)
+    return folded[id(node)]
+
+
+class _Compiler:
+    """Postfix code generator that computes repeated subtrees only once."""
+
+    def __init__(self, tree: Node):
+        self.tree = tree
+        # Number of each distinct subtree, by id() of the nodes holding it
+        self.numbers: Dict[int, int] = {}
+        self.keys: Dict[Hashable, int] = {}
+        # Occurrences of each operation subtree outside of repeated subtrees
+        self.uses: Dict[int, int] = {}
+        # Temporary slot of each repeated subtree already emitted
+        self.slots: Dict[int, int] = {}
+        self.instructions: List[Instruction] = []
+
+    def compile(self, source: str) -> Program:
+        """Compile the tree into a program."""
+        self._number()
+        self._count()
+        self._emit()
+        return Program(source, tuple(self.instructions), self.tree)
+
+    def _number(self) -> None:
+        """Number every subtree so that equal subtrees get equal numbers."""
+        numbers = self.numbers
+        keys = self.keys
+        for node in _postorder(self.tree):
+            if isinstance(node, Literal):
+                # Types and repr() keep 1, 1.0, 0.0 and -0.0 apart
+                key: Hashable = (node.value.__class__, repr(node.value))
+            elif isinstance(node, Variable):
+                key = node.name
+            else:
+                key = (node.symbol, numbers[id(node.left)], numbers[id(node.right)])
+            numbers[id(node)] = keys.setdefault(key, len(keys))
+
+    def _count(self) -> None:
+        """Count operation subtrees, not descending into repeated ones."""
+        uses = self.uses
+        stack = [self.tree]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BinaryOp):
+                number = self.numbers[id(node)]
+                uses[number] = uses.get(number, 0) + 1
+                if uses[number] == 1:
+                    stack.append(node.right)
+                    stack.append(node.left)
+
+    def _emit(self) -> None:
+        """Append the postfix instructions for the tree."""
+        instructions = self.instructions
+        slots = self.slots
+        # An operation is pushed once to emit its operands and again, expanded,
+        # to emit itself after them
+        stack: List[Tuple[Node, bool]] = [(self.tree, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if isinstance(node, Literal):
+                instructions.append((PUSH, node.value))
+            elif isinstance(node, Variable):
+                instructions.append((LOAD, node.name))
+            elif expanded:
+                instructions.append((APPLY, node.symbol))
+                number = self.numbers[id(node)]
+                if self.uses[number] > 1:
+                    slots[number] = len(slots)
+                    instructions.append((STORE, slots[number]))
+            elif self.numbers[id(node)] in slots:
+                instructions.append((RECALL, slots[self.numbers[id(node)]]))
+            else:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+
+
+def compile_expression(source: str) -> Program:
+    """
+    Compile an expression into a postfix program, caching by source string.
+
+    Raises:
+        InvalidInputError: If the expression is malformed
+    """
+    return _compile_expression(
+        source, validation.MAX_LINE_LENGTH, validation.MAX_NUMBER_DIGITS
+    )
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_expression(source: str, *limits: int) -> Program:
+    # The input limits are part of the key, so that a program cached under
+    # looser limits is not returned after they are lowered
+    return _Compiler(parse_expression(source)).compile(source)
+
+
+def evaluate_input(calculator, validator, input_str: str) -> Number:
+    """
+    Evaluate one line of user input.
+
+    Simple "number operation number" lines take the validator's fast path;
+    anything else is compiled with Calculator.compile() and evaluated (see
+    InputValidator.parse_input()). If the line is not a valid expression
+    either, the validator's original error is raised, so messages for simple
+    input stay unchanged.
+
+    Args:
+        calculator: Calculator performing the operations
+        validator: InputValidator parsing the input
+        input_str: Line to evaluate
+
+    Returns:
+        Result of the calculation
+
+    Raises:
+        CalculatorError: If the input is invalid or the calculation fails
+    """
+    parsed = validator.parse_input(input_str, calculator.compile)
+    if isinstance(parsed, tuple):
+        return calculator.calculate(*parsed)
+    return parsed.evaluate(calculator.calculate)
@@ -0,0 +1,572 @@
+"""
+Exact fixed-point decimal arithmetic on scaled integers.
+
+A fixed-point value with scale s is stored as the int value * 10**s, so 0.1
+at scale 2 is the int 10 and sums of such values are exact. Decimal input is
+parsed straight into that representation by InputValidator.validate_number()
+and formatted back with format_fixed_point(); no float is involved anywhere.
+
+Multiplication and division results are rounded to the scale with one of the
+ROUNDING_MODES. Scaled values are limited to the int64 range, so columns of
+them are int64 arrays; results beyond it are reported as overflows. With
+NumPy installed, columns are computed with vectorized int64 kernels, and the
+rare rows those cannot compute exactly are recomputed with Python ints.
+"""
+
+from abc import abstractmethod
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import validation
+from .calculator import Calculator
+from .operations import Operation, load_numpy
+from .registry import OperationRegistry
+from .status import DIVISION_BY_ZERO, OK, OVERFLOW, Outcome, unwrap
+from .validation import FIXED_POINT_MAX, InputValidator
+
+DEFAULT_SCALE = 2
+# 10**18 is the largest power of ten below FIXED_POINT_MAX, so 1 is
+# representable at every scale up to this one
+MAX_SCALE = 18
+
+ROUND_HALF_EVEN = "half-even"
+ROUND_HALF_UP = "half-up"
+ROUND_DOWN = "down"
+ROUND_UP = "up"
+ROUND_FLOOR = "floor"
+ROUND_CEILING = "ceiling"
+
+# Products and numerators below this magnitude are exact in int64. Operands are
+# compared through float64, whose rounding this margin absorbs.
+_INT64_SAFE = 2.0**62
+_INT64_MIN = -(2**63)
+
+# A plain decimal of at most this many characters minus the scale is below
+# 10**18 once scaled, which keeps it within FIXED_POINT_MAX
+_SHORT_CELL_DIGITS = 18
+_POWERS_OF_TEN = tuple(10**power for power in range(MAX_SCALE + 1))
+# Deletes the characters of plain decimals, leaving any other character
+_NOT_PLAIN_DECIMAL = str.maketrans("", "", "0123456789.+-\n")
+
+
+# Rounding rules: given the floor quotient q and remainder 0 <= r < d of a
+# division by a positive d, whether the result is q + 1 rather than q. They
+# use only operators that work on ints and NumPy arrays alike. "r > d - r"
+# compares the remainder with half the divisor without overflowing int64.
+
+
+def _half_even(q: Any, r: Any, d: Any) -> Any:
+    """To nearest, ties to the even neighbour."""
+    return (r > d - r) | ((r == d - r) & ((q & 1) == 1))
+
+
+def _half_up(q: Any, r: Any, d: Any) -> Any:
+    """To nearest, ties away from zero."""
+    # A tie is q + 0.5, which is positive iff q >= 0
+    return (r > d - r) | ((r == d - r) & (q >= 0))
+
+
+def _down(q: Any, r: Any, d: Any) -> Any:
+    """Toward zero; the floor of a negative quotient is away from zero."""
+    return (r != 0) & (q < 0)
+
+
+def _up(q: Any, r: Any, d: Any) -> Any:
+    """Away from zero."""
+    return (r != 0) & (q >= 0)
+
+
+def _floor(q: Any, r: Any, d: Any) -> Any:
+    """Toward negative infinity, which is the floor quotient itself."""
+    return (r != 0) & False
+
+
+def _ceiling(q: Any, r: Any, d: Any) -> Any:
+    """Toward positive infinity."""
+    return r != 0
+
+
+_ROUNDING_RULES: Dict[str, Callable[[Any, Any, Any], Any]] = {
+    ROUND_HALF_EVEN: _half_even,
+    ROUND_HALF_UP: _half_up,
+    ROUND_DOWN: _down,
+    ROUND_UP: _up,
+    ROUND_FLOOR: _floor,
+    ROUND_CEILING: _ceiling,
+}
+
+ROUNDING_MODES = tuple(_ROUNDING_RULES)
+
+
+def divide_rounded(numerator: int, denominator: int, rounding: str) -> int:
+    """
+    Divide two ints, rounding the quotient to an int.
+
+    Modes:
+        half-even: to nearest, ties to the even neighbour (banker's rounding)
+        half-up: to nearest, ties away from zero
+        down: toward zero
+        up: away from zero
+        floor: toward negative infinity
+        ceiling: toward positive infinity
+
+    Args:
+        numerator: Dividend
+        denominator: Non-zero divisor
+        rounding: One of ROUNDING_MODES
+
+    Returns:
+        The rounded quotient
+
+    Raises:
+        ValueError: If the rounding mode is unknown
+    """
+    rule = _ROUNDING_RULES.get(rounding)
+    if rule is None:
+        raise _unknown_rounding(rounding)
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    return quotient + rule(quotient, remainder, denominator)
+
+
+def _unknown_rounding(rounding: str) -> ValueError:
+    """Build the error for an unknown rounding mode."""
+    return ValueError(
+        f"Unknown rounding mode '{rounding}'. "
+        f"Valid modes: {', '.join(ROUNDING_MODES)}"
+    )
+
+
+def format_fixed_point(value: int, scale: int) -> str:
+    """
+    Format a scaled int as a decimal string with exactly scale decimal places.
+
+    Args:
+        value: Scaled value
+        scale: Number of decimal places
+
+    Returns:
+        The decimal string, e.g. "-0.05" for -5 at scale 2
+    """
+    sign = "-" if value < 0 else ""
+    if not scale:
+        return f"{sign}{abs(value)}"
+    whole, fraction = divmod(abs(value), 10**scale)
+    return f"{sign}{whole}.{fraction:0{scale}d}"
+
+
+class FixedPointOperation(Operation):
+    """
+    Base class of the fixed-point operations.
+
+    Operands and results are ints scaled by 10**scale. Subclasses implement
+    try_execute(), and _fixed_kernel() for vectorized columns; execute()
+    raises the error statuses of try_execute() as exceptions.
+    """
+
+    def __init__(self, scale: int = DEFAULT_SCALE, rounding: str = ROUND_HALF_EVEN):
+        """
+        Initialize the operation.
+
+        Args:
+            scale: Number of decimal places, from 0 to MAX_SCALE
+            rounding: Rounding mode of inexact results, one of ROUNDING_MODES
+
+        Raises:
+            ValueError: If the scale or rounding mode is invalid
+        """
+        if not 0 <= scale <= MAX_SCALE:
+            raise ValueError(f"Scale must be between 0 and {MAX_SCALE}, got {scale}")
+        if rounding not in _ROUNDING_RULES:
+            raise _unknown_rounding(rounding)
+        self.scale = scale
+        self.rounding = rounding
+        self.unit = 10**scale
+        self._round_up = _ROUNDING_RULES[rounding]
+
+    def execute(self, a: int, b: int) -> int:
+        """Apply the operation to two scaled ints."""
+        return unwrap(self.try_execute(a, b))
+
+    def _divide(self, numerator: int, denominator: int) -> int:
+        """Divide by a positive denominator with the operation's rounding."""
+        quotient, remainder = divmod(numerator, denominator)
+        return quotient + self._round_up(quotient, remainder, denominator)
+
+    def execute_array(
+        self, a: Sequence[int], b: Sequence[int]
+    ) -> Tuple[Any, List[Optional[str]]]:
+        """
+        Execute the operation element-wise over two columns of scaled ints.
+
+        With NumPy installed, the columns are computed with int64 kernels;
+        rows whose intermediate results do not fit int64, and failing rows,
+        are recomputed exactly with try_execute(). Without NumPy every row
+        goes through try_execute(). Columns may be lists, array('q') buffers
+        or int64 NumPy arrays.
+
+        Returns:
+            Tuple of (results, error_codes). Failed rows hold 0 in results and
+            the exception class name in error_codes; successful rows have an
+            error code of None. Results are an int64 ndarray on the NumPy path
+            and an array('q') on the pure-Python path.
+
+        Raises:
+            ValueError: If the operand columns differ in length
+        """
+        if len(a) != len(b):
+            raise ValueError(f"Operand columns differ in length: {len(a)} != {len(b)}")
+        np = load_numpy()
+        if np is None:
+            # tolist() turns array('q') elements into Python ints
+            first = a.tolist() if hasattr(a, "tolist") else a
+            second = b.tolist() if hasattr(b, "tolist") else b
+            results = array("q", bytes(8 * len(first)))
+            return results, self._execute_rows(first, second, results, range(len(a)))
+
+        first = np.asarray(a, dtype=np.int64)
+        second = np.asarray(b, dtype=np.int64)
+        results, unsettled = self._fixed_kernel(np, first, second)
+        rows = np.flatnonzero(unsettled).tolist()
+        error_codes = self._execute_rows(
+            first.tolist() if rows else [],
+            second.tolist() if rows else [],
+            results,
+            rows,
+        )
+        return results, error_codes
+
+    def _execute_rows(
+        self, a: List[int], b: List[int], results: Any, rows: Iterable[int]
+    ) -> List[Optional[str]]:
+        """Compute the given rows with try_execute(), storing results in place."""
+        try_execute = self.try_execute
+        error_codes: List[Optional[str]] = [None] * len(results)
+        for index in rows:
+            status, value = try_execute(a[index], b[index])
+            if status is OK:
+                results[index] = value
+            else:
+                results[index] = 0
+                error_codes[index] = status.value
+        return error_codes
+
+    @abstractmethod
+    def _fixed_kernel(self, np: Any, a: Any, b: Any) -> Tuple[Any, Any]:
+        """
+        Apply the operation to two int64 arrays.
+
+        Returns:
+            Tuple of (results, unsettled): unsettled masks the rows whose
+            results are not exact, which execute_array() recomputes
+        """
+        pass
+
+    def _format(self, value: int) -> str:
+        """Format a scaled operand for error messages."""
+        return format_fixed_point(value, self.scale)
+
+
+class FixedPointAddition(FixedPointOperation):
+    """Exact addition of fixed-point values."""
+
+    def try_execute(self, a: int, b: int) -> Outcome:
+        """Add two scaled ints."""
+        result = a + b
+        if -FIXED_POINT_MAX <= result <= FIXED_POINT_MAX:
+            return OK, result
+        return OVERFLOW, f"Addition overflow: {self._format(a)} + {self._format(b)}"
+
+    def _fixed_kernel(self, np: Any, a: Any, b: Any) -> Tuple[Any, Any]:
+        """Add two int64 arrays, flagging rows that wrapped around."""
+        results = a + b
+        # The sum wrapped iff its sign differs from the signs of both operands
+        return results, ((a ^ results) & (b ^ results) < 0) | (results == _INT64_MIN)
+
+    def get_symbol(self) -> str:
+        """Return the addition symbol."""
+        return "+"
+
+    def get_name(self) -> str:
+        """Return the operation name."""
+        return "addition"
+
+
+class FixedPointSubtraction(FixedPointOperation):
+    """Exact subtraction of fixed-point values."""
+
+    def try_execute(self, a: int, b: int) -> Outcome:
+        """Subtract the second scaled int from the first."""
+        result = a - b
+        if -FIXED_POINT_MAX <= result <= FIXED_POINT_MAX:
+            return OK, result
+        return (
+            OVERFLOW,
+            f"Subtraction overflow: {self._format(a)} - {self._format(b)}",
+        )
+
+    def _fixed_kernel(self, np: Any, a: Any, b: Any) -> Tuple[Any, Any]:
+        """Subtract two int64 arrays, flagging rows that wrapped around."""
+        results = a - b
+        # The difference wrapped iff the operands' signs differ and the
+        # result's sign differs from the first operand's
+        return results, ((a ^ b) & (a ^ results) < 0) | (results == _INT64_MIN)
+
+    def get_symbol(self) -> str:
+        """Return the subtraction symbol."""
+        return "-"
+
+    def get_name(self) -> str:
+        """Return the operation name."""
+        return "subtraction"
+
+
+class FixedPointMultiplication(FixedPointOperation):
+    """Fixed-point multiplication, rounded to the scale."""
+
+    def try_execute(self, a: int, b: int) -> Outcome:
+        """Multiply two scaled ints."""
+        result = self._divide(a * b, self.unit)
+        if -FIXED_POINT_MAX <= result <= FIXED_POINT_MAX:
+            return OK, result
+        return (
+            OVERFLOW,
+            f"Multiplication overflow: {self._format(a)} * {self._format(b)}",
+        )
+
+    def _fixed_kernel(self, np: Any, a: Any, b: Any) -> Tuple[Any, Any]:
+        """Multiply two int64 arrays where the product fits int64."""
+        unsettled = np.abs(a.astype(np.float64) * b) >= _INT64_SAFE
+        products = np.where(unsettled, 0, a) * b
+        quotients, remainders = np.divmod(products, self.unit)
+        return quotients + self._round_up(quotients, remainders, self.unit), unsettled
+
+    def get_symbol(self) -> str:
+        """Return the multiplication symbol."""
+        return "*"
+
+    def get_name(self) -> str:
+        """Return the operation name."""
+        return "multiplication"
+
+
+class FixedPointDivision(FixedPointOperation):
+    """Fixed-point division, rounded to the scale."""
+
+    def try_execute(self, a: int, b: int) -> Outcome:
+        """Divide the first scaled int by the second."""
+        if b > 0:
+            result = self._divide(a * self.unit, b)
+        elif b < 0:
+            result = self._divide(-a * self.unit, -b)
+        else:
+            return DIVISION_BY_ZERO, "Division by zero is not allowed"
+        if -FIXED_POINT_MAX <= result <= FIXED_POINT_MAX:
+            return OK, result
+        return OVERFLOW, f"Division overflow: {self._format(a)} / {self._format(b)}"
+
+    def _fixed_kernel(self, np: Any, a: Any, b: Any) -> Tuple[Any, Any]:
+        """Divide two int64 arrays where the scaled dividend fits int64."""
+        unsettled = (b == 0) | (np.abs(a.astype(np.float64)) * self.unit >= _INT64_SAFE)
+        numerators = np.where(unsettled, 0, a) * self.unit
+        # Divide by |b|, moving the sign of b to the numerator
+        numerators = np.where(b < 0, -numerators, numerators)
+        divisors = np.where(unsettled, 1, np.abs(b))
+        quotients, remainders = np.divmod(numerators, divisors)
+        return quotients + self._round_up(quotients, remainders, divisors), unsettled
+
+    def get_symbol(self) -> str:
+        """Return the division symbol."""
+        return "/"
+
+    def get_name(self) -> str:
+        """Return the operation name."""
+        return "division"
+
+
+def fixed_point_registry(
+    scale: int = DEFAULT_SCALE, rounding: str = ROUND_HALF_EVEN
+) -> OperationRegistry:
+    """
+    Build a registry of the four fixed-point operations for one scale.
+
+    Args:
+        scale: Number of decimal places
+        rounding: Rounding mode of multiplication and division
+
+    Returns:
+        Registry for Calculator(registry=...)
+
+    Raises:
+        ValueError: If the scale or rounding mode is invalid
+    """
+    return OperationRegistry(
+        {
+            operation.get_symbol(): operation
+            for operation in (
+                FixedPointAddition(scale, rounding),
+                FixedPointSubtraction(scale, rounding),
+                FixedPointMultiplication(scale, rounding),
+                FixedPointDivision(scale, rounding),
+            )
+        }
+    )
+
+
+def _parse_plain_column(cells: List[str], scale: int) -> Optional[array]:
+    """
+    Parse a column of short plain decimals at once with NumPy.
+
+    The column is checked as a whole: only digits, signs and points, at most
+    one point and scale decimal places per cell, and cells short enough that
+    their scaled values fit. The digits of each cell, without the point, are
+    converted to int64 and multiplied by 10**(scale - decimal places), so the
+    result is exact; int() rejects every misplaced sign.
+
+    Returns:
+        The column of scaled ints, or None if the column has to be parsed
+        cell by cell
+    """
+    np = load_numpy()
+    if np is None:
+        return None
+    max_length = min(_SHORT_CELL_DIGITS - scale, validation.MAX_NUMBER_DIGITS)
+    text = "\n".join(cells)
+    if (
+        text.translate(_NOT_PLAIN_DECIMAL)
+        or text.count("\n") != len(cells) - 1
+        or max(map(len, cells)) > max_length
+    ):
+        return None
+
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    ends = np.append(np.flatnonzero(data == ord("\n")), len(data))
+    points = np.flatnonzero(data == ord("."))
+    # Index of the cell holding each point; points are in cell order
+    owners = np.searchsorted(ends, points)
+    places = np.zeros(len(cells), dtype=np.int64)
+    places[owners] = ends[owners] - points - 1
+    if np.any(owners[1:] == owners[:-1]) or np.any(places > scale):
+        return None
+    try:
+        digits = np.array(text.replace(".", "").split("\n"), dtype=np.int64)
+    except ValueError:
+        return None
+    powers = np.array(_POWERS_OF_TEN, dtype=np.int64)
+    return array("q", (digits * powers[scale - places]).tobytes())
+
+
+class FixedPoint:
+    """
+    Fixed-point number mode: decimal text in, scaled int arithmetic, decimal text out.
+
+    Wraps a Calculator whose operations work on scaled ints, so result
+    caching and instrumentation work as for ordinary numbers.
+    """
+
+    def __init__(
+        self,
+        scale: int = DEFAULT_SCALE,
+        rounding: str = ROUND_HALF_EVEN,
+        cache_size: Optional[int] = None,
+        instrument: bool = False,
+    ):
+        """
+        Initialize the mode.
+
+        Args:
+            scale: Number of decimal places, from 0 to MAX_SCALE
+            rounding: Rounding mode of multiplication and division, one of
+                ROUNDING_MODES
+            cache_size: Passed on to Calculator
+            instrument: Passed on to Calculator
+
+        Raises:
+            ValueError: If the scale or rounding mode is invalid
+        """
+        self.scale = scale
+        self.rounding = rounding
+        self.calculator = Calculator(
+            cache_size, instrument, registry=fixed_point_registry(scale, rounding)
+        )
+
+    def parse(self, input_str: str) -> int:
+        """
+        Parse a decimal number into a scaled int.
+
+        Raises:
+            InvalidInputError: If the input is not a number, has more than
+                scale decimal places or is out of range
+        """
+        value = InputValidator.convert_fixed_point(input_str, self.scale)
+        if value is None:
+            # Raise with the reason the input is invalid
+            InputValidator.validate_number(input_str, self.scale)
+        return value
+
+    def parse_column(self, cells: Iterable[str]) -> array:
+        """
+        Parse decimal numbers into an int64 column of scaled ints.
+
+        Raises:
+            InvalidInputError: If a cell is not a valid number at this scale
+        """
+        cells = list(cells)
+        column = _parse_plain_column(cells, self.scale)
+        if column is not None:
+            return column
+
+        convert = InputValidator.convert_fixed_point
+        scale = self.scale
+        column = array("q")
+        for cell in cells:
+            value = convert(cell, scale)
+            if value is None:
+                # Raise with the reason the cell is invalid
+                InputValidator.validate_number(cell, scale)
+            column.append(value)
+        return column
+
+    def format(self, value: int) -> str:
+        """Format a scaled int with exactly scale decimal places."""
+        return format_fixed_point(value, self.scale)
+
+    def calculate(self, a: int, operation_symbol: str, b: int) -> int:
+        """
+        Apply an operation to two scaled ints.
+
+        Raises:
+            InvalidOperationError: If operation symbol is not supported
+            DivisionByZeroError: If attempting to divide by zero
+            OverflowError: If the result is beyond FIXED_POINT_MAX
+        """
+        return self.calculator.calculate(a, operation_symbol, b)
+
+    def evaluate(self, input_str: str) -> str:
+        """
+        Evaluate a "number operation number" line, e.g. "0.10 + 0.20" -> "0.30".
+
+        Raises:
+            CalculatorError: If the input is invalid or the calculation fails
+        """
+        first, operation, second = InputValidator.parse_fixed_point_input(
+            input_str, self.scale
+        )
+        return self.format(self.calculator.calculate(first, operation, second))
+
+    def calculate_columns(
+        self, a: Sequence[int], operation_symbol: str, b: Sequence[int]
+    ) -> Tuple[Any, List[Optional[str]]]:
+        """
+        Apply an operation to two columns of scaled ints.
+
+        Returns:
+            Tuple of (results, error_codes); see
+            FixedPointOperation.execute_array()
+
+        Raises:
+            InvalidOperationError: If operation symbol is not supported
+            ValueError: If the operand columns differ in length
+        """
+        return self.calculator.get_operation(operation_symbol).execute_array(a, b)
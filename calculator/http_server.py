@@ -0,0 +1,215 @@
+"""
+JSON-over-HTTP calculation service built on the standard library.
+
+Endpoints (both POST):
+
+- /calculate: body {"a": 5, "op": "+", "b": 3}; responds {"result": 8}
+- /calculate/batch: body [{"a": ..., "op": ..., "b": ...}, ...]; responds with
+  a JSON array holding one {"result": ...} or {"error": ..., "message": ...}
+  object per item, streamed with chunked transfer encoding
+
+Errors are reported with the calculator's exception class names as codes,
+e.g. {"error": "DivisionByZeroError", "message": "..."}.
+"""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+from . import validation
+from .calculator import Calculator
+from .exceptions import CalculatorError, InvalidInputError
+from .validation import InputValidator
+
+DEFAULT_HTTP_PORT = 8080
+MAX_BODY_SIZE = 64 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Returned by _read_json() when an error response has already been sent
+_NO_BODY = object()
+
+_INFINITY = float("inf")
+
+
+def evaluate_item(calculator: Calculator, item: Any) -> Dict[str, Any]:
+    """
+    Evaluate one {"a", "op", "b"} object.
+
+    Operands may be JSON numbers or numeric strings; both are subject to the
+    input digit limit.
+
+    Args:
+        calculator: Calculator performing the operation
+        item: Decoded JSON value
+
+    Returns:
+        {"result": value} on success, {"error": code, "message": text} on failure
+    """
+    try:
+        if not isinstance(item, dict) or not {"a", "op", "b"} <= item.keys():
+            raise InvalidInputError("Item must be an object with 'a', 'op' and 'b'")
+        result = calculator.calculate(
+            _operand(item["a"]), str(item["op"]), _operand(item["b"])
+        )
+    except CalculatorError as e:
+        return {"error": type(e).__name__, "message": str(e)}
+    return {"result": result}
+
+
+def _operand(value: Any):
+    """Convert a JSON operand to a number."""
+    if isinstance(value, str):
+        return InputValidator.validate_number(value)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise InvalidInputError(f"{json.dumps(value)} is not a valid number")
+    if isinstance(value, float) and not -_INFINITY < value < _INFINITY:
+        # NaN and Infinity, which json.loads() accepts but JSON does not have
+        raise InvalidInputError(f"{json.dumps(value)} is not a valid number")
+    return value
+
+
+def _parse_int(text: str) -> Any:
+    """
+    Convert a JSON integer, leaving it as text if it may be beyond the digit limit.
+
+    Converting decimal text to an int takes time quadratic in its length, so
+    long integers are not converted here; _operand() checks them as strings.
+    """
+    if len(text) > validation.MAX_NUMBER_DIGITS:
+        return text
+    return int(text)
+
+
+class CalculatorRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for the calculation endpoints."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        """Dispatch POST requests to the calculation endpoints."""
+        if self.path not in ("/calculate", "/calculate/batch"):
+            self._send_json(
+                404, {"error": "NotFound", "message": self.path}, close=True
+            )
+            return
+
+        payload = self._read_json()
+        if payload is _NO_BODY:
+            return
+
+        if self.path == "/calculate":
+            response = evaluate_item(self.server.calculator, payload)
+            self._send_json(200 if "result" in response else 422, response)
+        elif not isinstance(payload, list):
+            self._send_json(
+                400,
+                {
+                    "error": InvalidInputError.__name__,
+                    "message": "Batch body must be a JSON array",
+                },
+            )
+        else:
+            self._stream_batch(payload)
+
+    def _read_json(self) -> Any:
+        """Read and decode the JSON body, sending an error response on failure."""
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(
+                411,
+                {"error": "LengthRequired", "message": "Content-Length required"},
+                close=True,
+            )
+            return _NO_BODY
+        if length > MAX_BODY_SIZE:
+            self._send_json(
+                413,
+                {
+                    "error": "PayloadTooLarge",
+                    "message": f"Body exceeds {MAX_BODY_SIZE} bytes",
+                },
+                close=True,
+            )
+            return _NO_BODY
+
+        try:
+            return json.loads(self.rfile.read(length), parse_int=_parse_int)
+        except ValueError as e:
+            self._send_json(
+                400, {"error": InvalidInputError.__name__, "message": str(e)}
+            )
+            return _NO_BODY
+
+    def _stream_batch(self, items: list) -> None:
+        """Evaluate batch items, streaming the JSON array as it is produced."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        calculator = self.server.calculator
+        pending = ["["]
+        pending_size = 1
+        for index, item in enumerate(items):
+            piece = json.dumps(evaluate_item(calculator, item))
+            pending.append(piece if index == 0 else "," + piece)
+            pending_size += len(piece) + 1
+            if pending_size >= STREAM_CHUNK_SIZE:
+                self._write_chunk("".join(pending))
+                pending.clear()
+                pending_size = 0
+        pending.append("]")
+        self._write_chunk("".join(pending))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, text: str) -> None:
+        """Write one chunk of a chunked response."""
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+    def _send_json(
+        self, status: int, body: Dict[str, Any], close: bool = False
+    ) -> None:
+        """
+        Send a complete JSON response.
+
+        Responses sent without reading the request body close the
+        connection; the unread body would otherwise be taken for the next
+        request on it.
+        """
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if close:
+            # Also makes the handler close the connection after this response
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+
+def create_http_server(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_HTTP_PORT,
+    calculator: Optional[Calculator] = None,
+) -> ThreadingHTTPServer:
+    """
+    Create a threaded HTTP server for the calculation endpoints.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind; 0 picks a free port
+        calculator: Calculator shared by all requests
+
+    Returns:
+        The bound server; call serve_forever() to start handling requests
+    """
+    server = ThreadingHTTPServer((host, port), CalculatorRequestHandler)
+    server.calculator = calculator or Calculator()
+    return server
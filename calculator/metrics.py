@@ -0,0 +1,203 @@
+"""
+Per-operation call counters, error counters and latency histograms.
+
+Measurements are aggregated per thread, so recording never takes a lock; a
+lock is only used when a thread records for the first time or ends, and when
+a snapshot merges the per-thread tables. The table of a thread that has ended
+is folded into one aggregate, so short-lived threads, such as the HTTP
+server's per-connection threads, do not accumulate tables.
+"""
+
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from .exceptions import CalculatorError
+
+# Upper bounds of the latency histogram buckets in seconds: half-decade steps
+# from 100 ns to 1 s. Slower calls fall into a final +Inf bucket.
+LATENCY_BUCKETS: Tuple[float, ...] = tuple(
+    10 ** (exponent / 2) for exponent in range(-14, 1)
+)
+
+
+class _LabelStats:
+    """Measurements for one label recorded by a single thread."""
+
+    __slots__ = ("calls", "latency_sum", "histogram", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.latency_sum = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.errors: Dict[str, int] = {}
+
+    def add(
+        self,
+        calls: int,
+        latency_sum: float,
+        histogram: Sequence[int],
+        errors: Mapping[str, int],
+    ) -> None:
+        """Add the measurements of another thread or process."""
+        self.calls += calls
+        self.latency_sum += latency_sum
+        for index, count in enumerate(histogram):
+            self.histogram[index] += count
+        for error, count in errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+
+
+class _ThreadSentinel:
+    """Held by a thread's local storage only, so it dies with the thread."""
+
+
+class OperationMetrics:
+    """Collects call counts, error counts and latency histograms by label."""
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Table of each live thread, by id() of the table
+        self._threads: Dict[int, Dict[str, _LabelStats]] = {}
+        # Measurements of threads that have ended
+        self._retired: Dict[str, _LabelStats] = {}
+
+    def _thread_table(self) -> Dict[str, _LabelStats]:
+        """Return the calling thread's table, creating it on first use."""
+        try:
+            return self._local.table
+        except AttributeError:
+            table: Dict[str, _LabelStats] = {}
+            with self._lock:
+                self._threads[id(table)] = table
+            self._local.table = table
+            # The thread's local storage is cleared when the thread ends
+            sentinel = self._local.sentinel = _ThreadSentinel()
+            weakref.finalize(sentinel, self._retire, table).atexit = False
+            return table
+
+    def _retire(self, table: Dict[str, _LabelStats]) -> None:
+        """Fold the table of an ended thread into the retired aggregate."""
+        with self._lock:
+            # Tables discarded by reset() are not folded
+            if self._threads.pop(id(table), None) is table:
+                self._add_table(self._retired, table)
+
+    @staticmethod
+    def _add_table(
+        target: Dict[str, _LabelStats], table: Dict[str, _LabelStats]
+    ) -> None:
+        """Add every label's measurements of a table to a target table."""
+        for label, stats in list(table.items()):
+            target.setdefault(label, _LabelStats()).add(
+                stats.calls, stats.latency_sum, list(stats.histogram), stats.errors
+            )
+
+    def record(self, label: str, seconds: float, error: Optional[str] = None) -> None:
+        """
+        Record one call.
+
+        Args:
+            label: Operation label, normally the operation symbol
+            seconds: Call latency in seconds
+            error: Exception class name if the call failed
+        """
+        try:
+            stats = self._local.table[label]
+        except (AttributeError, KeyError):
+            stats = self._thread_table().setdefault(label, _LabelStats())
+
+        stats.calls += 1
+        stats.latency_sum += seconds
+        stats.histogram[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if error is not None:
+            stats.errors[error] = stats.errors.get(error, 0) + 1
+
+    def merge(self, snapshot: Mapping[str, Dict]) -> None:
+        """
+        Add the measurements of a snapshot, e.g. one taken in another process.
+
+        Args:
+            snapshot: Result of snapshot()
+        """
+        with self._lock:
+            for label, entry in snapshot.items():
+                self._retired.setdefault(label, _LabelStats()).add(
+                    entry["calls"],
+                    entry["latency_sum"],
+                    [count for _, count in entry["histogram"]],
+                    entry["errors"],
+                )
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Merge the per-thread tables into one snapshot.
+
+        Returns:
+            Mapping of label to {"calls", "errors", "latency_sum", "histogram"}
+            where "errors" maps exception class names to counts and
+            "histogram" is a list of (upper_bound_seconds, count) pairs ending
+            with an infinite bound. Bucket counts are not cumulative.
+        """
+        merged: Dict[str, _LabelStats] = {}
+        with self._lock:
+            threads = list(self._threads.values())
+            self._add_table(merged, self._retired)
+        for table in threads:
+            self._add_table(merged, table)
+
+        bounds = LATENCY_BUCKETS + (float("inf"),)
+        return {
+            label: {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "latency_sum": stats.latency_sum,
+                "histogram": list(zip(bounds, stats.histogram)),
+            }
+            for label, stats in merged.items()
+        }
+
+    def reset(self) -> None:
+        """Discard all recorded measurements."""
+        with self._lock:
+            self._threads = {}
+            self._retired = {}
+            # The old storage is released after the lock: the finalizers of its
+            # sentinels take the lock, then find their tables discarded
+            local, self._local = self._local, threading.local()
+        del local
+
+
+def timed(function: Callable, metrics: OperationMetrics, label: str) -> Callable:
+    """
+    Wrap a function so every call is recorded under one label.
+
+    Calls raising a CalculatorError are recorded with the exception class name
+    before the exception propagates.
+
+    Args:
+        function: Function to wrap
+        metrics: Metrics receiving the measurements
+        label: Label to record calls under
+
+    Returns:
+        The wrapped function
+    """
+    perf_counter = time.perf_counter
+    record = metrics.record
+
+    def wrapper(*args):
+        start = perf_counter()
+        try:
+            result = function(*args)
+        except CalculatorError as e:
+            record(label, perf_counter() - start, type(e).__name__)
+            raise
+        record(label, perf_counter() - start)
+        return result
+
+    return wrapper
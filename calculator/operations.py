@@ -3,12 +3,48 @@ Operation classes implementing arithmetic operations using OOP principles.
 """
 
 from abc import ABC, abstractmethod
-from typing import Union
-
-from .exceptions import DivisionByZeroError, OverflowError
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from .dispatch import (
+    add,
+    add_value,
+    bounded_multiply,
+    divide,
+    divide_value,
+    multiply,
+    multiply_value,
+    subtract,
+    subtract_value,
+)
+from .exceptions import CalculatorError, DivisionByZeroError, OverflowError
+from .status import OK, Outcome, Status, unwrap
 
 Number = Union[int, float]
 
+_NOT_LOADED: Any = object()
+
+# NumPy costs more to import than the rest of the package together and only
+# column operations use it, so it is imported by load_numpy() on first use.
+# None once loading has found it unavailable.
+np: Any = _NOT_LOADED
+
+
+def load_numpy() -> Any:
+    """
+    Import NumPy on first use.
+
+    Returns:
+        The numpy module, or None if it is not installed
+    """
+    global np
+    if np is _NOT_LOADED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = None
+        np = numpy
+    return np
+
 
 class Operation(ABC):
     """Abstract base class for all mathematical operations."""
@@ -30,6 +66,124 @@ class Operation(ABC):
         """
         pass
 
+    def try_execute(self, a: Number, b: Number) -> Outcome:
+        """
+        Execute the operation without raising for calculation errors.
+
+        Operations that only implement execute() get this default, which
+        converts the exceptions of the standard error statuses; exceptions of
+        any other class propagate.
+
+        Args:
+            a: First operand
+            b: Second operand
+
+        Returns:
+            (Status.OK, result) or (error status, error message)
+        """
+        try:
+            return OK, self.execute(a, b)
+        except CalculatorError as e:
+            status = Status.for_exception(e)
+            if status is None:
+                raise
+            return status, str(e)
+
+    def execute_array(
+        self, a: Sequence[Number], b: Sequence[Number]
+    ) -> Tuple[Any, List[Optional[str]]]:
+        """
+        Execute the operation element-wise over two columns of operands.
+
+        Uses vectorized NumPy kernels when NumPy is installed, computing in
+        float64; otherwise, or when an int operand is beyond float range,
+        falls back to calling execute() for every row.
+
+        Args:
+            a: First operand column
+            b: Second operand column
+
+        Returns:
+            Tuple of (results, error_codes). Failed rows hold NaN in results
+            and the exception class name in error_codes; successful rows have
+            an error code of None. Results are a float64 ndarray on the NumPy
+            path and a list on the pure-Python path.
+
+        Raises:
+            ValueError: If the operand columns differ in length
+        """
+        if load_numpy() is None:
+            return self._execute_array_python(a, b)
+
+        try:
+            first = np.asarray(a, dtype=np.float64)
+            second = np.asarray(b, dtype=np.float64)
+        except ArithmeticError:
+            # An int operand beyond float range; execute() handles it exactly
+            results, error_codes = self._execute_array_python(a, b)
+            return np.array(results, dtype=np.float64), error_codes
+        if first.shape != second.shape:
+            raise ValueError(
+                f"Operand columns differ in shape: {first.shape} != {second.shape}"
+            )
+
+        with np.errstate(all="ignore"):
+            results = self._array_kernel(first, second)
+        if results is None:
+            return self._execute_array_python(a, b)
+
+        error_codes: List[Optional[str]] = [None] * results.size
+        zero_mask = self._zero_division_mask(second)
+        overflow_mask = np.abs(results) > 1e308
+        if zero_mask is not None:
+            overflow_mask &= ~zero_mask
+            for index in np.flatnonzero(zero_mask).tolist():
+                error_codes[index] = DivisionByZeroError.__name__
+            results[zero_mask] = np.nan
+        for index in np.flatnonzero(overflow_mask).tolist():
+            error_codes[index] = OverflowError.__name__
+        results[overflow_mask] = np.nan
+
+        return results, error_codes
+
+    def _execute_array_python(
+        self, a: Sequence[Number], b: Sequence[Number]
+    ) -> Tuple[List[Number], List[Optional[str]]]:
+        """Pure-Python fallback for execute_array()."""
+        if len(a) != len(b):
+            raise ValueError(f"Operand columns differ in length: {len(a)} != {len(b)}")
+
+        try_execute = self.try_execute
+        results: List[Number] = []
+        error_codes: List[Optional[str]] = []
+        for first, second in zip(a, b):
+            try:
+                status, value = try_execute(first, second)
+            except CalculatorError as e:
+                status, value = None, e
+            if status is OK:
+                results.append(value)
+                error_codes.append(None)
+            else:
+                results.append(float("nan"))
+                error_codes.append(
+                    status.value if status is not None else type(value).__name__
+                )
+        return results, error_codes
+
+    def _array_kernel(self, a: Any, b: Any) -> Any:
+        """
+        Apply the operation to two float64 arrays.
+
+        Subclasses without a vectorized kernel return None, which makes
+        execute_array() use the pure-Python path.
+        """
+        return None
+
+    def _zero_division_mask(self, b: Any) -> Any:
+        """Return a mask of rows that divide by zero, or None if not applicable."""
+        return None
+
     @abstractmethod
     def get_symbol(self) -> str:
         """Get the symbol representing this operation."""
@@ -44,16 +198,13 @@ class Operation(ABC):
 class Addition(Operation):
     """Addition operation implementation."""
 
-    def execute(self, a: Number, b: Number) -> Number:
-        """Add two numbers."""
-        try:
-            result = a + b
-            # Check for overflow in extreme cases
-            if abs(result) > 1e308:
-                raise OverflowError(f"Addition result {result} causes overflow")
-            return result
-        except (OverflowError, ValueError) as e:
-            raise OverflowError(f"Addition overflow: {a} + {b}") from e
+    # Plain functions shared with Calculator's dispatch tables
+    execute = staticmethod(add_value)
+    try_execute = staticmethod(add)
+
+    def _array_kernel(self, a: Any, b: Any) -> Any:
+        """Add two float64 arrays element-wise."""
+        return np.add(a, b)
 
     def get_symbol(self) -> str:
         """Return the addition symbol."""
@@ -67,16 +218,13 @@ class Addition(Operation):
 class Subtraction(Operation):
     """Subtraction operation implementation."""
 
-    def execute(self, a: Number, b: Number) -> Number:
-        """Subtract second number from first."""
-        try:
-            result = a - b
-            # Check for overflow in extreme cases
-            if abs(result) > 1e308:
-                raise OverflowError(f"Subtraction result {result} causes overflow")
-            return result
-        except (OverflowError, ValueError) as e:
-            raise OverflowError(f"Subtraction overflow: {a} - {b}") from e
+    # Plain functions shared with Calculator's dispatch tables
+    execute = staticmethod(subtract_value)
+    try_execute = staticmethod(subtract)
+
+    def _array_kernel(self, a: Any, b: Any) -> Any:
+        """Subtract two float64 arrays element-wise."""
+        return np.subtract(a, b)
 
     def get_symbol(self) -> str:
         """Return the subtraction symbol."""
@@ -90,16 +238,37 @@ class Subtraction(Operation):
 class Multiplication(Operation):
     """Multiplication operation implementation."""
 
-    def execute(self, a: Number, b: Number) -> Number:
-        """Multiply two numbers."""
-        try:
-            result = a * b
-            # Check for overflow in extreme cases
-            if abs(result) > 1e308:
-                raise OverflowError(f"Multiplication result {result} causes overflow")
-            return result
-        except (OverflowError, ValueError) as e:
-            raise OverflowError(f"Multiplication overflow: {a} * {b}") from e
+    def __init__(self, max_bits: Optional[int] = None):
+        """
+        Initialize the operation.
+
+        Args:
+            max_bits: Largest bit length of an int product; longer products
+                are reported as overflows without being computed where the
+                operands' bit lengths decide it. By default int products are
+                only limited by the overflow limit.
+
+        Raises:
+            ValueError: If max_bits is negative
+        """
+        if max_bits is not None:
+            if max_bits < 0:
+                raise ValueError(f"max_bits must not be negative, got {max_bits}")
+            self.try_execute = bounded_multiply(max_bits)
+            self.execute = self._execute_bounded
+        self.max_bits = max_bits
+
+    def _execute_bounded(self, a: Number, b: Number) -> Number:
+        """Multiply two numbers, bounding the bit length of int products."""
+        return unwrap(self.try_execute(a, b))
+
+    # Plain functions shared with Calculator's dispatch tables
+    execute = staticmethod(multiply_value)
+    try_execute = staticmethod(multiply)
+
+    def _array_kernel(self, a: Any, b: Any) -> Any:
+        """Multiply two float64 arrays element-wise."""
+        return np.multiply(a, b)
 
     def get_symbol(self) -> str:
         """Return the multiplication symbol."""
@@ -113,19 +282,17 @@ class Multiplication(Operation):
 class Division(Operation):
     """Division operation implementation."""
 
-    def execute(self, a: Number, b: Number) -> Number:
-        """Divide first number by second."""
-        if b == 0:
-            raise DivisionByZeroError("Division by zero is not allowed")
+    # Plain functions shared with Calculator's dispatch tables
+    execute = staticmethod(divide_value)
+    try_execute = staticmethod(divide)
 
-        try:
-            result = a / b
-            # Check for overflow in extreme cases
-            if abs(result) > 1e308:
-                raise OverflowError(f"Division result {result} causes overflow")
-            return result
-        except (OverflowError, ValueError) as e:
-            raise OverflowError(f"Division overflow: {a} / {b}") from e
+    def _array_kernel(self, a: Any, b: Any) -> Any:
+        """Divide two float64 arrays element-wise."""
+        return np.divide(a, b)
+
+    def _zero_division_mask(self, b: Any) -> Any:
+        """Flag rows whose divisor is zero."""
+        return b == 0
 
     def get_symbol(self) -> str:
         """Return the division symbol."""
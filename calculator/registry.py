@@ -0,0 +1,176 @@
+"""
+Registry of operations declared by symbol and import path.
+
+Operations are registered as "module:Class" specs (or Operation subclasses)
+and are only imported and instantiated when their symbol is first used, so
+the number of registered operations does not affect startup time. Operations
+that take constructor arguments can be registered as ready-made instances.
+
+Third-party packages can contribute operations through the
+"calculator.operations" entry point group, naming each entry point after the
+operation symbol:
+
+    [project.entry-points."calculator.operations"]
+    "%" = "my_package.operations:Modulo"
+
+or register them at runtime with register_operation().
+"""
+
+import threading
+from importlib import import_module
+from typing import Dict, Iterator, Mapping, Optional, Type, Union
+
+from .operations import Operation
+
+ENTRY_POINT_GROUP = "calculator.operations"
+
+BUILTIN_OPERATIONS: Dict[str, str] = {
+    "+": "calculator.operations:Addition",
+    "-": "calculator.operations:Subtraction",
+    "*": "calculator.operations:Multiplication",
+    "/": "calculator.operations:Division",
+}
+
+OperationSpec = Union[str, Type[Operation], Operation]
+
+
+def _entry_point_specs(group: str) -> Dict[str, str]:
+    """Read operation specs advertised by installed distributions."""
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        selected = entry_points.select(group=group)
+    else:  # pragma: no cover - Python < 3.10
+        selected = entry_points.get(group, ())
+    return {entry_point.name: entry_point.value for entry_point in selected}
+
+
+class OperationRegistry(Mapping[str, Operation]):
+    """
+    Read-only mapping of operation symbol to Operation instance, loaded lazily.
+
+    Membership tests only consult the registered specs; an operation's module
+    is imported the first time the operation itself is looked up.
+    """
+
+    def __init__(
+        self,
+        specs: Optional[Mapping[str, OperationSpec]] = None,
+        entry_point_group: Optional[str] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            specs: Initial mapping of symbol to "module:Class" spec, class or
+                instance
+            entry_point_group: Entry point group to discover further operations
+                from, read the first time an unregistered symbol is requested;
+                None disables discovery
+        """
+        self._specs: Dict[str, OperationSpec] = dict(specs or {})
+        self._loaded: Dict[str, Operation] = {}
+        self._entry_point_group = entry_point_group
+        self._lock = threading.Lock()
+
+    def register(self, symbol: str, spec: OperationSpec) -> None:
+        """
+        Register an operation.
+
+        Args:
+            symbol: Operation symbol, e.g. "%"
+            spec: "module:Class" import path, Operation subclass or instance
+
+        Raises:
+            ValueError: If the symbol is already registered
+        """
+        self._discover()
+        with self._lock:
+            if symbol in self._specs:
+                raise ValueError(f"Operation '{symbol}' is already registered")
+            self._specs[symbol] = spec
+
+    def unregister(self, symbol: str) -> None:
+        """
+        Remove an operation.
+
+        Raises:
+            KeyError: If the symbol is not registered
+        """
+        self._discover()
+        with self._lock:
+            del self._specs[symbol]
+            self._loaded.pop(symbol, None)
+
+    def _discover(self) -> None:
+        """Merge entry point specs in, once; explicit registrations win."""
+        group = self._entry_point_group
+        if group is None:
+            return
+        specs = _entry_point_specs(group)
+        with self._lock:
+            for symbol, spec in specs.items():
+                self._specs.setdefault(symbol, spec)
+            self._entry_point_group = None
+
+    def _load(self, symbol: str) -> Operation:
+        """Import and instantiate the operation registered for a symbol."""
+        spec = self._specs[symbol]
+        if isinstance(spec, str):
+            module_name, _, class_name = spec.partition(":")
+            spec = getattr(import_module(module_name), class_name)
+
+        operation = spec if isinstance(spec, Operation) else spec()
+        if not isinstance(operation, Operation):
+            raise TypeError(f"Operation '{symbol}' ({spec!r}) is not an Operation")
+        if operation.get_symbol() != symbol:
+            raise ValueError(
+                f"Operation registered as '{symbol}' reports symbol "
+                f"'{operation.get_symbol()}'"
+            )
+        self._loaded[symbol] = operation
+        return operation
+
+    def __getitem__(self, symbol: str) -> Operation:
+        """Return the operation for a symbol, loading it on first use."""
+        operation = self._loaded.get(symbol)
+        if operation is not None:
+            return operation
+        if symbol not in self:
+            raise KeyError(symbol)
+        return self._load(symbol)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Check whether a symbol is registered without loading it."""
+        if symbol in self._specs:
+            return True
+        self._discover()
+        return symbol in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the registered symbols."""
+        self._discover()
+        return iter(list(self._specs))
+
+    def __len__(self) -> int:
+        """Return the number of registered operations."""
+        self._discover()
+        return len(self._specs)
+
+
+default_registry = OperationRegistry(BUILTIN_OPERATIONS, ENTRY_POINT_GROUP)
+
+
+def register_operation(symbol: str, spec: OperationSpec) -> None:
+    """
+    Register an operation with the registry used by new Calculator instances.
+
+    Args:
+        symbol: Operation symbol, e.g. "%"
+        spec: "module:Class" import path, Operation subclass or instance
+
+    Raises:
+        ValueError: If the symbol is already registered
+    """
+    default_registry.register(symbol, spec)
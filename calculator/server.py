@@ -0,0 +1,241 @@
+"""
+Asyncio TCP calculation server with request pipelining.
+
+The protocol is line based: each request is one expression terminated by a
+newline, and each response is one line, either "OK <result>" or
+"ERR <ErrorClass> <message>". Clients may send many requests without waiting
+for responses; responses are always returned in request order.
+
+The module also contains a load-generator client that measures throughput and
+latency percentiles against a running server.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import List, NamedTuple, Optional, Sequence
+
+from . import validation
+from .calculator import Calculator
+from .exceptions import InvalidInputError
+from .expression import evaluate_input
+from .validation import InputValidator
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Longest UTF-8 encoding of a character; with the line break, a request of
+# validation.MAX_LINE_LENGTH characters fits in this many bytes per character
+_UTF8_MAX_BYTES = 4
+
+
+def stream_limit() -> int:
+    """
+    Return the stream buffer size in bytes for the current input limits.
+
+    It holds any request line within validation.MAX_LINE_LENGTH characters,
+    so that longer lines are rejected by the validator with its usual message.
+    """
+    return _UTF8_MAX_BYTES * validation.MAX_LINE_LENGTH + len("\r\n")
+
+
+class CalculationServer:
+    """Line-oriented TCP server evaluating expressions with a shared Calculator."""
+
+    def __init__(
+        self,
+        calculator: Optional[Calculator] = None,
+        validator: Optional[InputValidator] = None,
+    ):
+        """
+        Initialize the server.
+
+        The stream buffer size follows the input limits in effect when the
+        server is created.
+
+        Args:
+            calculator: Calculator shared by all connections
+            validator: Validator shared by all connections
+        """
+        self.calculator = calculator or Calculator()
+        self.validator = validator or InputValidator()
+        self.stream_limit = stream_limit()
+
+    def respond(self, request: bytes) -> bytes:
+        """
+        Evaluate one request line and build its response line.
+
+        Args:
+            request: Raw request line
+
+        Returns:
+            Response line including the trailing newline; unexpected
+            exceptions are answered with an error line too, so that one
+            request cannot end the connection
+        """
+        try:
+            expression = request.decode("utf-8")
+        except UnicodeDecodeError:
+            return _error_line(InvalidInputError("Request is not valid UTF-8"))
+
+        try:
+            result = evaluate_input(self.calculator, self.validator, expression)
+        except Exception as e:
+            return _error_line(e)
+        return f"OK {result}\n".encode("utf-8")
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection until it closes."""
+        try:
+            while True:
+                try:
+                    request = await reader.readline()
+                except ValueError:
+                    # The line did not fit in the stream buffer; the rest of
+                    # the stream cannot be framed reliably, so close it.
+                    writer.write(
+                        _error_line(
+                            InvalidInputError(
+                                f"Request exceeds {self.stream_limit} bytes"
+                            )
+                        )
+                    )
+                    break
+                if not request:
+                    break
+                writer.write(self.respond(request))
+                # Returns immediately unless the client is not reading responses
+                await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+    ) -> asyncio.AbstractServer:
+        """
+        Start listening for connections.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind; 0 picks a free port
+
+        Returns:
+            The running asyncio server
+        """
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=self.stream_limit
+        )
+
+
+def _error_line(error: Exception) -> bytes:
+    """Build an error response line."""
+    return f"ERR {type(error).__name__} {error}\n".encode("utf-8")
+
+
+def run_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    calculator: Optional[Calculator] = None,
+    validator: Optional[InputValidator] = None,
+) -> None:
+    """Run a calculation server until interrupted."""
+
+    async def serve() -> None:
+        server = await CalculationServer(calculator, validator).start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+class LoadReport(NamedTuple):
+    """Result of a load-generator run."""
+
+    requests: int
+    seconds: float
+    throughput: float
+    p50_latency: float
+    p99_latency: float
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Return the value at a fraction (0-1) of an ascending sequence."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run_load(
+    host: str,
+    port: int,
+    requests: Sequence[str],
+    connections: int = 1,
+    pipeline_depth: int = 64,
+) -> LoadReport:
+    """
+    Send requests to a server and measure throughput and latency.
+
+    Each connection sends its share of the requests with up to pipeline_depth
+    requests in flight at once.
+
+    Args:
+        host: Server host
+        port: Server port
+        requests: Expressions to send
+        connections: Number of concurrent connections
+        pipeline_depth: Maximum unanswered requests per connection
+
+    Returns:
+        Throughput in requests per second and latency percentiles in seconds
+    """
+    latencies: List[float] = []
+    shares = [requests[index::connections] for index in range(connections)]
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _drive_connection(host, port, share, pipeline_depth, latencies)
+            for share in shares
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return LoadReport(
+        len(latencies),
+        elapsed,
+        len(latencies) / elapsed,
+        percentile(latencies, 0.50),
+        percentile(latencies, 0.99),
+    )
+
+
+async def _drive_connection(
+    host: str,
+    port: int,
+    requests: Sequence[str],
+    pipeline_depth: int,
+    latencies: List[float],
+) -> None:
+    """Pipeline requests over one connection, recording each latency."""
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at: deque = deque()
+    next_request = 0
+
+    try:
+        for _ in range(len(requests)):
+            while next_request < len(requests) and len(sent_at) < pipeline_depth:
+                writer.write(requests[next_request].encode("utf-8") + b"\n")
+                sent_at.append(time.perf_counter())
+                next_request += 1
+            await writer.drain()
+            await reader.readline()
+            latencies.append(time.perf_counter() - sent_at.popleft())
+    finally:
+        writer.close()
+        await writer.wait_closed()
@@ -0,0 +1,13 @@
+"""
+Settings shared by the command line and the modules that implement them.
+
+This module imports nothing, so main.py can build its argument parser
+without loading the batch writers or the metrics exporter.
+"""
+
+# Buffer size of batch input and output streams
+BATCH_BUFFER_SIZE = 1024 * 1024
+# Output formats of batch mode
+OUTPUT_FORMATS = ("plain", "csv", "ndjson")
+# Seconds between rewrites of a metrics textfile
+DEFAULT_TEXTFILE_INTERVAL = 15.0
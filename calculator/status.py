@@ -0,0 +1,87 @@
+"""
+Result codes for the exception-free calculator API.
+
+The try_* functions (InputValidator.try_parse, Operation.try_execute,
+Calculator.try_calculate, ...) return an (status, value) pair instead of
+raising: value is the result when status is Status.OK, and the error message
+otherwise. Each error status is named after the exception the raising API
+throws for it.
+"""
+
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple, Type
+
+from .exceptions import (
+    CalculatorError,
+    DivisionByZeroError,
+    InvalidInputError,
+    InvalidOperationError,
+    OverflowError,
+)
+
+
+class Status(Enum):
+    """Outcome of a try_* call; error values are exception class names."""
+
+    OK = "OK"
+    INVALID_INPUT = "InvalidInputError"
+    INVALID_OPERATION = "InvalidOperationError"
+    DIVISION_BY_ZERO = "DivisionByZeroError"
+    OVERFLOW = "OverflowError"
+
+    @property
+    def exception(self) -> Optional[Type[CalculatorError]]:
+        """Exception class raised for this status, or None for OK."""
+        return _EXCEPTIONS.get(self)
+
+    @classmethod
+    def for_exception(cls, error: CalculatorError) -> Optional["Status"]:
+        """
+        Get the status for an exception.
+
+        Returns:
+            The matching status, or None if the exception's exact class has no
+            status (e.g. a CalculatorError subclass defined by a plugin)
+        """
+        return _STATUSES.get(type(error))
+
+
+Outcome = Tuple[Status, Any]
+
+# Members as module constants for per-row code: attribute lookups on an Enum
+# class cost more than the arithmetic they would guard.
+OK = Status.OK
+INVALID_INPUT = Status.INVALID_INPUT
+INVALID_OPERATION = Status.INVALID_OPERATION
+DIVISION_BY_ZERO = Status.DIVISION_BY_ZERO
+OVERFLOW = Status.OVERFLOW
+
+_EXCEPTIONS: Dict[Status, Type[CalculatorError]] = {
+    Status.INVALID_INPUT: InvalidInputError,
+    Status.INVALID_OPERATION: InvalidOperationError,
+    Status.DIVISION_BY_ZERO: DivisionByZeroError,
+    Status.OVERFLOW: OverflowError,
+}
+_STATUSES: Dict[Type[CalculatorError], Status] = {
+    exception: status for status, exception in _EXCEPTIONS.items()
+}
+
+
+def unwrap(outcome: Outcome) -> Any:
+    """
+    Convert an outcome back to the raising API.
+
+    Args:
+        outcome: (status, value) pair returned by a try_* call
+
+    Returns:
+        The value if the status is OK
+
+    Raises:
+        CalculatorError: The exception class of the status, with the value as
+            its message
+    """
+    status, value = outcome
+    if status is OK:
+        return value
+    raise status.exception(value)
@@ -3,39 +3,231 @@ Input validation utilities for the calculator application.
 """
 
 import re
-from typing import Tuple, Union
+import sys
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
 
+from .cache import CacheInfo, LRUCache
 from .exceptions import InvalidInputError
+from .status import INVALID_INPUT, OK, Outcome, unwrap
 
 Number = Union[int, float]
 
+_NUMBER_PATTERN = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+# _NUMBER_PATTERN capturing the sign, whole digits, fraction digits and exponent
+_NUMBER_PARTS_PATTERN = re.compile(r"([-+]?)(?=\.?\d)(\d*)\.?(\d*)(?:[eE]([-+]?\d+))?")
+
+# Single-pass pattern for "number operation number", surrounding whitespace
+# included. The fraction and exponent of each operand are captured as a tail
+# group so the operand type is known from the match itself, without rescanning
+# the operand text.
+_OPERAND = r"([-+]?\d+((?:\.\d+)?(?:[eE][-+]?\d+)?))"
+_CALCULATION_PATTERN = re.compile(
+    r"\s*" + _OPERAND + r"\s*([\+\-\*/])\s*" + _OPERAND + r"\s*"
+)
+_match_calculation = _CALCULATION_PATTERN.fullmatch
+
+# The same grammar over raw bytes, matching whole LF or CRLF terminated lines
+# of a buffer in one scan. Whitespace excludes line breaks, so a line holding
+# any other CR is left to the str parser and its universal newline handling.
+_BLANK = rb"[ \t\f\v]*"
+_BYTES_LINE_PATTERN = re.compile(
+    rb"^"
+    + _BLANK
+    + _OPERAND.encode()
+    + _BLANK
+    + rb"([\+\-\*/])"
+    + _BLANK
+    + _OPERAND.encode()
+    + _BLANK
+    + rb"\r?$",
+    re.MULTILINE,
+)
+_BYTES_OPERATIONS = {b"+": "+", b"-": "-", b"*": "*", b"/": "/"}
+
+_VALID_OPERATIONS = frozenset({"+", "-", "*", "/"})
+
+PARSE_CACHE_SIZE = 4096
+
+# Input limits. Converting a decimal string to an int takes time quadratic in
+# its length, and older Pythons do not limit it, so both limits are checked by
+# length before any pattern match or conversion runs. The digit limit matches
+# the default limit of int() since Python 3.11. Change them with
+# set_input_limits().
+MAX_LINE_LENGTH = 16 * 1024
+MAX_NUMBER_DIGITS = 4300
+
+_INFINITY = float("inf")
+_FLOAT_MAX = sys.float_info.max
+_OUT_OF_RANGE = frozenset({_INFINITY, -_INFINITY})
+
+# Largest magnitude of a scaled fixed-point value, so that values fit in int64
+FIXED_POINT_MAX = 2**63 - 1
+_FIXED_POINT_DIGITS = len(str(FIXED_POINT_MAX))
+_POWERS_OF_TEN = tuple(10**power for power in range(_FIXED_POINT_DIGITS + 1))
+# Exponents are clamped to this magnitude before use; any number with a larger
+# exponent is out of range or has too many decimal places either way
+_MAX_EXPONENT = 10**6
+
+
+def set_input_limits(
+    max_line_length: Optional[int] = None, max_number_digits: Optional[int] = None
+) -> None:
+    """
+    Change the input limits of every parser in the process.
+
+    Set limits before creating caching validators and calculators: parses and
+    programs they have already cached keep the limits they were made under.
+
+    Args:
+        max_line_length: Most characters in one line of input, including
+            expressions; None keeps the current limit
+        max_number_digits: Most digits in one number; None keeps the current
+            limit. Since Python 3.11 int() has a limit of its own, which
+            sys.set_int_max_str_digits() raises
+
+    Raises:
+        ValueError: If a limit is less than 1
+    """
+    global MAX_LINE_LENGTH, MAX_NUMBER_DIGITS
+    for limit in (max_line_length, max_number_digits):
+        if limit is not None and limit < 1:
+            raise ValueError(f"Input limits must be at least 1, got {limit}")
+    if max_line_length is not None:
+        MAX_LINE_LENGTH = max_line_length
+    if max_number_digits is not None:
+        MAX_NUMBER_DIGITS = max_number_digits
+
+
+def _too_many_digits(number_str: str) -> Optional[str]:
+    """
+    Check a number against MAX_NUMBER_DIGITS without matching it.
+
+    Returns:
+        The error message, or None if the number is within the limit
+    """
+    # The length bounds the digit count; only long input is counted exactly
+    if len(number_str) <= MAX_NUMBER_DIGITS:
+        return None
+    digits = sum(map(str.isdigit, number_str))
+    if digits <= MAX_NUMBER_DIGITS:
+        return None
+    return f"Number has {digits} digits; the limit is {MAX_NUMBER_DIGITS}"
+
+
+def _line_too_long(input_str: str) -> str:
+    """Build the error message for a line beyond MAX_LINE_LENGTH."""
+    return f"Input is {len(input_str)} characters long; the limit is {MAX_LINE_LENGTH}"
+
+
+def _operand_type(text: str) -> Optional[type]:
+    """
+    Scan one operand against the grammar of _OPERAND without a regex.
+
+    Returns:
+        int or float, whichever converts the operand, or None if the text is
+        not a valid operand
+    """
+    digits = text[1:] if text[0] in "+-" else text
+    if digits.isdecimal():
+        return int
+    mantissa, exponent_mark, exponent = digits.replace("E", "e").partition("e")
+    if exponent_mark:
+        if exponent[:1] in ("+", "-"):
+            exponent = exponent[1:]
+        if not exponent.isdecimal():
+            return None
+    whole, point, fraction = mantissa.partition(".")
+    if whole.isdecimal() and (fraction.isdecimal() or not point):
+        return float
+    return None
+
+
+def _parse_simple(input_str: str) -> Optional[Tuple[Number, str, Number]]:
+    """
+    Parse the usual input of try_parse() without matching a pattern.
+
+    The usual input is a short, valid line in range with whitespace around
+    the operation. It is split into its three words, which are scanned by
+    hand.
+
+    Returns:
+        (first_number, operation, second_number), or None if the line needs
+        the pattern, checks and error messages of try_parse()
+    """
+    # A line within both limits cannot hold a number beyond the digit limit
+    length = len(input_str)
+    if length > MAX_NUMBER_DIGITS or length > MAX_LINE_LENGTH:
+        return None
+    words = input_str.split()
+    if len(words) != 3 or words[1] not in _VALID_OPERATIONS:
+        return None
+    first_str, operation, second_str = words
+    # Unsigned ints, the most common operands, are recognized without a call
+    first_type = int if first_str.isdecimal() else _operand_type(first_str)
+    second_type = int if second_str.isdecimal() else _operand_type(second_str)
+    if first_type is None or second_type is None:
+        return None
+    try:
+        first_number = first_type(first_str)
+        second_number = second_type(second_str)
+    except ValueError:
+        # Beyond the digit limit of int() itself
+        return None
+    # Ints are never out of range
+    if first_number in _OUT_OF_RANGE or second_number in _OUT_OF_RANGE:
+        return None
+    return first_number, operation, second_number
+
 
 class InputValidator:
     """Validates and parses user input for the calculator."""
 
     @staticmethod
-    def validate_number(input_str: str) -> Number:
+    def validate_number(input_str: str, scale: Optional[int] = None) -> Number:
         """
         Validate and convert string input to a number.
 
         Args:
             input_str: String input from user
+            scale: Number of decimal places of a fixed-point value; when
+                given, the number is returned as an int scaled by 10**scale
 
         Returns:
-            The converted number (int or float)
+            The converted number (int or float), or the scaled int
 
         Raises:
             InvalidInputError: If the input cannot be converted to a number
         """
+        return unwrap(InputValidator.try_validate_number(input_str, scale))
+
+    @staticmethod
+    def try_validate_number(input_str: str, scale: Optional[int] = None) -> Outcome:
+        """
+        Convert string input to a number without raising.
+
+        Args:
+            input_str: String input from user
+            scale: Number of decimal places of a fixed-point value; see
+                validate_number()
+
+        Returns:
+            (Status.OK, number) or (Status.INVALID_INPUT, error message)
+        """
         input_str = input_str.strip()
 
         if not input_str:
-            raise InvalidInputError("Empty input is not a valid number")
+            return INVALID_INPUT, "Empty input is not a valid number"
+
+        message = _too_many_digits(input_str)
+        if message is not None:
+            return INVALID_INPUT, message
+
+        if scale is not None:
+            return InputValidator._try_scale(input_str, scale)
 
         # Check for valid number pattern (including negative numbers and scientific notation)
-        number_pattern = r"^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$"
-        if not re.match(number_pattern, input_str):
-            raise InvalidInputError(f"'{input_str}' is not a valid number format")
+        if not _NUMBER_PATTERN.fullmatch(input_str):
+            return INVALID_INPUT, f"'{input_str}' is not a valid number format"
 
         try:
             # Try to convert to int first if it's a whole number
@@ -43,20 +235,159 @@ class InputValidator:
                 result = int(input_str)
             else:
                 result = float(input_str)
+        except (ValueError, OverflowError):
+            return INVALID_INPUT, f"'{input_str}' is not a valid number"
 
-            # Check for infinity or NaN
-            if isinstance(result, float):
-                if not (float("-inf") < result < float("inf")):
-                    raise InvalidInputError(f"Number '{input_str}' is out of range")
-                if result != result:  # Check for NaN  # pragma: no cover
-                    raise InvalidInputError(
-                        f"'{input_str}' resulted in an invalid number"
-                    )  # pragma: no cover
+        # Check for infinity or NaN
+        if isinstance(result, float):
+            if not (float("-inf") < result < float("inf")):
+                return INVALID_INPUT, f"Number '{input_str}' is out of range"
+            if result != result:  # Check for NaN  # pragma: no cover
+                return (
+                    INVALID_INPUT,
+                    f"'{input_str}' resulted in an invalid number",
+                )  # pragma: no cover
 
-            return result
+        return OK, result
 
-        except (ValueError, OverflowError):
-            raise InvalidInputError(f"'{input_str}' is not a valid number")
+    @staticmethod
+    def _try_scale(input_str: str, scale: int) -> Outcome:
+        """
+        Convert a stripped, non-empty string to an int scaled by 10**scale.
+
+        The digits are shifted as text, so no float is involved and the
+        result is exact. Numbers with more than scale decimal places are
+        rejected rather than rounded, as are scaled values beyond
+        FIXED_POINT_MAX.
+        """
+        match = _NUMBER_PARTS_PATTERN.fullmatch(input_str)
+        if match is None:
+            return INVALID_INPUT, f"'{input_str}' is not a valid number format"
+        sign, whole, fraction, exponent_str = match.groups()
+
+        if (
+            exponent_str is None
+            and len(fraction) <= scale
+            and len(whole) + scale <= _FIXED_POINT_DIGITS
+        ):
+            # Plain decimals with at most scale places, the usual input
+            value = int(whole + fraction) * _POWERS_OF_TEN[scale - len(fraction)]
+            if value > FIXED_POINT_MAX:
+                return INVALID_INPUT, f"Number '{input_str}' is out of range"
+            return OK, -value if sign == "-" else value
+
+        digits = (whole + fraction).lstrip("0")
+        if not digits:
+            return OK, 0
+
+        exponent = 0
+        if exponent_str:
+            magnitude = exponent_str.lstrip("+-").lstrip("0")
+            exponent = int(magnitude or 0) if len(magnitude) < 7 else _MAX_EXPONENT
+            if exponent_str[0] == "-":
+                exponent = -exponent
+        shift = scale - len(fraction) + exponent
+        if shift < 0:
+            if digits[shift:].strip("0"):
+                return (
+                    INVALID_INPUT,
+                    f"'{input_str}' has more than {scale} decimal places",
+                )
+            digits = digits[:shift]
+            shift = 0
+
+        if len(digits) + shift > _FIXED_POINT_DIGITS:
+            return INVALID_INPUT, f"Number '{input_str}' is out of range"
+        value = int(digits) * 10**shift
+        if value > FIXED_POINT_MAX:
+            return INVALID_INPUT, f"Number '{input_str}' is out of range"
+        return OK, -value if sign == "-" else value
+
+    @staticmethod
+    def convert_number(input_str: str) -> Optional[Number]:
+        """
+        Convert string input to a number, or return None if it is invalid.
+
+        Accepts exactly the input validate_number() accepts, but skips the
+        pattern match and error messages: int() and float() already accept
+        that grammar plus underscores and the inf and nan spellings, which are
+        rejected here. Meant for bulk conversion of data cells.
+
+        Args:
+            input_str: String input, e.g. a CSV cell
+
+        Returns:
+            The converted number (int or float), or None
+        """
+        if len(input_str) > MAX_NUMBER_DIGITS:
+            # Cells that may be beyond the digit limit take the checked path
+            status, value = InputValidator.try_validate_number(input_str)
+            return value if status is OK else None
+        if "_" in input_str:
+            return None
+        # Whole numbers are ints, as in validate_number()
+        if "." not in input_str and "e" not in input_str and "E" not in input_str:
+            try:
+                return int(input_str)
+            except ValueError:
+                return None
+        try:
+            value = float(input_str)
+        except ValueError:
+            return None
+        # Also false for NaN
+        return value if -_FLOAT_MAX <= value <= _FLOAT_MAX else None
+
+    @staticmethod
+    def convert_fixed_point(input_str: str, scale: int) -> Optional[int]:
+        """
+        Convert string input to a scaled int, or return None if it is invalid.
+
+        Accepts exactly the input validate_number(input_str, scale) accepts.
+        Plain decimals with at most scale places skip the pattern match;
+        their length keeps them in range. Meant for bulk conversion of data
+        cells.
+
+        Args:
+            input_str: String input, e.g. a CSV cell
+            scale: Number of decimal places
+
+        Returns:
+            The int scaled by 10**scale, or None
+        """
+        whole, _, fraction = input_str.strip().partition(".")
+        digits = whole + fraction
+        # The length checks leave room for a sign in whole
+        if (
+            len(digits) <= MAX_NUMBER_DIGITS
+            and len(fraction) <= scale
+            and len(whole) + scale < _FIXED_POINT_DIGITS
+            and (whole.lstrip("+-") + fraction).isdecimal()
+        ):
+            try:
+                return int(digits) * _POWERS_OF_TEN[scale - len(fraction)]
+            except ValueError:
+                # More than one sign
+                return None
+        status, value = InputValidator.try_validate_number(input_str, scale)
+        return value if status is OK else None
+
+    @staticmethod
+    def check_line_length(input_str: str) -> None:
+        """
+        Reject a line of input longer than MAX_LINE_LENGTH characters.
+
+        try_parse() checks this itself; parsers of other input formats call
+        it before their first pattern match.
+
+        Args:
+            input_str: Line of input
+
+        Raises:
+            InvalidInputError: If the line is too long
+        """
+        if len(input_str) > MAX_LINE_LENGTH:
+            raise InvalidInputError(_line_too_long(input_str))
 
     @staticmethod
     def validate_operation(operation_str: str) -> str:
@@ -77,9 +408,8 @@ class InputValidator:
         if not operation_str:
             raise InvalidInputError("Empty operation is not valid")
 
-        valid_operations = {"+", "-", "*", "/"}
-        if operation_str not in valid_operations:
-            valid_ops = ", ".join(sorted(valid_operations))
+        if operation_str not in _VALID_OPERATIONS:
+            valid_ops = ", ".join(sorted(_VALID_OPERATIONS))
             raise InvalidInputError(
                 f"'{operation_str}' is not a valid operation. Valid operations: {valid_ops}"
             )
@@ -106,26 +436,251 @@ class InputValidator:
         Raises:
             InvalidInputError: If input format is invalid
         """
-        input_str = input_str.strip()
+        parsed = _parse_simple(input_str)
+        if parsed is None:
+            parsed = unwrap(InputValidator._try_parse_pattern(input_str))
+        return parsed
 
-        if not input_str:
-            raise InvalidInputError("Empty input")
+    def parse_input(self, input_str: str, compile: Callable[[str], Any]) -> Any:
+        """
+        Parse a line of input as a simple calculation or, failing that, compile it.
 
-        # Pattern to match calculation: number operator number
-        # This handles negative numbers correctly
-        pattern = r"^([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*([\+\-\*/])\s*([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)$"
+        This is the whole parse step of evaluating a line, so timing it covers
+        expressions as well as simple calculations.
 
-        match = re.match(pattern, input_str)
-        if not match:
-            raise InvalidInputError(
-                "Invalid input format. Use: 'number operation number' (e.g., '5 + 3')"
+        Args:
+            input_str: Line to parse
+            compile: Compiles an expression into a program, normally
+                Calculator.compile
+
+        Returns:
+            Tuple of (first_number, operation, second_number) for simple
+            input, otherwise the compiled program
+
+        Raises:
+            InvalidInputError: If the line is neither a simple calculation nor
+                an expression without variables; the error is the one from
+                parse_calculation_input(), so messages for simple input stay
+                unchanged
+        """
+        try:
+            return self.parse_calculation_input(input_str)
+        except InvalidInputError as simple_error:
+            try:
+                program = compile(input_str)
+            except InvalidInputError:
+                raise simple_error from None
+            if program.variables:
+                # Input lines have nothing to bind names to
+                raise simple_error from None
+            return program
+
+    @staticmethod
+    def try_parse(input_str: str) -> Outcome:
+        """
+        Parse a calculation input string without raising.
+
+        Accepts the same input as parse_calculation_input().
+
+        Args:
+            input_str: Complete calculation string
+
+        Returns:
+            (Status.OK, (first_number, operation, second_number)) or
+            (Status.INVALID_INPUT, error message)
+        """
+        parsed = _parse_simple(input_str)
+        if parsed is not None:
+            return OK, parsed
+        return InputValidator._try_parse_pattern(input_str)
+
+    @staticmethod
+    def _try_parse_pattern(input_str: str) -> Outcome:
+        """
+        try_parse() for the lines _parse_simple() leaves.
+
+        Those are lines beyond a limit, invalid lines, lines without
+        whitespace around the operation and lines with out-of-range operands.
+        The pattern is matched once for all of them.
+        """
+        length = len(input_str)
+        if length > MAX_LINE_LENGTH:
+            return INVALID_INPUT, _line_too_long(input_str)
+
+        match = _match_calculation(input_str)
+        if match is None:
+            if not input_str.strip():
+                return INVALID_INPUT, "Empty input"
+            return (
+                INVALID_INPUT,
+                "Invalid input format. Use: 'number operation number' (e.g., '5 + 3')",
+            )
+
+        first_str, first_tail, operation, second_str, second_tail = match.groups()
+        if length <= MAX_NUMBER_DIGITS:
+            try:
+                # An operand without fraction or exponent is an int, as in
+                # validate_number()
+                first_number = float(first_str) if first_tail else int(first_str)
+                second_number = float(second_str) if second_tail else int(second_str)
+            except ValueError:
+                # Beyond the digit limit of int() itself
+                pass
+            else:
+                if not (
+                    first_number in _OUT_OF_RANGE or second_number in _OUT_OF_RANGE
+                ):
+                    return OK, (first_number, operation, second_number)
+
+        # Left are lines long enough to hold a number beyond the digit limit
+        # and lines with an operand out of range, so each operand is checked
+        # in full by try_validate_number(), which builds the error message
+        first = InputValidator.try_validate_number(first_str)
+        if first[0] is not OK:
+            return first
+        second = InputValidator.try_validate_number(second_str)
+        if second[0] is not OK:
+            return second
+        return OK, (first[1], operation, second[1])
+
+    @staticmethod
+    def parse_fixed_point_input(input_str: str, scale: int) -> Tuple[int, str, int]:
+        """
+        Parse "number operation number" input into fixed-point operands.
+
+        Accepts the same input as parse_calculation_input(), converting each
+        operand with validate_number(operand, scale).
+
+        Args:
+            input_str: Complete calculation string
+            scale: Number of decimal places of the operands
+
+        Returns:
+            Tuple of (first_scaled, operation, second_scaled)
+
+        Raises:
+            InvalidInputError: If input format is invalid or an operand has
+                more than scale decimal places or is out of range
+        """
+        match = _match_calculation(input_str)
+        if match is None:
+            # _try_parse_pattern() builds the usual format error message
+            raise InvalidInputError(InputValidator._try_parse_pattern(input_str)[1])
+        first_str, _, operation, second_str, _ = match.groups()
+        return (
+            InputValidator.validate_number(first_str, scale),
+            operation,
+            InputValidator.validate_number(second_str, scale),
+        )
+
+    @staticmethod
+    def scan_bytes(
+        data: Any, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[Tuple[int, int, Optional[Tuple[Number, str, Number]]]]:
+        """
+        Find and parse the simple calculation lines of a buffer without decoding.
+
+        Lines end in LF or CRLF. Only ASCII lines in the "number operation
+        number" format are found; every other line, valid or not, is skipped
+        and should be decoded and given to try_parse(), which produces the
+        error message or hands the line to the expression engine.
+
+        Args:
+            data: bytes-like object to scan, e.g. an mmap
+            start: Offset to start scanning at; must be the start of a line
+            end: Offset to stop scanning at; defaults to the end of data
+
+        Yields:
+            Tuples of (line_start, line_end, parsed) in input order, where
+            line_end is the offset of the line break (or of the end of data)
+            and parsed is (first_number, operation, second_number), or None if
+            an operand is out of range or the line is long enough to be beyond
+            an input limit, and the line needs try_parse() as well
+        """
+        # Longer lines may be beyond a limit and are left to try_parse()
+        max_length = min(MAX_LINE_LENGTH, MAX_NUMBER_DIGITS)
+        for match in _BYTES_LINE_PATTERN.finditer(
+            data, start, len(data) if end is None else end
+        ):
+            if match.end() - match.start() > max_length:
+                yield match.start(), match.end(), None
+                continue
+            first_bytes, first_tail, operation, second_bytes, second_tail = (
+                match.groups()
             )
+            try:
+                first_number = float(first_bytes) if first_tail else int(first_bytes)
+                second_number = (
+                    float(second_bytes) if second_tail else int(second_bytes)
+                )
+            except ValueError:
+                yield match.start(), match.end(), None
+                continue
+            if first_number in _OUT_OF_RANGE or second_number in _OUT_OF_RANGE:
+                yield match.start(), match.end(), None
+            else:
+                yield match.start(), match.end(), (
+                    first_number,
+                    _BYTES_OPERATIONS[operation],
+                    second_number,
+                )
+
+
+class CachingInputValidator(InputValidator):
+    """
+    InputValidator that memoizes parse_calculation_input() by raw input line.
+
+    Parse outcomes are cached as returned by try_parse(): failed parses are
+    cached as negative entries holding the error message, so invalid lines
+    are not re-parsed either. The cache is bounded and evicts the least
+    recently used line.
+    """
+
+    def __init__(self, cache_size: int = PARSE_CACHE_SIZE):
+        """
+        Initialize the validator with an empty parse cache.
+
+        Args:
+            cache_size: Maximum number of distinct input lines to remember
+        """
+        self._parse_cache = LRUCache(cache_size)
+
+    def parse_calculation_input(self, input_str: str) -> Tuple[Number, str, Number]:
+        """
+        Parse a calculation input string, reusing earlier results for the same line.
 
-        first_str, operation_str, second_str = match.groups()
+        Args:
+            input_str: Complete calculation string
+
+        Returns:
+            Tuple of (first_number, operation, second_number)
 
-        # Validate and convert each component
-        first_number = InputValidator.validate_number(first_str)
-        operation = InputValidator.validate_operation(operation_str)
-        second_number = InputValidator.validate_number(second_str)
+        Raises:
+            InvalidInputError: If input format is invalid
+        """
+        return unwrap(self.try_parse(input_str))
 
-        return first_number, operation, second_number
+    def try_parse(self, input_str: str) -> Outcome:
+        """
+        Parse a calculation input string without raising, reusing earlier results.
+
+        Args:
+            input_str: Complete calculation string
+
+        Returns:
+            (Status.OK, (first_number, operation, second_number)) or
+            (Status.INVALID_INPUT, error message)
+        """
+        outcome = self._parse_cache.get(input_str)
+        if outcome is None:
+            outcome = InputValidator.try_parse(input_str)
+            self._parse_cache.put(input_str, outcome)
+        return outcome
+
+    def cache_info(self) -> CacheInfo:
+        """Return parse cache statistics."""
+        return self._parse_cache.info()
+
+    def clear_cache(self) -> None:
+        """Remove all cached parses and reset the statistics."""
+        self._parse_cache.clear()
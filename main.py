@@ -1,20 +1,397 @@
 """
 Main entry point for the command-line calculator application.
+
+Modules beyond the parser and the operations are imported inside the code
+paths that need them, so one-shot evaluation (`main.py "12.5 * 4"`) starts
+without loading the interactive CLI, the servers or the metrics exporter.
 """
 
-from calculator.cli import CalculatorCLI
+import argparse
+import re
+import sys
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence, TextIO
+
+from calculator.settings import (
+    BATCH_BUFFER_SIZE,
+    DEFAULT_TEXTFILE_INTERVAL,
+    OUTPUT_FORMATS,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from calculator.calculator import Calculator
+    from calculator.cli import CalculatorCLI
+    from calculator.exporter import MetricsExporter
+    from calculator.validation import InputValidator
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(description="Python command-line calculator")
+    # argparse reads arguments starting with "-" as options unless they look
+    # like negative numbers; widen that to expressions such as "-5*2" and
+    # "-(1+2)". No option of this parser starts with "-" and a digit, "." or "(".
+    parser._negative_number_matcher = re.compile(r"^-[\d.(]")
+    parser.add_argument(
+        "expressions",
+        nargs="*",
+        metavar="EXPR",
+        help="evaluate these expressions, print one result per line and exit",
+    )
+    parser.add_argument(
+        "-e",
+        "--expression",
+        action="append",
+        default=[],
+        metavar="EXPR",
+        help="evaluate EXPR and exit; may be repeated",
+    )
+    parser.add_argument(
+        "--batch",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="evaluate expressions from PATH (or stdin when omitted) and exit",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="plain",
+        help="output format for batch mode (default: plain)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="evaluate batch input in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="memory-map the --batch file and parse it as bytes, keeping memory "
+        "use independent of the file size",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="read the --batch input as CSV with a,op,b columns and write "
+        "result,error columns",
+    )
+    parser.add_argument(
+        "--op",
+        metavar="SYMBOL",
+        help="with --columnar, apply SYMBOL to every row of a,b columns",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        type=int,
+        metavar="N",
+        help="memoize parse results for up to N distinct input lines and report "
+        "the hit rate at exit; not with --workers",
+    )
+    parser.add_argument(
+        "--max-line-length",
+        type=int,
+        metavar="N",
+        help="reject input lines longer than N characters (default: 16384)",
+    )
+    parser.add_argument(
+        "--max-digits",
+        type=int,
+        metavar="N",
+        help="reject numbers with more than N digits (default: 4300)",
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        metavar="PORT",
+        help="run the TCP calculation server on PORT",
+    )
+    parser.add_argument(
+        "--http",
+        type=int,
+        metavar="PORT",
+        help="run the JSON-over-HTTP calculation service on PORT",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="interface for --serve, --http and --metrics-port to bind "
+        "(default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="serve OpenMetrics call, error and latency metrics at "
+        "http://HOST:PORT/metrics",
+    )
+    parser.add_argument(
+        "--metrics-textfile",
+        metavar="PATH",
+        help="periodically write OpenMetrics metrics to PATH for a textfile "
+        "collector",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        metavar="SECONDS",
+        help="seconds between --metrics-textfile writes "
+        f"(default: {DEFAULT_TEXTFILE_INTERVAL:g})",
+    )
+    return parser
+
+
+def expressions_in_order(
+    argv: Sequence[str], options: List[str], positionals: List[str]
+) -> List[str]:
+    """
+    Interleave -e and positional expressions in the order they appear in argv.
+
+    parse_intermixed_args() parses every option before any positional, so the
+    two lists lose their order relative to each other; it is recovered from
+    where each -e option and positional expression stands in argv.
+
+    Args:
+        argv: Command-line arguments as parsed
+        options: Values of the -e options, in order
+        positionals: Positional expressions, in order
+
+    Returns:
+        All expressions in argv order
+    """
+    ordered: List[str] = []
+    option_count = positional_count = 0
+    tokens = iter(argv)
+    only_positionals = False
+    for token in tokens:
+        if only_positionals:
+            option = False
+        elif token == "--":
+            only_positionals = True
+            continue
+        elif token.startswith("--"):
+            # No other option starts with "--e", so every prefix of
+            # --expression down to "--e" is an abbreviation of it
+            name, equals, _ = token.partition("=")
+            option = len(name) > 2 and "--expression".startswith(name)
+            if option and not equals:
+                # The value is the next argument
+                next(tokens, None)
+        else:
+            option = token.startswith("-e")
+            if token == "-e":
+                next(tokens, None)
+        if option and option_count < len(options):
+            ordered.append(options[option_count])
+            option_count += 1
+        elif (
+            positional_count < len(positionals)
+            and token == positionals[positional_count]
+        ):
+            ordered.append(positionals[positional_count])
+            positional_count += 1
+    return ordered + options[option_count:] + positionals[positional_count:]
 
 
-def main():
+def evaluate_expressions(
+    expressions: Sequence[str],
+    calculator: "Calculator",
+    validator: "InputValidator",
+) -> int:
+    """
+    Evaluate one-shot expressions, printing one result per line.
+
+    Errors are printed to stderr as "<ErrorClass>: <message>" and do not stop
+    the remaining expressions from being evaluated.
+
+    Returns:
+        Exit status: 0 if every expression succeeded, 1 otherwise
+    """
+    from calculator.exceptions import CalculatorError
+    from calculator.expression import evaluate_input
+
+    status = 0
+    for expression in expressions:
+        try:
+            result = evaluate_input(calculator, validator, expression)
+        except CalculatorError as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            status = 1
+        else:
+            print(result)
+    return status
+
+
+def run_batch(
+    cli: "CalculatorCLI",
+    path: str,
+    output_format: str,
+    workers: int = 1,
+    mapped: bool = False,
+    columnar: bool = False,
+    operation: Optional[str] = None,
+) -> None:
+    """Evaluate a file or stdin in batch mode through a large buffered writer."""
+    if columnar:
+        _run_text_batch(
+            path,
+            lambda lines, output: cli.run_columnar_batch(lines, output, operation),
+        )
+    elif mapped:
+        # write_mapped() buffers its output itself
+        sys.stdout.flush()
+        cli.run_mapped_batch(path, sys.stdout.buffer, output_format)
+        sys.stdout.buffer.flush()
+    else:
+        _run_text_batch(
+            path,
+            lambda lines, output: cli.run_batch(lines, output, output_format, workers),
+        )
+
+    summary = cli.parse_cache_summary()
+    if summary is not None:
+        print(summary, file=sys.stderr)
+
+
+def _run_text_batch(
+    path: str, evaluate: Callable[[Iterable[str], TextIO], int]
+) -> None:
+    """Run evaluate over a file or stdin, writing through a large buffered writer."""
+    output = open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=BATCH_BUFFER_SIZE,
+        encoding="utf-8",
+        closefd=False,
+    )
+    try:
+        sys.stdout.flush()
+        if path == "-":
+            evaluate(sys.stdin, output)
+        else:
+            with open(path, encoding="utf-8", buffering=BATCH_BUFFER_SIZE) as lines:
+                evaluate(lines, output)
+    finally:
+        output.close()
+
+
+def start_exporter(cli: "CalculatorCLI", args: argparse.Namespace) -> "MetricsExporter":
+    """Publish the CLI's metrics as requested by the --metrics-* options."""
+    from calculator.exporter import MetricsExporter
+
+    exporter = MetricsExporter(cli.calculator, cli.parse_metrics)
+    if args.metrics_port is not None:
+        exporter.serve(args.host, args.metrics_port)
+        print(
+            f"Serving metrics on http://{args.host}:{args.metrics_port}/metrics",
+            file=sys.stderr,
+        )
+    if args.metrics_textfile is not None:
+        interval = args.metrics_interval or DEFAULT_TEXTFILE_INTERVAL
+        exporter.start_textfile(args.metrics_textfile, interval)
+    return exporter
+
+
+def main(argv=None):
     """Main function to start the calculator application."""
+    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parser.parse_intermixed_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.parse_cache is not None and args.parse_cache < 1:
+        parser.error("--parse-cache must be at least 1")
+    if args.metrics_interval is not None and args.metrics_interval <= 0:
+        parser.error("--metrics-interval must be positive")
+    for option, limit in (
+        ("--max-line-length", args.max_line_length),
+        ("--max-digits", args.max_digits),
+    ):
+        if limit is not None and limit < 1:
+            parser.error(f"{option} must be at least 1")
+    expressions = expressions_in_order(argv, args.expression, args.expressions)
+    if expressions and (
+        args.batch is not None or args.serve is not None or args.http is not None
+    ):
+        parser.error("expressions cannot be combined with --batch, --serve or --http")
+    if args.mmap and (args.batch in (None, "-") or args.workers > 1):
+        parser.error("--mmap needs --batch PATH and cannot be combined with --workers")
+    if args.columnar and (args.batch is None or args.mmap or args.workers > 1):
+        parser.error(
+            "--columnar needs --batch and cannot be combined with --mmap or --workers"
+        )
+    if args.op is not None and not args.columnar:
+        parser.error("--op needs --columnar")
+    if args.parse_cache is not None and args.workers > 1:
+        # Worker processes parse with plain validators
+        parser.error("--parse-cache cannot be combined with --workers")
+
+    if args.max_line_length is not None or args.max_digits is not None:
+        from calculator.validation import set_input_limits
+
+        set_input_limits(args.max_line_length, args.max_digits)
+
+    instrument = args.metrics_port is not None or args.metrics_textfile is not None
+    if expressions and not instrument:
+        from calculator.calculator import Calculator
+        from calculator.validation import InputValidator
+
+        return evaluate_expressions(expressions, Calculator(), InputValidator())
+
     try:
-        cli = CalculatorCLI()
-        cli.run()
+        from calculator.cli import CalculatorCLI
+
+        cli = CalculatorCLI(parse_cache_size=args.parse_cache, instrument=instrument)
+        exporter = start_exporter(cli, args) if instrument else None
+    except Exception as e:
+        print(f"Failed to start calculator: {e}")
+        return 1
+
+    status = 0
+    try:
+        if expressions:
+            status = evaluate_expressions(expressions, cli.calculator, cli.validator)
+        elif args.serve is not None:
+            from calculator.server import run_server
+
+            print(f"Serving calculations on {args.host}:{args.serve}", file=sys.stderr)
+            try:
+                run_server(args.host, args.serve, cli.calculator, cli.validator)
+            except KeyboardInterrupt:
+                print("Server stopped.", file=sys.stderr)
+        elif args.http is not None:
+            from calculator.http_server import create_http_server
+
+            server = create_http_server(args.host, args.http, cli.calculator)
+            print(f"Serving HTTP on {args.host}:{args.http}", file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print("Server stopped.", file=sys.stderr)
+            finally:
+                server.server_close()
+        elif args.batch is not None:
+            run_batch(
+                cli,
+                args.batch,
+                args.format,
+                args.workers,
+                args.mmap,
+                args.columnar,
+                args.op,
+            )
+        else:
+            cli.run()
     except Exception as e:
         print(f"Failed to start calculator: {e}")
         return 1
+    finally:
+        if exporter is not None:
+            exporter.close()
 
-    return 0
+    return status
 
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from calculator import operations
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run each test with NumPy kernels and with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(operations, "np", None)
+    return request.param
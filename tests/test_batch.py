@@ -0,0 +1,319 @@
+"""Unit tests for batch evaluation."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from calculator import validation
+from calculator.batch import (
+    _evaluate_chunk,
+    evaluate_lines,
+    write_mapped,
+    write_records,
+    write_records_parallel,
+)
+from calculator.calculator import Calculator
+from calculator.exceptions import DivisionByZeroError, InvalidInputError
+from calculator.metrics import OperationMetrics
+from calculator.operations import Operation
+from calculator.registry import BUILTIN_OPERATIONS, OperationRegistry
+
+
+def failing_calculator():
+    """Build a Calculator whose "*" raises an error of no calculator class."""
+
+    class Failing(Operation):
+        def execute(self, a, b):
+            raise RuntimeError("plugin failed")
+
+        def get_symbol(self):
+            return "*"
+
+        def get_name(self):
+            return "failing"
+
+    registry = OperationRegistry({**BUILTIN_OPERATIONS, "*": Failing})
+    return Calculator(registry=registry)
+
+
+class TestEvaluateLines:
+    """Test class for evaluate_lines functionality."""
+
+    def test_evaluate_lines_results_and_errors(self):
+        """Test each line yields one record with either a result or an error."""
+        records = list(evaluate_lines(["5 + 3\n", "7 / 0\n", "abc\n", "\n"]))
+
+        assert records[0] == ("5 + 3", 8, None)
+        assert records[1][:2] == ("7 / 0", None)
+        assert isinstance(records[1][2], DivisionByZeroError)
+        assert isinstance(records[2][2], InvalidInputError)
+        assert records[3][0] == ""
+        assert isinstance(records[3][2], InvalidInputError)
+
+    def test_evaluate_lines_reports_any_error_per_line(self):
+        """Test an unexpected exception on one line does not end the batch."""
+        records = list(
+            evaluate_lines(["2 * 3", "1 + 1"], calculator=failing_calculator())
+        )
+        assert records[0][:2] == ("2 * 3", None)
+        assert isinstance(records[0][2], RuntimeError)
+        assert records[1] == ("1 + 1", 2, None)
+
+    def test_evaluate_lines_is_lazy(self):
+        """Test lines are consumed only as records are requested."""
+
+        def lines():
+            yield "1 + 1"
+            raise AssertionError("input read ahead of output")
+
+        records = evaluate_lines(lines())
+        assert next(records) == ("1 + 1", 2, None)
+
+
+class TestWriteRecords:
+    """Test class for write_records output formats."""
+
+    LINES = ["10 / 4", "1 / 0"]
+
+    def _write(self, output_format):
+        output = io.StringIO()
+        count = write_records(evaluate_lines(self.LINES), output, output_format)
+        assert count == len(self.LINES)
+        return output.getvalue()
+
+    def test_write_records_plain(self):
+        """Test plain output prints results and error descriptions."""
+        assert self._write("plain") == (
+            "2.5\nDivisionByZeroError: Division by zero is not allowed\n"
+        )
+
+    def test_write_records_csv(self):
+        """Test CSV output has expression, result, error and message columns."""
+        assert self._write("csv") == (
+            "10 / 4,2.5,,\n"
+            "1 / 0,,DivisionByZeroError,Division by zero is not allowed\n"
+        )
+
+    def test_write_records_ndjson(self):
+        """Test NDJSON output has one JSON object per line."""
+        lines = self._write("ndjson").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"expression": "10 / 4", "result": 2.5, "error": None, "message": None},
+            {
+                "expression": "1 / 0",
+                "result": None,
+                "error": "DivisionByZeroError",
+                "message": "Division by zero is not allowed",
+            },
+        ]
+
+    def test_write_records_unknown_format(self):
+        """Test unknown output formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown output format 'xml'"):
+            write_records([], io.StringIO(), "xml")
+
+
+class TestWriteRecordsParallel:
+    """Test class for process-pool batch evaluation."""
+
+    def test_parallel_output_matches_serial_order(self):
+        """Test chunked parallel output is identical to serial output."""
+        lines = [f"{i} * 2" if i % 7 else f"{i} / 0" for i in range(200)]
+        serial = io.StringIO()
+        write_records(evaluate_lines(lines), serial, "csv")
+
+        parallel = io.StringIO()
+        count = write_records_parallel(
+            iter(lines), parallel, "csv", workers=2, chunk_size=9
+        )
+
+        assert count == len(lines)
+        assert parallel.getvalue() == serial.getvalue()
+
+    def test_parallel_workers_apply_input_limits(self, monkeypatch):
+        """Test worker processes use the parent's input limits."""
+        monkeypatch.setattr(validation, "MAX_NUMBER_DIGITS", 3)
+        output = io.StringIO()
+        write_records_parallel(["123 + 1", "1234 + 1"], output, workers=2)
+        assert output.getvalue() == (
+            "124\nInvalidInputError: Number has 4 digits; the limit is 3\n"
+        )
+
+    def test_parallel_empty_input(self):
+        """Test empty input produces no output."""
+        output = io.StringIO()
+        assert write_records_parallel([], output) == 0
+        assert output.getvalue() == ""
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"output_format": "xml"}, "Unknown output format"),
+            ({"workers": 0}, "at least 1"),
+            ({"chunk_size": 0}, "at least 1"),
+        ],
+    )
+    def test_parallel_invalid_arguments(self, kwargs, message):
+        """Test invalid parallel settings are rejected before starting workers."""
+        with pytest.raises(ValueError, match=message):
+            write_records_parallel(["1 + 1"], io.StringIO(), **kwargs)
+
+    def test_parallel_metrics_are_merged(self):
+        """Test the workers' calculation and parse metrics reach the parent."""
+        calculator = Calculator(instrument=True)
+        parse_metrics = OperationMetrics()
+        lines = ["1 + 1", "(1 + 2) * 3", "1 / 0", "abc"] * 5
+        write_records_parallel(
+            lines,
+            io.StringIO(),
+            workers=2,
+            chunk_size=3,
+            calculator=calculator,
+            parse_metrics=parse_metrics,
+        )
+
+        parses = parse_metrics.snapshot()["parse"]
+        assert parses["calls"] == 20
+        assert parses["errors"] == {"InvalidInputError": 5}
+        # Expressions are folded when compiled, so only simple lines calculate
+        stats = calculator.stats()
+        assert stats["+"]["calls"] == 5
+        assert stats["/"]["errors"] == {"DivisionByZeroError": 5}
+
+    def test_parallel_parse_metrics_without_calculator(self):
+        """Test parse metrics are merged when no calculator takes the stats."""
+        parse_metrics = OperationMetrics()
+        write_records_parallel(["1 + 1"], io.StringIO(), parse_metrics=parse_metrics)
+        assert parse_metrics.snapshot()["parse"]["calls"] == 1
+
+    def test_evaluate_chunk(self):
+        """Test a single chunk is evaluated and formatted in-process."""
+        assert _evaluate_chunk(["1 + 1", "2 * 3"], "plain") == (2, "2\n6\n", None)
+
+    def test_evaluate_chunk_instrumented(self):
+        """Test an instrumented chunk returns its metrics snapshots."""
+        count, text, stats = _evaluate_chunk(["1 + 1", "abc"], "plain", True)
+        calculation_stats, parse_stats = stats
+        assert calculation_stats["+"]["calls"] == 1
+        assert parse_stats["parse"]["calls"] == 2
+        assert parse_stats["parse"]["errors"] == {"InvalidInputError": 1}
+
+
+class TestWriteMapped:
+    """Test class for memory-mapped file evaluation."""
+
+    CONTENT = (
+        "5 + 3\r\n"
+        "  1.5*-2 \t\n"
+        "\n"
+        "7 / 0\r"
+        "1e200 * 1e200\n"
+        "2 ** 3\n"
+        "(1 + 2) * 3\n"
+        "abc\r\r\n"
+        "1e999 + 1\n"
+        "\uff11 + 2\n"
+        f"{'9' * 5000} + 1\n"
+        f"1.5 * 1{'0' * 400}\n"
+        "10 - 4"
+    )
+
+    def _write_file(self, tmp_path, content):
+        path = tmp_path / "input.txt"
+        path.write_bytes(content.encode("utf-8"))
+        return path
+
+    @pytest.mark.parametrize("output_format", ["plain", "csv", "ndjson"])
+    def test_matches_text_mode(self, tmp_path, output_format):
+        """Test mapped evaluation writes exactly what text-mode evaluation does."""
+        path = self._write_file(tmp_path, self.CONTENT)
+        expected = io.StringIO()
+        with open(path, encoding="utf-8") as lines:
+            expected_count = write_records(
+                evaluate_lines(lines), expected, output_format
+            )
+
+        output = io.BytesIO()
+        count = write_mapped(path, output, output_format)
+
+        assert count == expected_count == 14
+        assert output.getvalue().decode("utf-8") == expected.getvalue()
+
+    def test_small_buffer_and_release_size(self, tmp_path):
+        """Test output is flushed when the buffer fills and pages are released."""
+        lines = [f"{i} * 3" for i in range(2000)]
+        path = self._write_file(tmp_path, "\n".join(lines) + "\n")
+        output = io.BytesIO()
+
+        count = write_mapped(path, output, buffer_size=8, release_size=1)
+
+        assert count == 2000
+        assert output.getvalue().decode().splitlines() == [
+            str(i * 3) for i in range(2000)
+        ]
+
+    def test_decoded_lines_with_small_release_size(self, tmp_path):
+        """Test runs of lines left to the str parser also release their pages."""
+        lines = [f"({i}) * 2" for i in range(2000)]
+        path = self._write_file(tmp_path, "\n".join(lines))
+        output = io.BytesIO()
+
+        assert write_mapped(path, output, release_size=1) == 2000
+        assert output.getvalue().decode().splitlines() == [
+            str(i * 2) for i in range(2000)
+        ]
+
+    def test_lines_longer_than_buffer(self, tmp_path):
+        """Test output lines longer than the buffer are written directly."""
+        path = self._write_file(tmp_path, "1 / 0\n2 + 2\n")
+        output = io.BytesIO()
+
+        write_mapped(path, output, buffer_size=4)
+
+        assert output.getvalue() == (
+            b"DivisionByZeroError: Division by zero is not allowed\n4\n"
+        )
+
+    def test_without_madvise(self, tmp_path):
+        """Test platforms without madvise() leave page management to the OS."""
+        lines = "".join(f"{i} + 1\n" for i in range(2000))
+        path = self._write_file(tmp_path, lines)
+        output = io.BytesIO()
+
+        with patch("calculator.batch._MADV_DONTNEED", None):
+            assert write_mapped(path, output, release_size=1) == 2000
+
+    @pytest.mark.parametrize("output_format", ["plain", "csv"])
+    def test_any_error_is_reported_per_line(self, tmp_path, output_format):
+        """Test an unexpected exception on a line parsed from bytes is reported."""
+        path = self._write_file(tmp_path, "2 * 3\n1 + 1\n")
+        output = io.BytesIO()
+
+        count = write_mapped(
+            path, output, output_format, calculator=failing_calculator()
+        )
+
+        assert count == 2
+        assert (
+            output.getvalue()
+            .decode()
+            .splitlines()[0]
+            .endswith(
+                "RuntimeError: plugin failed"
+                if output_format == "plain"
+                else "RuntimeError,plugin failed"
+            )
+        )
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file produces no output."""
+        output = io.BytesIO()
+        assert write_mapped(self._write_file(tmp_path, ""), output) == 0
+        assert output.getvalue() == b""
+
+    def test_invalid_format(self, tmp_path):
+        """Test unknown output formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown output format"):
+            write_mapped(self._write_file(tmp_path, "1 + 1"), io.BytesIO(), "xml")
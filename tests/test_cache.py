@@ -0,0 +1,63 @@
+"""Unit tests for the LRU cache."""
+
+import pytest
+
+from calculator.cache import CacheInfo, LRUCache
+
+
+class TestLRUCache:
+    """Test class for LRUCache functionality."""
+
+    def test_get_and_put(self):
+        """Test stored values are returned and counted as hits."""
+        cache = LRUCache(2)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.info() == CacheInfo(
+            hits=1, misses=1, evictions=0, size=1, max_size=2
+        )
+
+    def test_get_default(self):
+        """Test the default is returned on a miss."""
+        assert LRUCache(1).get("missing", "default") == "default"
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_put_existing_key_does_not_evict(self):
+        """Test overwriting a key keeps the cache size."""
+        cache = LRUCache(1)
+        cache.put("a", 1)
+        cache.put("a", 2)
+        assert cache.get("a") == 2
+        assert cache.evictions == 0
+
+    def test_clear(self):
+        """Test clear removes entries and resets statistics."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        assert cache.info() == CacheInfo(0, 0, 0, 0, 2)
+
+    def test_hit_rate(self):
+        """Test the hit rate is computed from hits and misses."""
+        assert CacheInfo(3, 1, 0, 0, 1).hit_rate == 0.75
+        assert CacheInfo(0, 0, 0, 0, 1).hit_rate == 0.0
+
+    def test_invalid_size(self):
+        """Test non-positive sizes are rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            LRUCache(0)
@@ -2,14 +2,23 @@
 Unit tests for the main Calculator class.
 """
 
+import math
+import random
+
 import pytest
 
+from calculator import calculator as calculator_module
 from calculator.calculator import Calculator
 from calculator.exceptions import (
+    CalculatorError,
     DivisionByZeroError,
+    InvalidInputError,
     InvalidOperationError,
     OverflowError,
 )
+from calculator.operations import Operation
+from calculator.registry import OperationRegistry
+from calculator.status import Status
 
 
 class TestCalculator:
@@ -25,6 +34,12 @@ class TestCalculator:
         assert hasattr(self.calculator, "_operations")
         assert len(self.calculator._operations) == 4
 
+    def test_get_operation(self):
+        """Test operation objects can be fetched by symbol."""
+        assert self.calculator.get_operation("*").get_name() == "multiplication"
+        with pytest.raises(InvalidOperationError, match="Invalid operation '%'"):
+            self.calculator.get_operation("%")
+
     def test_get_available_operations(self):
         """Test getting available operations."""
         operations = self.calculator.get_available_operations()
@@ -139,3 +154,397 @@ class TestCalculator:
             assert "-" in error_message
             assert "*" in error_message
             assert "/" in error_message
+
+    def test_calculate_many_mixed_operations(self):
+        """Test batch calculation with one operation symbol per row."""
+        results, errors = self.calculator.calculate_many(
+            [5, 10, 3, 15], ["+", "-", "*", "/"], [3, 4, 7, 3]
+        )
+        assert results == [8, 6, 21, 5.0]
+        assert errors == [None, None, None, None]
+
+    def test_calculate_many_single_operation(self):
+        """Test batch calculation with one symbol for the whole batch."""
+        results, errors = self.calculator.calculate_many([1, 2.5, -3], "*", [2, 2, 3])
+        assert results == [2, 5.0, -9]
+        assert errors == [None, None, None]
+
+    def test_calculate_many_matches_calculate(self):
+        """Test batch results are identical to row-by-row calculate calls."""
+        firsts = [7, 2.5, -4, 9, 1e10]
+        symbols = ["/", "+", "-", "*", "/"]
+        seconds = [2, 0.5, 8, -3, 3]
+        results, _ = self.calculator.calculate_many(firsts, symbols, seconds)
+        expected = [
+            self.calculator.calculate(a, op, b)
+            for a, op, b in zip(firsts, symbols, seconds)
+        ]
+        assert results == expected
+        assert [type(r) for r in results] == [type(r) for r in expected]
+
+    def test_calculate_many_reports_errors_per_row(self):
+        """Test that failing rows yield error codes without aborting the batch."""
+        results, errors = self.calculator.calculate_many(
+            [10, 1e200, 4, 6, 8, 1.5],
+            ["/", "*", "@", "@", "-", "*"],
+            [0, 1e200, 2, 2, 3, 10**400],
+        )
+        assert results == [None, None, None, None, 5, None]
+        assert errors == [
+            "DivisionByZeroError",
+            "OverflowError",
+            "InvalidOperationError",
+            "InvalidOperationError",
+            None,
+            "OverflowError",
+        ]
+
+    def test_calculate_many_chunks(self, monkeypatch):
+        """Test failing rows are found in every chunk, of one or many symbols."""
+        monkeypatch.setattr(calculator_module, "CALCULATE_MANY_CHUNK_SIZE", 2)
+        firsts = [1, 2, 3, 4, 5]
+        assert self.calculator.calculate_many(firsts, "/", [1, 2, 3, 0, 5]) == (
+            [1.0, 1.0, 1.0, None, 1.0],
+            [None, None, None, "DivisionByZeroError", None],
+        )
+        assert self.calculator.calculate_many(
+            firsts, ["+", "/", "@", "*", "-"], [1, 0, 1, 2, 1]
+        ) == (
+            [2, None, None, 8, 4],
+            [None, "DivisionByZeroError", "InvalidOperationError", None, None],
+        )
+
+    def test_calculate_many_uses_cache_and_instrumentation(self):
+        """Test rows go through the result cache and metrics like calculate()."""
+        calculator = Calculator(cache_size=8, instrument=True)
+        assert calculator.calculate_many([2, 2, 1], ["*", "*", "@"], [3, 3, 1]) == (
+            [6, 6, None],
+            [None, None, "InvalidOperationError"],
+        )
+        assert calculator.cache_info().hits == 1
+        assert calculator.stats()["*"]["calls"] == 2
+        assert calculator.stats()["invalid"]["calls"] == 1
+
+    def test_calculate_many_empty(self):
+        """Test batch calculation with no rows."""
+        assert self.calculator.calculate_many([], "+", []) == ([], [])
+
+    @pytest.mark.parametrize(
+        "firsts, symbols, seconds",
+        [
+            ([1, 2], "+", [1]),
+            ([1, 2], ["+"], [1, 2]),
+        ],
+    )
+    def test_calculate_many_length_mismatch(self, firsts, symbols, seconds):
+        """Test batch calculation rejects sequences of different lengths."""
+        with pytest.raises(InvalidInputError, match="same length"):
+            self.calculator.calculate_many(firsts, symbols, seconds)
+
+
+class TestCalculatorTryCalculate:
+    """Test class for the exception-free try_calculate API."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = Calculator()
+
+    @pytest.mark.parametrize(
+        "first, operation, second, status",
+        [
+            (5, "+", 3, Status.OK),
+            (1, "/", 0, Status.DIVISION_BY_ZERO),
+            (1e200, "*", 1e200, Status.OVERFLOW),
+            (10**400, "/", 3, Status.OVERFLOW),
+            (1.5, "*", 10**400, Status.OVERFLOW),
+            (1, "@", 2, Status.INVALID_OPERATION),
+        ],
+    )
+    def test_matches_calculate(self, first, operation, second, status):
+        """Test try_calculate reports what calculate returns or raises."""
+        outcome = self.calculator.try_calculate(first, operation, second)
+        assert outcome[0] is status
+
+        if status is Status.OK:
+            assert outcome[1] == self.calculator.calculate(first, operation, second)
+        else:
+            with pytest.raises(status.exception) as info:
+                self.calculator.calculate(first, operation, second)
+            assert outcome[1] == str(info.value)
+
+    def test_errors_are_not_cached(self):
+        """Test only successful results enter the result cache."""
+        calculator = Calculator(cache_size=8)
+        assert calculator.try_calculate(6, "*", 7) == (Status.OK, 42)
+        assert calculator.try_calculate(7, "*", 6) == (Status.OK, 42)
+        assert calculator.try_calculate(1e200, "*", 1e200)[0] is Status.OVERFLOW
+        info = calculator.cache_info()
+        assert (info.hits, info.size) == (1, 1)
+
+    def test_plugin_errors_propagate(self):
+        """Test errors without a status keep their class in every API."""
+
+        class PluginError(CalculatorError):
+            pass
+
+        class Failing(Operation):
+            def execute(self, a, b):
+                raise PluginError("unsupported")
+
+            def get_symbol(self):
+                return "!"
+
+            def get_name(self):
+                return "failing"
+
+        calculator = Calculator(
+            instrument=True, registry=OperationRegistry({"!": Failing})
+        )
+        with pytest.raises(PluginError):
+            calculator.try_calculate(1, "!", 2)
+        with pytest.raises(PluginError):
+            calculator.calculate(1, "!", 2)
+        assert calculator.calculate_many([1], "!", [2]) == ([None], ["PluginError"])
+        # Exceptions without a status propagate unrecorded
+        assert calculator.stats() == {}
+
+    def test_instrumented(self):
+        """Test try_calculate calls are recorded with their error status."""
+        calculator = Calculator(instrument=True)
+        calculator.try_calculate(1, "/", 0)
+        calculator.try_calculate(1, "/", 2)
+        assert calculator.stats()["/"]["calls"] == 2
+        assert calculator.stats()["/"]["errors"] == {"DivisionByZeroError": 1}
+
+
+class TestCalculatorReduce:
+    """Test class for streaming reductions."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.calculator = Calculator()
+
+    def test_sum_of_ints_is_exact_int(self):
+        """Test summing ints gives the exact int total."""
+        total = self.calculator.reduce("+", iter(range(10_001)), chunk_size=7)
+        assert total == 50_005_000
+        assert type(total) is int
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+    def test_sum_matches_fsum(self, chunk_size):
+        """Test float sums are as accurate as a single fsum over all numbers."""
+        rng = random.Random(0)
+        numbers = [rng.uniform(-1, 1) * 10 ** rng.randint(-12, 12) for _ in range(5000)]
+        numbers += [7, -3]
+        assert self.calculator.reduce("+", iter(numbers), chunk_size) == math.fsum(
+            numbers
+        )
+        assert self.calculator.reduce("+", [0.1] * 10) == 1.0
+
+    def test_product(self):
+        """Test products of ints and floats."""
+        assert self.calculator.product(
+            iter(range(1, 21)), chunk_size=6
+        ) == math.factorial(20)
+        assert self.calculator.reduce("*", [2.5, 4, -1]) == -10.0
+
+    def test_empty_reductions(self):
+        """Test the identity is returned for no numbers."""
+        assert self.calculator.reduce("+", []) == 0
+        assert self.calculator.product([]) == 1
+
+    def test_mean(self):
+        """Test the mean of ints and floats."""
+        assert self.calculator.mean(iter(range(1, 101)), chunk_size=8) == 50.5
+        assert self.calculator.mean([0.1, 0.2, 0.3]) == pytest.approx(0.2)
+
+    def test_mean_of_nothing(self):
+        """Test the mean of no numbers is an input error."""
+        with pytest.raises(InvalidInputError, match="mean of no numbers"):
+            self.calculator.mean(iter([]))
+
+    @pytest.mark.parametrize(
+        "symbol, numbers, message",
+        [
+            ("+", [1e308, 1e308], "Sum overflow in the chunk ending at number 2"),
+            ("+", [10**309], "Sum overflow"),
+            ("+", [10**400, 1.0], "Sum overflow"),
+            ("+", [math.inf, -math.inf], "Sum overflow"),
+            ("*", [1e200, 1e200], "Product overflow in the chunk ending at number 2"),
+            ("*", [10**200, 10**200], "Product overflow"),
+            ("*", [10**400, 1.0], "Product overflow"),
+            ("*", [math.inf, 0.0], "Product overflow"),
+        ],
+    )
+    def test_overflow(self, symbol, numbers, message):
+        """Test running results beyond the limit raise OverflowError."""
+        with pytest.raises(OverflowError, match=message):
+            self.calculator.reduce(symbol, iter(numbers))
+
+    def test_overflow_is_checked_per_chunk(self):
+        """Test the overflow check runs at chunk boundaries."""
+        numbers = [1, 1e308, 5e307, -1e308, -5e307]
+        assert self.calculator.reduce("+", numbers, chunk_size=5) == 1.0
+        with pytest.raises(OverflowError, match="ending at number 3"):
+            self.calculator.reduce("+", numbers, chunk_size=3)
+
+    def test_invalid_operation(self):
+        """Test only addition and multiplication can be reduced."""
+        with pytest.raises(InvalidOperationError, match="Cannot reduce with '-'"):
+            self.calculator.reduce("-", [1, 2])
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_invalid_chunk_size(self, chunk_size):
+        """Test chunk sizes below one are rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            self.calculator.reduce("+", [1], chunk_size)
+        with pytest.raises(ValueError, match="at least 1"):
+            self.calculator.mean([1], chunk_size)
+
+    def test_numbers_are_consumed_one_chunk_at_a_time(self):
+        """Test an overflow stops the reduction before the next chunk is read."""
+        consumed = []
+
+        def numbers():
+            for value in [1e308, 1e308, 1.0, 1.0, 1.0]:
+                consumed.append(value)
+                yield value
+
+        with pytest.raises(OverflowError):
+            self.calculator.reduce("+", numbers(), chunk_size=2)
+        assert len(consumed) == 2
+
+
+class TestCalculatorResultCache:
+    """Test class for the optional result cache."""
+
+    def test_cache_disabled_by_default(self):
+        """Test caching is off unless a size is configured."""
+        calculator = Calculator()
+        assert calculator.cache_info() is None
+        calculator.clear_cache()
+        assert calculator.calculate(2, "+", 3) == 5
+
+    def test_cache_hits_and_misses(self):
+        """Test repeated calculations are served from the cache."""
+        calculator = Calculator(cache_size=8)
+        assert calculator.calculate(2, "*", 3) == 6
+        assert calculator.calculate(2, "*", 3) == 6
+        info = calculator.cache_info()
+        assert (info.hits, info.misses, info.size) == (1, 1, 1)
+
+    @pytest.mark.parametrize("operation", ["+", "*"])
+    def test_cache_commutative_operations_share_entries(self, operation):
+        """Test a+b and b+a share one entry for commutative operations."""
+        calculator = Calculator(cache_size=8)
+        calculator.calculate(7, operation, 2)
+        calculator.calculate(2, operation, 7)
+        assert calculator.cache_info().hits == 1
+
+    @pytest.mark.parametrize("operation", ["-", "/"])
+    def test_cache_non_commutative_operations_keep_order(self, operation):
+        """Test operand order is kept for non-commutative operations."""
+        calculator = Calculator(cache_size=8)
+        forward = calculator.calculate(7, operation, 2)
+        backward = calculator.calculate(2, operation, 7)
+        assert forward != backward
+        assert calculator.cache_info().hits == 0
+
+    def test_cache_keeps_int_and_float_distinct(self):
+        """Test 1 and 1.0 never share an entry."""
+        calculator = Calculator(cache_size=8)
+        assert type(calculator.calculate(1, "+", 2)) is int
+        assert type(calculator.calculate(1.0, "+", 2)) is float
+        assert type(calculator.calculate(1, "+", 2.0)) is float
+        assert calculator.cache_info().hits == 0
+
+    def test_cache_bypassed_for_zero_operands(self):
+        """Test signed zeros are never served from a shared entry."""
+        calculator = Calculator(cache_size=8)
+        assert str(calculator.calculate(0.0, "+", 0.0)) == "0.0"
+        assert str(calculator.calculate(-0.0, "+", -0.0)) == "-0.0"
+        assert calculator.cache_info().size == 0
+
+    def test_cache_does_not_store_errors(self):
+        """Test failed calculations are not cached."""
+        calculator = Calculator(cache_size=8)
+        for _ in range(2):
+            with pytest.raises(OverflowError):
+                calculator.calculate(1e200, "*", 1e200)
+        assert calculator.cache_info().size == 0
+
+    def test_cache_eviction_and_clear(self):
+        """Test the cache is bounded and can be cleared."""
+        calculator = Calculator(cache_size=2)
+        for value in range(1, 5):
+            calculator.calculate(value, "-", 1)
+        info = calculator.cache_info()
+        assert (info.size, info.evictions) == (2, 2)
+
+        calculator.clear_cache()
+        assert calculator.cache_info().size == 0
+
+
+class TestCalculatorInstrumentation:
+    """Test class for opt-in per-operation instrumentation."""
+
+    def test_instrumentation_disabled_by_default(self):
+        """Test the uninstrumented calculate method is used by default."""
+        calculator = Calculator()
+        assert calculator.stats() is None
+        assert "calculate" not in vars(calculator)
+        calculator.reset_stats()
+
+    def test_stats_counts_calls_and_errors(self):
+        """Test calls and errors are counted per operation symbol."""
+        calculator = Calculator(instrument=True)
+        calculator.calculate(1, "+", 2)
+        calculator.calculate(3, "+", 4)
+        with pytest.raises(DivisionByZeroError):
+            calculator.calculate(1, "/", 0)
+        with pytest.raises(InvalidOperationError):
+            calculator.calculate(1, "^", 2)
+
+        stats = calculator.stats()
+        assert stats["+"]["calls"] == 2
+        assert stats["/"]["errors"] == {"DivisionByZeroError": 1}
+        assert stats["invalid"]["errors"] == {"InvalidOperationError": 1}
+        assert sum(count for _, count in stats["+"]["histogram"]) == 2
+        assert stats["+"]["latency_sum"] > 0
+
+    def test_expressions_are_instrumented(self):
+        """Test each step of an evaluated expression is recorded."""
+        calculator = Calculator(instrument=True)
+        assert calculator.evaluate("(a + 2) * 3 + 4", {"a": 1}) == 13
+        stats = calculator.stats()
+        assert (stats["+"]["calls"], stats["*"]["calls"]) == (2, 1)
+
+    def test_folded_constants_are_not_instrumented(self):
+        """Test constants folded at compile time are not recorded as calls."""
+        calculator = Calculator(instrument=True)
+        assert calculator.evaluate("3600 * 24 + a", {"a": 1}) == 86401
+        with pytest.raises(DivisionByZeroError):
+            calculator.evaluate("1 / 0 * 2")
+        stats = calculator.stats()
+        assert "*" not in stats
+        assert stats["+"]["calls"] == 1
+        assert stats["/"]["errors"] == {"DivisionByZeroError": 1}
+
+    def test_merge_stats(self):
+        """Test metrics of another calculator can be merged in."""
+        worker = Calculator(instrument=True)
+        worker.calculate(1, "-", 2)
+        calculator = Calculator(instrument=True)
+        calculator.merge_stats(worker.stats())
+        assert calculator.stats()["-"]["calls"] == 1
+
+        uninstrumented = Calculator()
+        uninstrumented.merge_stats(worker.stats())
+        assert uninstrumented.stats() is None
+
+    def test_reset_stats(self):
+        """Test recorded metrics can be discarded."""
+        calculator = Calculator(instrument=True)
+        calculator.calculate(1, "-", 2)
+        calculator.reset_stats()
+        assert calculator.stats() == {}
@@ -1,5 +1,6 @@
 """Unit tests for the CLI interface."""
 
+import io
 from unittest.mock import patch
 
 import pytest
@@ -160,3 +161,87 @@ class TestCalculatorCLI:
                     "Calculator Error" in str(call)
                     for call in mock_print.call_args_list
                 )
+
+    def test_run_batch(self):
+        """Test batch mode writes one output line per input line."""
+        output = io.StringIO()
+        count = self.cli.run_batch(["5 + 3", "", "help", "8 / 2"], output)
+        assert count == 4
+        assert output.getvalue().splitlines() == [
+            "8",
+            "InvalidInputError: Empty input",
+            "InvalidInputError: Invalid input format. "
+            "Use: 'number operation number' (e.g., '5 + 3')",
+            "4.0",
+        ]
+
+    def test_run_batch_csv(self):
+        """Test batch mode honours the output format."""
+        output = io.StringIO()
+        self.cli.run_batch(["2 * 3"], output, "csv")
+        assert output.getvalue() == "2 * 3,6,,\n"
+
+    def test_run_batch_with_workers(self):
+        """Test batch mode with worker processes keeps input order."""
+        output = io.StringIO()
+        lines = [f"{i} + 1" for i in range(50)]
+        assert self.cli.run_batch(lines, output, workers=2) == 50
+        assert output.getvalue().splitlines() == [str(i + 1) for i in range(50)]
+
+    def test_run_columnar_batch(self):
+        """Test columnar batch mode writes result and error columns."""
+        output = io.StringIO()
+        lines = io.StringIO("a,op,b\n5,+,3\n8,/,0\n")
+        assert self.cli.run_columnar_batch(lines, output) == 2
+        assert output.getvalue() == "result,error\n8.0,\n,DivisionByZeroError\n"
+
+    def test_run_mapped_batch(self, tmp_path):
+        """Test mapped batch mode evaluates a file into a binary stream."""
+        path = tmp_path / "input.txt"
+        path.write_bytes(b"5 + 3\n8 / 0\n")
+        output = io.BytesIO()
+        assert self.cli.run_mapped_batch(str(path), output, "csv") == 2
+        assert output.getvalue() == (
+            b"5 + 3,8,,\n8 / 0,,DivisionByZeroError,Division by zero is not allowed\n"
+        )
+
+    @patch("builtins.print")
+    def test_process_input_expression(self, mock_print):
+        """Test multi-term expressions are evaluated with precedence."""
+        assert self.cli.process_input("(2 + 3) * 4 - 1") is True
+        mock_print.assert_called_with("Result: 19")
+
+    def test_parse_cache_disabled_by_default(self):
+        """Test there is no parse cache summary without a cache."""
+        assert self.cli.parse_cache_summary() is None
+
+    @patch("builtins.input", side_effect=["5 + 3", "5 + 3", "quit"])
+    @patch("builtins.print")
+    def test_run_reports_parse_cache_at_exit(self, mock_print, mock_input):
+        """Test the REPL reports the parse cache hit rate when it exits."""
+        cli = CalculatorCLI(parse_cache_size=16)
+        cli.run()
+        mock_print.assert_called_with(
+            "Parse cache: 1 hits, 1 misses (50.0% hit rate), 0 evictions"
+        )
+
+    def test_instrumentation_disabled_by_default(self):
+        """Test no metrics are recorded without instrumentation."""
+        assert self.cli.parse_metrics is None
+        assert self.cli.calculator.stats() is None
+
+    def test_instrumented_records_parses_and_calculations(self):
+        """Test instrumentation times parsing and calculation separately."""
+        cli = CalculatorCLI(parse_cache_size=8, instrument=True)
+        with patch("builtins.print"):
+            cli.process_input("5 + 3")
+            cli.process_input("5 / 0")
+            cli.process_input("abc")
+            cli.process_input("(1 + 2) * 3")
+
+        parses = cli.parse_metrics.snapshot()["parse"]
+        assert parses["calls"] == 4
+        assert parses["errors"] == {"InvalidInputError": 1}
+        stats = cli.calculator.stats()
+        assert stats["+"]["calls"] == 1
+        assert stats["/"]["errors"] == {"DivisionByZeroError": 1}
@@ -0,0 +1,191 @@
+"""Unit tests for columnar CSV evaluation."""
+
+import io
+import math
+
+import pytest
+
+from calculator.calculator import Calculator
+from calculator.columnar import (
+    evaluate_columns,
+    read_columns,
+    run_columnar,
+    write_columns,
+)
+from calculator.exceptions import CalculatorError, InvalidInputError
+from calculator.operations import Operation
+from calculator.registry import BUILTIN_OPERATIONS, OperationRegistry
+
+CSV = """a,op,b,note
+5,+,3,x
+10,/,0,y
+2.5,*,4,
+1e200,*,1e200,
+abc,+,1,
+7,%,2,
+6, - ,1,
+3,-
+"""
+
+
+class Modulo(Operation):
+    """Operation without a vectorized kernel."""
+
+    def execute(self, a, b):
+        if b == 0:
+            raise CalculatorError("modulo by zero")
+        return a % b
+
+    def get_symbol(self):
+        return "%"
+
+    def get_name(self):
+        return "modulo"
+
+
+class TestReadColumns:
+    """Test class for loading CSV operand columns."""
+
+    def test_columns_are_compact_arrays(self):
+        """Test integer columns load as int64 and others as doubles."""
+        columns = read_columns(io.StringIO("a,op,b\n1,+,2.5\n-3,*,4\n"))
+        assert columns.first.typecode == "q"
+        assert list(columns.first) == [1, -3]
+        assert columns.second.typecode == "d"
+        assert list(columns.second) == [2.5, 4.0]
+        assert columns.operations == bytearray([0, 1])
+        assert columns.symbols == ["+", "*"]
+        assert columns.invalid == {}
+
+    def test_large_integers_widen_column(self):
+        """Test integers beyond int64 widen the column and beyond doubles are kept."""
+        columns = read_columns(
+            io.StringIO(f"a,op,b\n1,+,1\n{2**70},+,1\n{10**400},+,1\n-{10**400},+,1\n")
+        )
+        assert columns.first.typecode == "d"
+        assert list(columns.first) == [1.0, 2.0**70, 0.0, 0.0]
+        assert columns.exact == {2: (10**400, 1), 3: (-(10**400), 1)}
+
+    def test_invalid_rows(self):
+        """Test bad operand cells and short rows are kept as error rows."""
+        columns = read_columns(io.StringIO(CSV))
+        assert len(columns.operations) == 8
+        assert columns.invalid == {4: "InvalidInputError", 7: "InvalidInputError"}
+        assert columns.symbols == ["+", "/", "*", "%", "-"]
+
+    def test_fixed_operation(self):
+        """Test a fixed operation needs no op column."""
+        columns = read_columns(io.StringIO("b,a\n2,1\n"), "/")
+        assert columns.symbols == ["/"]
+        assert (list(columns.first), list(columns.second)) == ([1], [2])
+
+    @pytest.mark.parametrize(
+        "text, operation, message",
+        [
+            ("a,b\n1,2\n", None, "missing columns: op"),
+            ("x,op\n", None, "missing columns: a, b"),
+            ("", "+", "missing columns: a, b"),
+        ],
+    )
+    def test_missing_columns(self, text, operation, message):
+        """Test a header without the required columns is rejected."""
+        with pytest.raises(InvalidInputError, match=message):
+            read_columns(io.StringIO(text), operation)
+
+    def test_too_many_symbols(self):
+        """Test operators beyond one byte of codes become error rows."""
+        rows = "".join(f"1,op{i},1\n" for i in range(257))
+        columns = read_columns(io.StringIO("a,op,b\n" + rows))
+        assert len(columns.symbols) == 256
+        assert columns.invalid == {256: "InvalidOperationError"}
+
+
+class TestEvaluateColumns:
+    """Test class for evaluating loaded columns."""
+
+    def test_results_and_error_codes(self, backend):
+        """Test each row gets its result or its error code."""
+        results, error_codes = evaluate_columns(read_columns(io.StringIO(CSV)))
+        assert error_codes == [
+            None,
+            "DivisionByZeroError",
+            None,
+            "OverflowError",
+            "InvalidInputError",
+            "InvalidOperationError",
+            None,
+            "InvalidInputError",
+        ]
+        assert [results[i] for i in (0, 2, 6)] == [8.0, 10.0, 5.0]
+        assert all(math.isnan(results[i]) for i in (1, 3, 4, 5, 7))
+
+    def test_matches_calculator(self, backend):
+        """Test column results agree with scalar calculations."""
+        calculator = Calculator()
+        rows = [(7, "-", 2), (1.5, "*", -4), (9, "/", 4), (2**40, "+", 3)]
+        text = "a,op,b\n" + "".join(f"{a},{op},{b}\n" for a, op, b in rows)
+        results, error_codes = evaluate_columns(read_columns(io.StringIO(text)))
+        assert error_codes == [None] * len(rows)
+        assert list(results) == [calculator.calculate(*row) for row in rows]
+
+    def test_ints_beyond_double_range(self, backend):
+        """Test rows with ints too large for a double are computed exactly."""
+        calculator = Calculator()
+        big = 10**400
+        rows = [(big, "-", big), (big, "*", 0), (big, "+", 1), (1, "/", big)]
+        text = "a,op,b\n" + "".join(f"{a},{op},{b}\n" for a, op, b in rows)
+        text += f"{big},%,1\n{big},/,0\n"
+        results, error_codes = evaluate_columns(read_columns(io.StringIO(text)))
+        assert error_codes == [
+            None,
+            None,
+            "OverflowError",
+            None,
+            "InvalidOperationError",
+            "DivisionByZeroError",
+        ]
+        assert [results[i] for i in (0, 1, 3)] == [
+            calculator.calculate(*rows[i]) for i in (0, 1, 3)
+        ]
+        assert all(math.isnan(results[i]) for i in (2, 4, 5))
+
+    def test_operation_without_kernel(self, backend):
+        """Test registered operations without a vectorized kernel are evaluated."""
+        registry = OperationRegistry({**BUILTIN_OPERATIONS, "%": Modulo})
+        calculator = Calculator(registry=registry)
+        columns = read_columns(io.StringIO("a,op,b\n7,%,4\n7,%,0\n1,+,1\n"))
+        results, error_codes = evaluate_columns(columns, calculator)
+        assert error_codes == [None, "CalculatorError", None]
+        assert (results[0], results[2]) == (3.0, 2.0)
+
+    def test_unused_fixed_operation(self, backend):
+        """Test an empty input evaluates to empty columns."""
+        results, error_codes = evaluate_columns(read_columns(io.StringIO("a,b\n"), "+"))
+        assert (len(results), error_codes) == (0, [])
+
+
+class TestWriteColumns:
+    """Test class for columnar output."""
+
+    def test_write_columns(self):
+        """Test results and error codes are written as two CSV columns."""
+        output = io.StringIO()
+        results, error_codes = evaluate_columns(read_columns(io.StringIO(CSV)))
+        assert write_columns(results, error_codes, output) == 8
+        assert output.getvalue().splitlines() == [
+            "result,error",
+            "8.0,",
+            ",DivisionByZeroError",
+            "10.0,",
+            ",OverflowError",
+            ",InvalidInputError",
+            ",InvalidOperationError",
+            "5.0,",
+            ",InvalidInputError",
+        ]
+
+    def test_run_columnar_fixed_operation(self):
+        """Test the whole pipeline with a fixed operation."""
+        output = io.StringIO()
+        assert run_columnar(io.StringIO("a,b\n1,4\n3,0\n"), output, "/") == 2
+        assert output.getvalue() == "result,error\n0.25,\n,DivisionByZeroError\n"
@@ -0,0 +1,225 @@
+"""Unit tests for the plain-function operation implementations."""
+
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from calculator.dispatch import (
+    DISPATCH_TABLE,
+    add,
+    add_value,
+    bounded_multiply,
+    divide,
+    divide_value,
+    multiply,
+    multiply_value,
+    subtract,
+    subtract_value,
+)
+from calculator.exceptions import DivisionByZeroError, OverflowError
+from calculator.operations import Addition, Division, Multiplication, Subtraction
+from calculator.status import Status
+
+NAMES = {"+": "Addition", "-": "Subtraction", "*": "Multiplication", "/": "Division"}
+ARITHMETIC = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+}
+
+
+def legacy_execute(symbol, a, b):
+    """Operation.execute() as it was before the dispatch table."""
+    if symbol == "/" and b == 0:
+        raise DivisionByZeroError("Division by zero is not allowed")
+    try:
+        result = ARITHMETIC[symbol](a, b)
+        if abs(result) > 1e308:
+            raise OverflowError(f"{NAMES[symbol]} result {result} causes overflow")
+        return result
+    except (OverflowError, ValueError) as e:
+        raise OverflowError(f"{NAMES[symbol]} overflow: {a} {symbol} {b}") from e
+
+
+def outcome_of(function, *args):
+    """Run a raising function and express what it did as an outcome."""
+    try:
+        return Status.OK, function(*args)
+    except (DivisionByZeroError, OverflowError) as e:
+        return Status.for_exception(e), str(e)
+
+
+EDGE_OPERANDS = [
+    (5, 3),
+    (-7, 4),
+    (2.5, 4.0),
+    (0, 0),
+    (0.0, -0.0),
+    (2**1023, 0),
+    (2**1023, 2**1023),
+    (-(2**1023), -(2**1023)),
+    (int(1e308), 1),
+    (int(1e308), 0),
+    (-int(1e308), -1),
+    (10**308, 1),
+    (10**308, 0),
+    (2**600, 2**600),
+    (1e308, 0.0),
+    (1e308, 1e292),
+    (-1e308, -1e292),
+    (1.7e308, 1.7e308),
+    (float("inf"), 1.0),
+    (float("-inf"), 1.0),
+    (float("nan"), 1.0),
+    (int(1e308), 1.0),
+    (10**308, 0.5),
+    (1e154, 1e155),
+    (Fraction(1, 3), 2),
+    (Fraction(10**308), 1),
+    (Fraction(-(10**308)), -1),
+    (Decimal("1e308"), Decimal(1)),
+    (Decimal("0.1"), Decimal("0.2")),
+    (True, 1),
+]
+
+
+def same_outcome(actual, expected):
+    """Compare outcomes, treating NaN results as equal to each other."""
+    if expected[1] != expected[1]:
+        return actual[0] is expected[0] and actual[1] != actual[1]
+    return actual == expected and type(actual[1]) is type(expected[1])
+
+
+class TestDispatchFunctions:
+    """Test the dispatch functions against the previous class implementations."""
+
+    @pytest.mark.parametrize("a, b", EDGE_OPERANDS)
+    @pytest.mark.parametrize("symbol", ["+", "-", "*", "/"])
+    def test_matches_legacy_execute(self, symbol, a, b):
+        """Test every operand pair gives the legacy result or error."""
+        expected = outcome_of(legacy_execute, symbol, a, b)
+        assert same_outcome(DISPATCH_TABLE[symbol](a, b), expected)
+
+    @pytest.mark.parametrize(
+        "function, a, b, message",
+        [
+            (add, 2**1023, 2**1023, "Addition overflow"),
+            (add, 1e308, 1e308, "Addition overflow"),
+            (add, Fraction(10**308), 10**308, "Addition overflow"),
+            (subtract, -(2**1023), 2**1023, "Subtraction overflow"),
+            (subtract, -1e308, 1e308, "Subtraction overflow"),
+            (subtract, Fraction(10**308), -(10**308), "Subtraction overflow"),
+            (multiply, 10**200, 10**200, "Multiplication overflow"),
+            (multiply, 1e200, -1e200, "Multiplication overflow"),
+            (multiply, Fraction(10**300), 10**9, "Multiplication overflow"),
+            (divide, 1e308, 0.1, "Division overflow"),
+            (divide, Fraction(10**308), Fraction(1, 2), "Division overflow"),
+        ],
+    )
+    def test_overflow(self, function, a, b, message):
+        """Test each result type's overflow check reports an overflow."""
+        status, value = function(a, b)
+        assert status is Status.OVERFLOW
+        assert value.startswith(message)
+
+    @pytest.mark.parametrize("function", [add, subtract, multiply])
+    def test_large_int_below_limit(self, function):
+        """Test ints longer than 1023 bits but below the limit pass."""
+        a = int(1e308) - 10
+        status, value = function(a, 1)
+        assert status is Status.OK
+        assert value.bit_length() == 1024
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [(2**513, 2**512), (-(10**100000), 3), (10**100000, -(10**100000))],
+        ids=["1026-bit", "huge-small", "huge-huge"],
+    )
+    def test_product_rejected_before_computing(self, a, b):
+        """Test int products certain to overflow are rejected from bit lengths."""
+        status, value = multiply(a, b)
+        assert status is Status.OVERFLOW
+        assert value.startswith("Multiplication overflow")
+
+    def test_product_checked_below_bit_bound(self):
+        """Test products the bit lengths do not decide are computed and checked."""
+        assert multiply(2**512 - 1, 2**513 - 1)[0] is Status.OVERFLOW
+        assert multiply(2**512, 2**510) == (Status.OK, 2**1022)
+
+    def test_product_of_huge_int_and_zero(self):
+        """Test a zero operand is not rejected however long the other is."""
+        assert multiply(10**100000, 0) == (Status.OK, 0)
+        assert multiply(0, -(10**100000)) == (Status.OK, 0)
+
+    def test_huge_operands_described_by_size(self):
+        """Test ints beyond the limit are not converted to decimal in messages."""
+        assert multiply(2**5000, 3) == (
+            Status.OVERFLOW,
+            "Multiplication overflow: <5001-bit int> * 3",
+        )
+        assert add(10**5000, 1)[1] == "Addition overflow: <16610-bit int> + 1"
+        assert subtract(1, 10**5000)[1] == "Subtraction overflow: 1 - <16610-bit int>"
+
+    def test_bounded_multiply(self):
+        """Test a bounded multiply() rejects int products longer than its limit."""
+        multiply_bounded = bounded_multiply(8)
+        assert multiply_bounded(15, 17) == (Status.OK, 255)
+        assert multiply_bounded(-16, 16) == (
+            Status.OVERFLOW,
+            "Multiplication overflow: -16 * 16",
+        )
+        assert multiply_bounded(2**20, 2)[0] is Status.OVERFLOW
+        # 4 + 5 bits: the product is computed and has 9
+        assert multiply_bounded(15, 31)[0] is Status.OVERFLOW
+        assert multiply_bounded(2**100, 0) == (Status.OK, 0)
+        assert multiply_bounded(1e300, 1e10)[0] is Status.OVERFLOW
+        assert multiply_bounded(0.5, 1024) == (Status.OK, 512.0)
+        # The limit cannot raise the overflow limit
+        assert bounded_multiply(4096)(2**600, 2**600)[0] is Status.OVERFLOW
+
+    def test_divide_by_zero(self):
+        """Test division by zero is reported before dividing."""
+        assert divide(1, 0) == (
+            Status.DIVISION_BY_ZERO,
+            "Division by zero is not allowed",
+        )
+        assert divide(Fraction(1), Fraction(0))[0] is Status.DIVISION_BY_ZERO
+
+    @pytest.mark.parametrize(
+        "function, a, b, message",
+        [
+            (add, 10**400, 1.0, "Addition overflow: <1329-bit int> + 1.0"),
+            (subtract, 0.5, -(10**400), "Subtraction overflow: 0.5 - <1329-bit int>"),
+            (multiply, 1.5, 10**400, "Multiplication overflow: 1.5 * <1329-bit int>"),
+            (divide, 10**400, 3, "Division overflow: <1329-bit int> / 3"),
+            (divide, -(10**400), 0.5, "Division overflow: <1329-bit int> / 0.5"),
+        ],
+    )
+    def test_int_beyond_float_range(self, function, a, b, message):
+        """Test Python's OverflowError converting an int to float is an overflow."""
+        assert function(a, b) == (Status.OVERFLOW, message)
+
+    @pytest.mark.parametrize(
+        "a, b", EDGE_OPERANDS + [(0.5, -(10**400)), (-(10**400), 1.5)]
+    )
+    @pytest.mark.parametrize(
+        "function, value_function",
+        [
+            (add, add_value),
+            (subtract, subtract_value),
+            (multiply, multiply_value),
+            (divide, divide_value),
+        ],
+    )
+    def test_value_functions_match(self, function, value_function, a, b):
+        """Test each *_value() function returns or raises what its outcome gives."""
+        assert same_outcome(outcome_of(value_function, a, b), function(a, b))
+
+    def test_table_matches_operation_classes(self):
+        """Test the table holds the functions the operation classes use."""
+        operations = [Addition(), Subtraction(), Multiplication(), Division()]
+        assert DISPATCH_TABLE == {op.get_symbol(): op.try_execute for op in operations}
+        assert Addition().try_execute is add
+        assert Addition().execute is add_value
@@ -0,0 +1,190 @@
+"""Unit tests for the OpenMetrics exporter."""
+
+import os
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from calculator.calculator import Calculator
+from calculator.exceptions import DivisionByZeroError
+from calculator.exporter import (
+    CONTENT_TYPE,
+    MetricsExporter,
+    render_openmetrics,
+    write_textfile,
+)
+from calculator.metrics import LATENCY_BUCKETS, OperationMetrics
+
+DIVISION_LABELS = '{op="/",error="DivisionByZeroError"}'
+DIVISION_ERRORS = f"calculator_calculation_errors_total{DIVISION_LABELS}"
+
+
+def samples(text):
+    """Parse exposition text into {sample name with labels: value}."""
+    parsed = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        parsed[name] = float(value)
+    return parsed
+
+
+class TestRenderOpenMetrics:
+    """Test class for render_openmetrics."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metrics = OperationMetrics()
+        self.metrics.record("+", 5e-7)
+        self.metrics.record("+", 2.0)
+        self.metrics.record("/", 1e-7, "DivisionByZeroError")
+
+    def test_counters(self):
+        """Test call and error counters are labeled by op and error class."""
+        text = render_openmetrics(self.metrics.snapshot())
+        parsed = samples(text)
+
+        assert parsed['calculator_calculations_total{op="+"}'] == 2
+        assert parsed['calculator_calculations_total{op="/"}'] == 1
+        assert parsed[DIVISION_ERRORS] == 1
+        assert "# TYPE calculator_calculations counter" in text
+        assert text.endswith("# EOF\n")
+
+    def test_histogram_is_cumulative(self):
+        """Test bucket counts are cumulative and end with +Inf, count and sum."""
+        parsed = samples(render_openmetrics(self.metrics.snapshot()))
+        name = "calculator_calculation_duration_seconds"
+
+        buckets = [
+            parsed[f'{name}_bucket{{op="+",le="{bound!r}"}}']
+            for bound in LATENCY_BUCKETS
+        ]
+        assert buckets == sorted(buckets)
+        assert buckets[0] == 0
+        assert buckets[-1] == 1
+        assert parsed[f'{name}_bucket{{op="+",le="+Inf"}}'] == 2
+        assert parsed[f'{name}_count{{op="+"}}'] == 2
+        assert parsed[f'{name}_sum{{op="+"}}'] == 2.0000005
+
+    def test_parse_families(self):
+        """Test parse metrics are rendered without an op label."""
+        parse = OperationMetrics()
+        parse.record("parse", 1e-6)
+        parse.record("parse", 1e-6, "InvalidInputError")
+
+        parsed = samples(render_openmetrics(None, parse.snapshot()))
+
+        assert parsed["calculator_parses_total"] == 2
+        assert parsed['calculator_parse_errors_total{error="InvalidInputError"}'] == 1
+        assert parsed['calculator_parse_duration_seconds_bucket{le="+Inf"}'] == 2
+        assert not any(name.startswith("calculator_calculations") for name in parsed)
+
+    def test_parse_families_omitted(self):
+        """Test the parse families are omitted without parse metrics."""
+        assert "calculator_parse" not in render_openmetrics({})
+
+    def test_label_values_are_escaped(self):
+        """Test quotes, backslashes and newlines in labels are escaped."""
+        metrics = OperationMetrics()
+        metrics.record('a"b\\c\n', 1e-6)
+        text = render_openmetrics(metrics.snapshot())
+        assert 'calculator_calculations_total{op="a\\"b\\\\c\\n"} 1' in text
+
+
+class TestWriteTextfile:
+    """Test class for write_textfile."""
+
+    def test_replaces_contents(self, tmp_path):
+        """Test the file is replaced and no temporary file is left behind."""
+        path = tmp_path / "calculator.prom"
+        path.write_text("old")
+
+        write_textfile(str(path), "new\n")
+
+        assert path.read_text() == "new\n"
+        assert os.listdir(tmp_path) == ["calculator.prom"]
+
+    def test_failed_write_removes_temporary_file(self, tmp_path):
+        """Test a failed rename leaves neither the target nor a temporary file."""
+        path = tmp_path / "calculator.prom"
+        with patch("calculator.exporter.os.replace", side_effect=OSError("boom")):
+            with pytest.raises(OSError):
+                write_textfile(str(path), "text")
+        assert os.listdir(tmp_path) == []
+
+
+class TestMetricsExporter:
+    """Test class for MetricsExporter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = Calculator(instrument=True)
+        self.parse_metrics = OperationMetrics()
+        self.exporter = MetricsExporter(self.calculator, self.parse_metrics)
+
+    def test_render(self):
+        """Test render reflects calculations made so far."""
+        self.calculator.calculate(1, "+", 2)
+        with pytest.raises(DivisionByZeroError):
+            self.calculator.calculate(1, "/", 0)
+
+        parsed = samples(self.exporter.render())
+
+        assert parsed['calculator_calculations_total{op="+"}'] == 1
+        assert parsed[DIVISION_ERRORS] == 1
+        assert "calculator_parses_total" not in parsed
+
+    def test_render_uninstrumented(self):
+        """Test an uninstrumented calculator renders empty families."""
+        exporter = MetricsExporter(Calculator())
+        text = exporter.render()
+        assert "calculator_calculations_total" not in text
+        assert "calculator_parse" not in text
+
+    def test_serve(self):
+        """Test GET /metrics returns the exposition text."""
+        self.calculator.calculate(2, "*", 3)
+        server = self.exporter.serve("127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{url}/metrics") as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE
+                body = response.read().decode()
+            assert 'calculator_calculations_total{op="*"} 1' in body
+
+            with pytest.raises(urllib.error.HTTPError) as info:
+                urllib.request.urlopen(f"{url}/other")
+            assert info.value.code == 404
+        finally:
+            self.exporter.close()
+
+    def test_textfile_written_periodically_and_on_close(self, tmp_path):
+        """Test the textfile is written at start, by the writer and on close."""
+        path = tmp_path / "calculator.prom"
+        writes = []
+        rewritten = threading.Event()
+        original = self.exporter.write_textfile
+
+        def record_write(target):
+            original(target)
+            writes.append(target)
+            if len(writes) >= 3:
+                rewritten.set()
+
+        self.exporter.write_textfile = record_write
+        self.exporter.start_textfile(str(path), interval=0.01)
+        assert path.read_text().endswith("# EOF\n")
+        assert rewritten.wait(5)
+
+        self.calculator.calculate(1, "+", 1)
+        self.exporter.close()
+
+        assert samples(path.read_text())['calculator_calculations_total{op="+"}'] == 1
+
+    def test_close_without_publishing(self):
+        """Test close is a no-op when nothing was started."""
+        self.exporter.close()
@@ -0,0 +1,478 @@
+"""Unit tests for the expression engine."""
+
+import math
+import sys
+from array import array
+
+import pytest
+
+from calculator.calculator import Calculator
+from calculator.exceptions import (
+    DivisionByZeroError,
+    InvalidInputError,
+    InvalidOperationError,
+    OverflowError,
+)
+from calculator.expression import (
+    APPLY,
+    LOAD,
+    PUSH,
+    RECALL,
+    STORE,
+    BinaryOp,
+    Literal,
+    Variable,
+    compile_expression,
+    evaluate_input,
+    fold_constants,
+    parse_expression,
+    tokenize,
+)
+from calculator.registry import OperationRegistry
+from calculator.status import OK, Status
+from calculator.validation import InputValidator
+
+
+class TestTokenize:
+    """Test class for the expression tokenizer."""
+
+    def test_tokenize_numbers_and_symbols(self):
+        """Test numbers are converted and symbols are kept."""
+        assert tokenize(" (1.5+2) * 3e2 ") == [
+            ("symbol", "("),
+            ("number", 1.5),
+            ("symbol", "+"),
+            ("number", 2),
+            ("symbol", ")"),
+            ("symbol", "*"),
+            ("number", 300.0),
+        ]
+
+    def test_tokenize_names(self):
+        """Test identifiers become name tokens."""
+        assert tokenize("price*qty_2 - _x") == [
+            ("name", "price"),
+            ("symbol", "*"),
+            ("name", "qty_2"),
+            ("symbol", "-"),
+            ("name", "_x"),
+        ]
+
+    def test_tokenize_unexpected_character(self):
+        """Test unknown characters are reported."""
+        with pytest.raises(InvalidInputError, match="Unexpected character '@'"):
+            tokenize("1 + @2")
+
+
+class TestParseExpression:
+    """Test class for the precedence-climbing parser."""
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            (
+                "1 + 2 * 3",
+                BinaryOp("+", Literal(1), BinaryOp("*", Literal(2), Literal(3))),
+            ),
+            (
+                "1 - 2 - 3",
+                BinaryOp("-", BinaryOp("-", Literal(1), Literal(2)), Literal(3)),
+            ),
+            (
+                "(1 + 2) * 3",
+                BinaryOp("*", BinaryOp("+", Literal(1), Literal(2)), Literal(3)),
+            ),
+            ("-2 * +3", BinaryOp("*", Literal(-2), Literal(3))),
+            ("--4", Literal(4)),
+            ("-(1)", Literal(-1)),
+            (
+                "-(1 + 2)",
+                BinaryOp("*", Literal(-1), BinaryOp("+", Literal(1), Literal(2))),
+            ),
+            (
+                "-a * (b + 2)",
+                BinaryOp(
+                    "*",
+                    BinaryOp("*", Literal(-1), Variable("a")),
+                    BinaryOp("+", Variable("b"), Literal(2)),
+                ),
+            ),
+        ],
+    )
+    def test_parse_structure(self, source, expected):
+        """Test precedence, associativity and unary operators."""
+        assert parse_expression(source) == expected
+
+    @pytest.mark.parametrize(
+        "source, message",
+        [
+            ("", "Empty expression"),
+            ("1 +", "Unexpected end of expression"),
+            ("(1 + 2", "Missing closing parenthesis"),
+            ("1 + 2)", "Unexpected '\\)'"),
+            ("* 2", "Unexpected '\\*'"),
+            ("1 2", "Unexpected '2'"),
+            ("2e", "Unexpected 'e'"),
+            ("a b", "Unexpected 'b'"),
+            ("(" * 200 + "1" + ")" * 200, "nested too deeply"),
+            ("-" * 200 + "1", "nested too deeply"),
+        ],
+    )
+    def test_parse_errors(self, source, message):
+        """Test malformed expressions raise InvalidInputError."""
+        with pytest.raises(InvalidInputError, match=message):
+            parse_expression(source)
+
+
+class TestCompileExpression:
+    """Test class for compiled postfix programs."""
+
+    def test_compile_postfix(self):
+        """Test programs are emitted in postfix order."""
+        program = compile_expression("(1 + 2) * 3")
+        assert program.instructions == (
+            (PUSH, 1),
+            (PUSH, 2),
+            (APPLY, "+"),
+            (PUSH, 3),
+            (APPLY, "*"),
+        )
+
+    def test_compile_variables(self):
+        """Test variables are loaded by name and listed once in order of use."""
+        program = compile_expression("b * a + b")
+        assert program.instructions == (
+            (LOAD, "b"),
+            (LOAD, "a"),
+            (APPLY, "*"),
+            (LOAD, "b"),
+            (APPLY, "+"),
+        )
+        assert program.variables == ("b", "a")
+        assert compile_expression("1 + 2").variables == ()
+
+    def test_compile_is_cached_by_source(self):
+        """Test repeated sources reuse the compiled program."""
+        assert compile_expression("4 / (2 - 1)") is compile_expression("4 / (2 - 1)")
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("(2 + 3) * 4", 20),
+            ("10 / (1 - 3)", -5.0),
+            ("2 + 3 * 4 - 6 / 2", 11.0),
+            ("-2 * -(1 + 1)", 4),
+            ("7", 7),
+            ("1.5 * (2 + .5)", 3.75),
+        ],
+    )
+    def test_calculator_evaluate(self, source, expected):
+        """Test Calculator.evaluate computes expressions."""
+        assert Calculator().evaluate(source) == expected
+
+    def test_calculator_evaluate_errors(self):
+        """Test operation errors propagate from expressions."""
+        calculator = Calculator()
+        with pytest.raises(DivisionByZeroError):
+            calculator.evaluate("1 / (2 - 2)")
+        with pytest.raises(OverflowError):
+            calculator.evaluate("1e200 * 1e200 + 1")
+
+    def test_long_chains_do_not_recurse(self):
+        """Test chains far deeper than the recursion limit compile and fold."""
+        terms = sys.getrecursionlimit() * 3
+        program = compile_expression(" + ".join(["x"] * terms))
+        assert program.instructions.count((APPLY, "+")) == terms - 1
+        calculator = Calculator()
+        assert program.evaluate(calculator.calculate, {"x": 1}) == terms
+        assert calculator.evaluate("-".join(["1"] * terms)) == 2 - terms
+        assert calculator.compile("*".join(["2"] * 100 + ["x"] * terms)).variables == (
+            "x",
+        )
+
+
+class TestCommonSubexpressions:
+    """Test class for compiling repeated subexpressions once."""
+
+    def test_repeated_subtree_is_stored_and_recalled(self):
+        """Test the second occurrence recalls the first one's result."""
+        program = compile_expression("(a + b) * (a + b)")
+        assert program.instructions == (
+            (LOAD, "a"),
+            (LOAD, "b"),
+            (APPLY, "+"),
+            (STORE, 0),
+            (RECALL, 0),
+            (APPLY, "*"),
+        )
+
+    def test_only_the_outermost_repeat_is_stored(self):
+        """Test subtrees repeated only inside a repeated subtree are not stored."""
+        program = compile_expression("(a + b) * c - (a + b) * c")
+        assert [opcode for opcode, _ in program.instructions].count(STORE) == 1
+        assert program.instructions[-3:] == ((STORE, 0), (RECALL, 0), (APPLY, "-"))
+
+    @pytest.mark.parametrize(
+        "source", ["(x + 1) * (x + 1.0)", "(x * 0.0) - (x * -0.0)", "a - b + (b - a)"]
+    )
+    def test_different_subtrees_are_not_shared(self, source):
+        """Test constants of different type or sign are not confused."""
+        opcodes = [opcode for opcode, _ in compile_expression(source).instructions]
+        assert STORE not in opcodes
+
+    def test_results_match_unshared_evaluation(self):
+        """Test recalled values give the same results as recomputing them."""
+        calculator = Calculator()
+        variables = {"a": 3, "b": 0.5, "c": -2}
+        source = "(a + b) * c - (a + b) * c / ((a + b) * c) + (a + b)"
+        expected = ((3 + 0.5) * -2) - ((3 + 0.5) * -2) / ((3 + 0.5) * -2) + 3.5
+        assert calculator.evaluate(source, variables) == expected
+        results, error_codes = calculator.evaluate_columns(
+            source, {name: [value, value] for name, value in variables.items()}
+        )
+        assert list(results) == [expected, expected]
+        assert error_codes == [None, None]
+
+    def test_error_in_shared_subtree(self):
+        """Test errors of a shared subtree are raised at its first occurrence."""
+        calculator = Calculator()
+        with pytest.raises(DivisionByZeroError):
+            calculator.evaluate("a / b + a / b", {"a": 1, "b": 0})
+        results, error_codes = calculator.evaluate_columns(
+            "a / b + a / b", {"a": [1, 1], "b": [0, 2]}
+        )
+        assert error_codes == ["DivisionByZeroError", None]
+        assert results[1] == 1.0
+
+
+class TestConstantFolding:
+    """Test class for folding operations on constants."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = Calculator()
+
+    def test_constants_are_folded(self):
+        """Test operations on constants are replaced by their results."""
+        program = self.calculator.compile("3600 * 24 * x - (1 + 2) * 3")
+        assert program.instructions == (
+            (PUSH, 86400),
+            (LOAD, "x"),
+            (APPLY, "*"),
+            (PUSH, 9),
+            (APPLY, "-"),
+        )
+        assert self.calculator.evaluate("3600 * 24 * x - (1 + 2) * 3", {"x": 2}) == (
+            172791
+        )
+        assert self.calculator.compile("-(2 * 3)").instructions == ((PUSH, -6),)
+
+    def test_operations_are_not_reordered(self):
+        """Test constants on either side of a variable are not combined."""
+        program = self.calculator.compile("x + 1 + 2")
+        assert program is compile_expression("x + 1 + 2")
+
+    @pytest.mark.parametrize(
+        "source, error",
+        [
+            ("1 / 0 + x", DivisionByZeroError),
+            ("1e308 * 10 / 10", OverflowError),
+            ("1 / (2 - 2)", DivisionByZeroError),
+        ],
+    )
+    def test_failing_operations_are_not_folded(self, source, error):
+        """Test folding leaves failing operations to raise when evaluated."""
+        program = self.calculator.compile(source)
+        assert (APPLY, "/") in program.instructions
+        with pytest.raises(error):
+            self.calculator.evaluate(source, {"x": 1})
+        with pytest.raises(error):
+            compile_expression(source).evaluate(self.calculator.calculate, {"x": 1})
+
+    def test_folding_uses_the_calculators_operations(self):
+        """Test operations missing from the calculator are not folded."""
+        calculator = Calculator(registry=OperationRegistry())
+        assert calculator.compile("1 + 2").instructions == (
+            (PUSH, 1),
+            (PUSH, 2),
+            (APPLY, "+"),
+        )
+        with pytest.raises(InvalidOperationError):
+            calculator.evaluate("1 + 2")
+
+    @pytest.mark.parametrize("error", [InvalidInputError("bad"), ArithmeticError()])
+    def test_raising_operations_are_not_folded(self, error):
+        """Test operations raising instead of returning a status stay in place."""
+
+        def try_calculate(a, symbol, b):
+            raise error
+
+        tree = parse_expression("1 + 2")
+        assert fold_constants(tree, try_calculate) is tree
+
+    def test_fold_constants_partially(self):
+        """Test only the constant operands of an operation are folded."""
+        tree = fold_constants(
+            parse_expression("x * (2 + 3)"), lambda a, symbol, b: (OK, a + b)
+        )
+        assert tree == BinaryOp("*", Variable("x"), Literal(5))
+        assert fold_constants(
+            parse_expression("2 + 3"), lambda a, symbol, b: (Status.OVERFLOW, "")
+        ) == BinaryOp("+", Literal(2), Literal(3))
+
+    def test_compiled_programs_are_cached(self):
+        """Test each calculator compiles an expression once."""
+        assert self.calculator.compile("2 * x") is self.calculator.compile("2 * x")
+        with pytest.raises(InvalidInputError):
+            self.calculator.compile("2 *")
+
+
+class TestVariables:
+    """Test class for evaluating expressions with variables."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = Calculator()
+
+    def test_evaluate_with_variables(self):
+        """Test variables are bound to the given values."""
+        variables = {"price": 2.5, "qty": 4, "discount": 1, "unused": 0}
+        assert self.calculator.evaluate("price * qty - discount", variables) == 9.0
+        assert self.calculator.evaluate("x * x", {"x": 10**100}) == 10**200
+
+    def test_undefined_variable(self):
+        """Test unbound variables raise InvalidInputError."""
+        with pytest.raises(InvalidInputError, match="Undefined variable 'qty'"):
+            self.calculator.evaluate("price * qty", {"price": 1})
+        with pytest.raises(InvalidInputError, match="Undefined variable 'price'"):
+            self.calculator.evaluate("price * 2")
+
+    def test_operation_errors(self):
+        """Test operation errors propagate as with constants."""
+        with pytest.raises(DivisionByZeroError):
+            self.calculator.evaluate("a / (b - b)", {"a": 1, "b": 2})
+
+
+class TestEvaluateColumns:
+    """Test class for evaluating formulas over columns."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = Calculator()
+
+    def test_formula_over_columns(self, backend):
+        """Test every row is computed from its own column values."""
+        columns = {
+            "price": array("q", [10, 20, 30]),
+            "qty": [1, 2, 3],
+            "discount": array("d", [0.5, 0.0, 10.0]),
+        }
+        results, error_codes = self.calculator.evaluate_columns(
+            "price * qty - discount / 2", columns
+        )
+        assert list(results) == [9.75, 40.0, 85.0]
+        assert error_codes == [None, None, None]
+
+    def test_first_error_wins(self, backend):
+        """Test failed rows are NaN with the code of their first error."""
+        columns = {"a": [1, 1e200, 1, 6], "b": [0, 1e200, 0, 3]}
+        results, error_codes = self.calculator.evaluate_columns(
+            "a / b * (a * b) / b", columns
+        )
+        assert error_codes == [
+            "DivisionByZeroError",
+            "OverflowError",
+            "DivisionByZeroError",
+            None,
+        ]
+        assert all(math.isnan(value) for value in results[:3])
+        assert results[3] == 12.0
+
+    def test_bare_variable_is_copied(self, backend):
+        """Test a formula naming one column returns a copy of it."""
+        column = [1.5, 2.5]
+        results, error_codes = self.calculator.evaluate_columns("x", {"x": column})
+        results[0] = 0
+        assert column == [1.5, 2.5]
+        assert error_codes == [None, None]
+
+    def test_constant_formula(self, backend):
+        """Test a formula without variables gives a single row."""
+        results, error_codes = self.calculator.evaluate_columns("2 * 3", {})
+        assert list(results) == [6]
+        assert error_codes == [None]
+
+    def test_constant_beyond_float_range(self, backend):
+        """Test constants too large for a double overflow per row."""
+        results, error_codes = self.calculator.evaluate_columns(
+            "x * " + "9" * 400, {"x": [2]}
+        )
+        assert error_codes == ["OverflowError"]
+
+    def test_column_ints_beyond_float_range(self, backend):
+        """Test column ints too large for a double are computed exactly per row."""
+        columns = {"x": [10**400, 2], "y": [0, 3]}
+        results, error_codes = self.calculator.evaluate_columns("x * y", columns)
+        assert list(results) == [0, 6]
+        results, error_codes = self.calculator.evaluate_columns("x * y + x", columns)
+        assert error_codes == ["OverflowError", None]
+        assert results[1] == 8
+
+        results, error_codes = self.calculator.evaluate_columns("x", columns)
+        if backend == "numpy":
+            # Only the NumPy path converts the column to float64
+            assert math.isnan(results[0]) and results[1] == 2
+            assert error_codes == ["OverflowError", None]
+        else:
+            assert results == [10**400, 2]
+
+    def test_empty_columns(self, backend):
+        """Test empty columns give empty results."""
+        results, error_codes = self.calculator.evaluate_columns(
+            "a + b", {"a": [], "b": []}
+        )
+        assert list(results) == []
+        assert error_codes == []
+
+    def test_missing_column(self):
+        """Test variables without a column raise InvalidInputError."""
+        with pytest.raises(InvalidInputError, match="Undefined variable 'b'"):
+            self.calculator.evaluate_columns("a + b", {"a": [1]})
+
+    def test_column_lengths_differ(self):
+        """Test named columns must have the same length."""
+        with pytest.raises(InvalidInputError, match="a=2, b=1"):
+            self.calculator.evaluate_columns("a + b", {"a": [1, 2], "b": [1], "c": []})
+
+    def test_invalid_operation(self):
+        """Test operations missing from the calculator raise."""
+        calculator = Calculator(registry=OperationRegistry())
+        with pytest.raises(InvalidOperationError):
+            calculator.evaluate_columns("a + b", {"a": [1], "b": [2]})
+
+
+class TestEvaluateInput:
+    """Test class for evaluate_input."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calculator = Calculator()
+        self.validator = InputValidator()
+
+    def test_simple_input(self):
+        """Test simple input uses the validator fast path."""
+        assert evaluate_input(self.calculator, self.validator, "5 + 3") == 8
+
+    def test_expression_input(self):
+        """Test expressions fall back to the expression engine."""
+        assert evaluate_input(self.calculator, self.validator, "(5 + 3) * 2") == 16
+
+    def test_invalid_input_keeps_validator_message(self):
+        """Test invalid input reports the validator's original message."""
+        with pytest.raises(InvalidInputError, match="Invalid input format"):
+            evaluate_input(self.calculator, self.validator, "abc + def")
+
+    def test_variables_keep_validator_message(self):
+        """Test input naming variables reports the validator's message."""
+        with pytest.raises(InvalidInputError, match="Invalid input format"):
+            evaluate_input(self.calculator, self.validator, "x * (y + 1)")
@@ -0,0 +1,289 @@
+"""Unit tests for fixed-point decimal arithmetic."""
+
+import re
+from array import array
+
+import pytest
+
+from calculator import validation
+from calculator.exceptions import (
+    DivisionByZeroError,
+    InvalidInputError,
+    InvalidOperationError,
+    OverflowError,
+)
+from calculator.fixed_point import (
+    MAX_SCALE,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    ROUNDING_MODES,
+    FixedPoint,
+    FixedPointAddition,
+    FixedPointDivision,
+    FixedPointMultiplication,
+    FixedPointOperation,
+    divide_rounded,
+    fixed_point_registry,
+    format_fixed_point,
+)
+from calculator.validation import FIXED_POINT_MAX
+
+# Quotients of 25/10, -25/10, 15/10, 26/10 and -21/10 in each rounding mode
+ROUNDED_QUOTIENTS = {
+    ROUND_HALF_EVEN: [2, -2, 2, 3, -2],
+    ROUND_HALF_UP: [3, -3, 2, 3, -2],
+    ROUND_DOWN: [2, -2, 1, 2, -2],
+    ROUND_UP: [3, -3, 2, 3, -3],
+    ROUND_FLOOR: [2, -3, 1, 2, -3],
+    ROUND_CEILING: [3, -2, 2, 3, -2],
+}
+
+
+class TestRounding:
+    """Test class for rounded integer division and formatting."""
+
+    @pytest.mark.parametrize("rounding", ROUNDING_MODES)
+    def test_divide_rounded(self, rounding):
+        """Test each rounding mode on ties and non-ties of both signs."""
+        numerators = [25, -25, 15, 26, -21]
+        assert [
+            divide_rounded(numerator, 10, rounding) for numerator in numerators
+        ] == ROUNDED_QUOTIENTS[rounding]
+        # A negative divisor rounds like the negated numerator
+        assert [
+            divide_rounded(-numerator, -10, rounding) for numerator in numerators
+        ] == ROUNDED_QUOTIENTS[rounding]
+
+    def test_exact_division_is_not_rounded(self):
+        """Test exact quotients are unchanged in every mode."""
+        for rounding in ROUNDING_MODES:
+            assert divide_rounded(-30, 10, rounding) == -3
+            assert divide_rounded(0, 7, rounding) == 0
+
+    def test_unknown_rounding_mode(self):
+        """Test unknown modes are rejected, listing the valid ones."""
+        with pytest.raises(ValueError, match="Valid modes: half-even"):
+            divide_rounded(1, 2, "nearest")
+
+    def test_format_fixed_point(self):
+        """Test scaled ints are formatted with exactly scale places."""
+        assert format_fixed_point(30, 2) == "0.30"
+        assert format_fixed_point(-5, 2) == "-0.05"
+        assert format_fixed_point(123456, 3) == "123.456"
+        assert format_fixed_point(-42, 0) == "-42"
+        assert format_fixed_point(FIXED_POINT_MAX, 18) == "9.223372036854775807"
+
+
+class TestFixedPoint:
+    """Test class for the FixedPoint mode."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.fixed = FixedPoint()
+
+    def test_sums_are_exact(self):
+        """Test decimal fractions add without binary rounding error."""
+        assert 0.1 + 0.2 != 0.3
+        assert self.fixed.evaluate("0.1 + 0.2") == "0.30"
+        total = 0
+        for _ in range(10):
+            total = self.fixed.calculate(total, "+", self.fixed.parse("0.1"))
+        assert self.fixed.format(total) == "1.00"
+
+    def test_evaluate_operations(self):
+        """Test every operation of the mode."""
+        assert self.fixed.evaluate("19.99 - 5") == "14.99"
+        assert self.fixed.evaluate("19.99 * 3") == "59.97"
+        assert self.fixed.evaluate("-1.5 * 0.25") == "-0.38"
+        assert self.fixed.evaluate("10 / 3") == "3.33"
+        assert self.fixed.evaluate("-2 / 3") == "-0.67"
+        assert self.fixed.evaluate("1 / -8") == "-0.12"
+
+    def test_rounding_mode(self):
+        """Test multiplication and division use the configured mode."""
+        assert FixedPoint(rounding=ROUND_HALF_UP).evaluate("1 / 8") == "0.13"
+        assert FixedPoint(rounding=ROUND_FLOOR).evaluate("-1 / 3") == "-0.34"
+        assert FixedPoint(rounding=ROUND_CEILING).evaluate("0.05 * 0.05") == "0.01"
+        assert FixedPoint(scale=0, rounding=ROUND_DOWN).evaluate("-7 / 2") == "-3"
+        assert FixedPoint(scale=0, rounding=ROUND_UP).evaluate("7 / 2") == "4"
+
+    def test_parse(self):
+        """Test decimal text is parsed into scaled ints."""
+        assert self.fixed.parse("12.5") == 1250
+        assert self.fixed.parse("-0.07") == -7
+        assert FixedPoint(scale=4).parse("1.5e-2") == 150
+        with pytest.raises(InvalidInputError, match="more than 2 decimal places"):
+            self.fixed.parse("0.125")
+
+    def test_parse_column(self):
+        """Test a column of decimal text is parsed into int64 values."""
+        column = self.fixed.parse_column(["1.5", "-2", "0.01"])
+        assert column == array("q", [150, -200, 1])
+        with pytest.raises(InvalidInputError):
+            self.fixed.parse_column(["1", "x"])
+
+    def test_errors(self):
+        """Test invalid input and failing calculations raise calculator errors."""
+        with pytest.raises(DivisionByZeroError):
+            self.fixed.evaluate("1 / 0.00")
+        with pytest.raises(
+            OverflowError, match="Multiplication overflow: 1000000000000000000 \\* 10"
+        ):
+            FixedPoint(scale=0).calculate(10**18, "*", 10)
+        with pytest.raises(OverflowError, match="Addition overflow"):
+            self.fixed.calculate(FIXED_POINT_MAX, "+", 1)
+        with pytest.raises(OverflowError, match="Subtraction overflow"):
+            self.fixed.calculate(-FIXED_POINT_MAX, "-", 1)
+        with pytest.raises(OverflowError, match="Division overflow: 92233720"):
+            self.fixed.calculate(FIXED_POINT_MAX, "/", 1)
+        with pytest.raises(InvalidInputError, match="Invalid input format"):
+            self.fixed.evaluate("1 +")
+        with pytest.raises(InvalidOperationError):
+            self.fixed.calculate(1, "^", 2)
+
+    def test_operations_execute(self):
+        """Test the operations raise on failure when used directly."""
+        assert FixedPointMultiplication(1).execute(15, -15) == -22
+        with pytest.raises(DivisionByZeroError):
+            FixedPointDivision().execute(1, 0)
+
+    def test_kernel_is_abstract(self):
+        """Test an operation without a column kernel cannot be instantiated."""
+
+        class Incomplete(FixedPointOperation):
+            def try_execute(self, a, b):
+                return FixedPointAddition().try_execute(a, b)
+
+            def get_name(self):
+                return "incomplete"
+
+        with pytest.raises(TypeError, match="_fixed_kernel"):
+            Incomplete()
+
+    def test_invalid_configuration(self):
+        """Test the scale and rounding mode are validated."""
+        with pytest.raises(ValueError, match="Scale must be between 0 and 18"):
+            FixedPoint(scale=MAX_SCALE + 1)
+        with pytest.raises(ValueError, match="Scale must be between"):
+            FixedPoint(scale=-1)
+        with pytest.raises(ValueError, match="Unknown rounding mode 'nearest'"):
+            fixed_point_registry(rounding="nearest")
+
+    def test_calculator_features(self):
+        """Test caching and instrumentation of the wrapped calculator."""
+        fixed = FixedPoint(cache_size=8, instrument=True)
+        assert fixed.evaluate("1.10 * 2") == "2.20"
+        assert fixed.evaluate("1.10 * 2") == "2.20"
+        assert fixed.calculator.get_available_operations()["*"] == "multiplication"
+        assert fixed.calculator.stats()["*"]["calls"] == 2
+
+
+class TestFixedPointColumns:
+    """Test class for column evaluation of fixed-point operations."""
+
+    def test_calculate_columns(self, backend):
+        """Test each operation over columns, including failing rows."""
+        fixed = FixedPoint()
+        a = fixed.parse_column(["0.10", "5", "-1", "2.50"])
+        b = fixed.parse_column(["0.20", "0", "3", "-0.04"])
+
+        results, codes = fixed.calculate_columns(a, "+", b)
+        assert list(results) == [30, 500, 200, 246]
+        assert codes == [None] * 4
+
+        results, codes = fixed.calculate_columns(a, "/", b)
+        assert list(results) == [50, 0, -33, -6250]
+        assert codes == [None, "DivisionByZeroError", None, None]
+
+        results, codes = fixed.calculate_columns(a, "*", b)
+        assert list(results) == [2, 0, -300, -10]
+        assert codes == [None] * 4
+
+    @pytest.mark.parametrize(
+        "cells",
+        [
+            ["1.5", "-2", "0.01", "+.5", "-.25", "5.", "-0", "+0.10"],
+            ["123456789012", "-1234567890.1"],
+            ["1234567890123", "7"],
+            [" 7 ", "1e2", "-1.5E-1"],
+            [],
+        ],
+    )
+    def test_parse_column_matches_parse(self, backend, cells):
+        """Test whole-column parsing agrees with parsing cell by cell."""
+        fixed = FixedPoint()
+        assert fixed.parse_column(cells) == array("q", map(fixed.parse, cells))
+
+    @pytest.mark.parametrize(
+        "cell", ["-", ".", "", "1.2.3", "+-1", "1-2", "0.125", "1_0", "5\n5", "nan"]
+    )
+    def test_parse_column_rejects(self, backend, cell):
+        """Test every invalid cell is rejected with the scalar parser's error."""
+        with pytest.raises(InvalidInputError) as expected:
+            FixedPoint().parse(cell)
+        with pytest.raises(InvalidInputError, match=re.escape(str(expected.value))):
+            FixedPoint().parse_column(["1.25", cell])
+
+    def test_parse_column_digit_limit(self, backend, monkeypatch):
+        """Test short cells still obey a lowered digit limit."""
+        monkeypatch.setattr(validation, "MAX_NUMBER_DIGITS", 3)
+        with pytest.raises(InvalidInputError, match="the limit is 3"):
+            FixedPoint().parse_column(["1.25", "123.4"])
+
+    def test_result_type(self, backend):
+        """Test results are int64 arrays on either path."""
+        results, _ = FixedPointAddition().execute_array([1], [2])
+        if backend == "numpy":
+            assert results.dtype.name == "int64"
+        else:
+            assert isinstance(results, array) and results.typecode == "q"
+
+    def test_overflow_rows(self, backend):
+        """Test results beyond int64 are reported and large operands stay exact."""
+        fixed = FixedPoint(scale=0)
+        big = FIXED_POINT_MAX
+        a = [big, -big, 3 * 10**9, 10**12, big, 1, 7]
+        b = [1, 1, 3 * 10**9, 10**8, 1, big, -(10**18)]
+
+        results, codes = fixed.calculate_columns(a, "+", b)
+        assert codes[:2] == ["OverflowError", None]
+        assert list(results[:2]) == [0, 1 - big]
+
+        results, codes = fixed.calculate_columns(a, "-", b)
+        assert codes[:2] == [None, "OverflowError"]
+
+        results, codes = fixed.calculate_columns(a, "*", b)
+        assert list(results[2:4]) == [9 * 10**18, 0]
+        assert codes[2:4] == [None, "OverflowError"]
+        assert list(results[4:6]) == [big, big]
+
+        results, codes = FixedPoint(scale=18).calculate_columns(a, "/", b)
+        assert codes[:3] == ["OverflowError", "OverflowError", None]
+        assert list(results[2:3]) + list(results[6:]) == [10**18, -7]
+
+    @pytest.mark.parametrize("rounding", ROUNDING_MODES)
+    def test_columns_match_scalars(self, backend, rounding):
+        """Test column results equal scalar results in every rounding mode."""
+        values = [0, 1, -1, 5, -5, 15, -25, 999, -1001, 10**9 + 7, -(2**62), 2**62]
+        a = [x for x in values for _ in values]
+        b = [y for _ in values for y in values]
+        for operation in (
+            FixedPointMultiplication(3, rounding),
+            FixedPointDivision(3, rounding),
+        ):
+            results, codes = operation.execute_array(array("q", a), array("q", b))
+            for x, y, result, code in zip(a, b, results, codes):
+                status, expected = operation.try_execute(x, y)
+                if code is None:
+                    assert result == expected
+                else:
+                    assert code == status.value and result == 0
+
+    def test_length_mismatch(self, backend):
+        """Test columns of different lengths are rejected."""
+        with pytest.raises(ValueError, match="differ in length: 2 != 1"):
+            FixedPointAddition().execute_array([1, 2], [3])
@@ -0,0 +1,182 @@
+"""Unit tests for the JSON-over-HTTP calculation service."""
+
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from calculator import http_server, validation
+from calculator.calculator import Calculator
+from calculator.http_server import create_http_server, evaluate_item
+
+
+@pytest.fixture
+def server():
+    """Run an HTTP server on a free port for the duration of a test."""
+    running = create_http_server("127.0.0.1", 0)
+    thread = threading.Thread(
+        target=running.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield running
+    running.shutdown()
+    running.server_close()
+    thread.join()
+
+
+def post(server, path, body, headers=None):
+    """POST a body and return (status, headers, decoded JSON)."""
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    data = body if isinstance(body, bytes) else json.dumps(body).encode()
+    connection.request("POST", path, body=data, headers=headers or {})
+    response = connection.getresponse()
+    payload = json.loads(response.read())
+    connection.close()
+    return response.status, response, payload
+
+
+class TestEvaluateItem:
+    """Test class for evaluate_item."""
+
+    @pytest.mark.parametrize(
+        "item, expected",
+        [
+            ({"a": 5, "op": "+", "b": 3}, {"result": 8}),
+            ({"a": "1e3", "op": "/", "b": 4}, {"result": 250.0}),
+            (
+                {"a": 1, "op": "/", "b": 0},
+                {
+                    "error": "DivisionByZeroError",
+                    "message": "Division by zero is not allowed",
+                },
+            ),
+        ],
+    )
+    def test_evaluate_item(self, item, expected):
+        """Test items produce results or error codes."""
+        assert evaluate_item(Calculator(), item) == expected
+
+    @pytest.mark.parametrize(
+        "item, code",
+        [
+            ([1, "+", 2], "InvalidInputError"),
+            ({"a": 1, "op": "+"}, "InvalidInputError"),
+            ({"a": True, "op": "+", "b": 1}, "InvalidInputError"),
+            ({"a": None, "op": "+", "b": 1}, "InvalidInputError"),
+            ({"a": "x", "op": "+", "b": 1}, "InvalidInputError"),
+            ({"a": float("nan"), "op": "+", "b": 1}, "InvalidInputError"),
+            ({"a": 1, "op": "*", "b": float("-inf")}, "InvalidInputError"),
+            ({"a": 1, "op": "%", "b": 1}, "InvalidOperationError"),
+            ({"a": 1e200, "op": "*", "b": 1e200}, "OverflowError"),
+        ],
+    )
+    def test_evaluate_item_errors(self, item, code):
+        """Test invalid items are reported with exception class names."""
+        assert evaluate_item(Calculator(), item)["error"] == code
+
+
+class TestHTTPEndpoints:
+    """Test class for the HTTP endpoints."""
+
+    def test_calculate(self, server):
+        """Test the single calculation endpoint."""
+        status, _, body = post(server, "/calculate", {"a": 6, "op": "*", "b": 7})
+        assert (status, body) == (200, {"result": 42})
+
+    def test_calculate_error(self, server):
+        """Test calculation errors use status 422 and an error code."""
+        status, _, body = post(server, "/calculate", {"a": 1, "op": "/", "b": 0})
+        assert status == 422
+        assert body["error"] == "DivisionByZeroError"
+
+    def test_batch_streams_results(self, server, monkeypatch):
+        """Test the batch endpoint streams one result per item in order."""
+        monkeypatch.setattr(http_server, "STREAM_CHUNK_SIZE", 64)
+        items = [{"a": i, "op": "-", "b": 1} for i in range(50)]
+        items.append({"a": 1, "op": "/", "b": 0})
+
+        status, response, body = post(server, "/calculate/batch", items)
+
+        assert status == 200
+        assert response.getheader("Transfer-Encoding") == "chunked"
+        assert body[:50] == [{"result": i - 1} for i in range(50)]
+        assert body[50]["error"] == "DivisionByZeroError"
+
+    def test_batch_empty(self, server):
+        """Test an empty batch returns an empty array."""
+        assert post(server, "/calculate/batch", [])[2] == []
+
+    def test_batch_requires_array(self, server):
+        """Test a non-array batch body is rejected."""
+        status, _, body = post(server, "/calculate/batch", {"a": 1})
+        assert status == 400
+        assert body["error"] == "InvalidInputError"
+
+    def test_invalid_json(self, server):
+        """Test malformed JSON is rejected."""
+        status, _, body = post(server, "/calculate", b"{not json")
+        assert status == 400
+        assert body["error"] == "InvalidInputError"
+
+    def test_unknown_path(self, server):
+        """Test unknown paths return 404."""
+        assert post(server, "/nope", {})[0] == 404
+
+    def test_digit_limit(self, server, monkeypatch):
+        """Test JSON number operands are held to the input digit limit."""
+        monkeypatch.setattr(validation, "MAX_NUMBER_DIGITS", 5)
+        items = b'[{"a": 12345, "op": "+", "b": 1}, {"a": -123456, "op": "+", "b": 1}]'
+        status, _, body = post(server, "/calculate/batch", items)
+        assert status == 200
+        assert body == [
+            {"result": 12346},
+            {
+                "error": "InvalidInputError",
+                "message": "Number has 6 digits; the limit is 5",
+            },
+        ]
+
+    def test_non_finite_operand(self, server):
+        """Test NaN and Infinity operands are rejected, keeping responses JSON."""
+        status, _, body = post(server, "/calculate", b'{"a": NaN, "op": "+", "b": 1}')
+        assert (status, body["message"]) == (422, "NaN is not a valid number")
+
+    @pytest.mark.parametrize(
+        "path, length, status",
+        [("/nope", "30", 404), ("/calculate", "abc", 411), ("/calculate", "999", 413)],
+    )
+    def test_unread_body_closes_connection(
+        self, server, monkeypatch, path, length, status
+    ):
+        """Test a body left unread is not taken for the next request."""
+        monkeypatch.setattr(http_server, "MAX_BODY_SIZE", 100)
+        body = b"GET /x HTTP/1.1\r\nHost: x\r\n\r\n"
+        request = f"POST {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {length}\r\n"
+        with socket.create_connection(server.server_address) as connection:
+            connection.sendall(request.encode() + b"\r\n" + body)
+            # The server closes the connection after its only response
+            received = connection.makefile("rb").read()
+        assert received.startswith(b"HTTP/1.1 %d " % status)
+        assert received.count(b"HTTP/1.1") == 1
+        assert b"Connection: close" in received
+
+    @pytest.mark.parametrize("length", ["abc", "-1"])
+    def test_length_required(self, server, length):
+        """Test requests without a usable Content-Length are rejected."""
+        status, _, body = post(
+            server, "/calculate", b"", headers={"Content-Length": length}
+        )
+        assert (status, body["error"]) == (411, "LengthRequired")
+
+    def test_null_body(self, server):
+        """Test a JSON null body is reported as an invalid item."""
+        status, _, body = post(server, "/calculate", None)
+        assert (status, body["error"]) == (422, "InvalidInputError")
+
+    def test_payload_too_large(self, server, monkeypatch):
+        """Test bodies above the size limit are rejected before reading."""
+        monkeypatch.setattr(http_server, "MAX_BODY_SIZE", 4)
+        status, _, body = post(server, "/calculate", {"a": 1, "op": "+", "b": 1})
+        assert (status, body["error"]) == (413, "PayloadTooLarge")
@@ -1,24 +1,312 @@
 """Unit tests for the main entry point."""
 
+import io
+import json
+import os
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 import main
+from calculator import validation
+from calculator.settings import DEFAULT_TEXTFILE_INTERVAL
 
 
 class TestMain:
     """Test class for main module functionality."""
 
-    @patch("main.CalculatorCLI")
+    @patch("calculator.cli.CalculatorCLI")
     def test_main_function(self, mock_cli_class):
         """Test main function creates and runs CLI."""
         mock_cli_instance = MagicMock()
         mock_cli_class.return_value = mock_cli_instance
 
-        main.main()
+        main.main([])
 
         mock_cli_class.assert_called_once()
         mock_cli_instance.run.assert_called_once()
 
+    def test_main_batch_file(self, tmp_path, capfd):
+        """Test batch mode evaluates a file and writes plain results."""
+        input_path = tmp_path / "input.txt"
+        input_path.write_text("5 + 3\n10 / 0\n2.5 * 2\n")
+
+        assert main.main(["--batch", str(input_path)]) == 0
+
+        assert capfd.readouterr().out.splitlines() == [
+            "8",
+            "DivisionByZeroError: Division by zero is not allowed",
+            "5.0",
+        ]
+
+    def test_main_batch_mmap(self, tmp_path, capfd):
+        """Test --mmap evaluates a batch file through a memory mapping."""
+        input_path = tmp_path / "input.txt"
+        input_path.write_text("5 + 3\n10 / 0\n2.5 * 2\n")
+
+        assert main.main(["--batch", str(input_path), "--mmap"]) == 0
+
+        assert capfd.readouterr().out.splitlines() == [
+            "8",
+            "DivisionByZeroError: Division by zero is not allowed",
+            "5.0",
+        ]
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--mmap"],
+            ["--batch", "--mmap"],
+            ["--batch", "x", "--mmap", "--workers", "2"],
+        ],
+    )
+    def test_main_mmap_needs_batch_file(self, argv, capsys):
+        """Test --mmap is a usage error without a batch file or with workers."""
+        with pytest.raises(SystemExit):
+            main.main(argv)
+        assert "--mmap needs --batch PATH" in capsys.readouterr().err
+
+    def test_main_batch_columnar(self, tmp_path, capfd):
+        """Test --columnar evaluates CSV operand columns."""
+        input_path = tmp_path / "input.csv"
+        input_path.write_text("a,op,b\n5,+,3\n10,/,0\n")
+
+        assert main.main(["--batch", str(input_path), "--columnar"]) == 0
+
+        assert capfd.readouterr().out.splitlines() == [
+            "result,error",
+            "8.0,",
+            ",DivisionByZeroError",
+        ]
+
+    def test_main_batch_columnar_fixed_operation(self, capfd):
+        """Test --op applies one operation to columns read from stdin."""
+        with patch("sys.stdin", io.StringIO("a,b\n6,4\n")):
+            assert main.main(["--batch", "--columnar", "--op", "*"]) == 0
+
+        assert capfd.readouterr().out == "result,error\n24.0,\n"
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["--columnar"], "--columnar needs --batch"),
+            (["--batch", "x", "--columnar", "--mmap"], "--columnar needs --batch"),
+            (["--batch", "--columnar", "--workers", "2"], "--columnar needs --batch"),
+            (["--batch", "--op", "+"], "--op needs --columnar"),
+        ],
+    )
+    def test_main_columnar_usage_errors(self, argv, message, capsys):
+        """Test invalid --columnar and --op combinations are usage errors."""
+        with pytest.raises(SystemExit):
+            main.main(argv)
+        assert message in capsys.readouterr().err
+
+    def test_main_parse_cache_rejects_workers(self, capsys):
+        """Test --parse-cache is a usage error with worker processes."""
+        with pytest.raises(SystemExit):
+            main.main(["--batch", "x", "--parse-cache", "10", "--workers", "2"])
+        assert "--parse-cache cannot be combined" in capsys.readouterr().err
+
+    def test_main_batch_stdin_ndjson(self, capfd):
+        """Test batch mode reads stdin when no path is given."""
+        with patch("sys.stdin", io.StringIO("7 - 2\n")):
+            assert main.main(["--batch", "--format", "ndjson"]) == 0
+
+        assert json.loads(capfd.readouterr().out) == {
+            "expression": "7 - 2",
+            "result": 5,
+            "error": None,
+            "message": None,
+        }
+
+    def test_main_batch_workers(self, tmp_path, capfd):
+        """Test --workers evaluates a file in a process pool in input order."""
+        input_path = tmp_path / "input.txt"
+        input_path.write_text("".join(f"{i} - 1\n" for i in range(30)))
+
+        assert main.main(["--batch", str(input_path), "--workers", "2"]) == 0
+
+        assert capfd.readouterr().out.splitlines() == [str(i - 1) for i in range(30)]
+
+    def test_main_batch_parse_cache(self, tmp_path, capfd):
+        """Test --parse-cache reports its hit rate on stderr after batch mode."""
+        input_path = tmp_path / "input.txt"
+        input_path.write_text("2 * 3\n2 * 3\n2 * 3\nbad\n")
+
+        assert main.main(["--batch", str(input_path), "--parse-cache", "8"]) == 0
+
+        captured = capfd.readouterr()
+        assert captured.out.splitlines()[:3] == ["6", "6", "6"]
+        assert "Parse cache: 2 hits, 2 misses (50.0% hit rate)" in captured.err
+
+    def test_main_rejects_invalid_parse_cache(self, capsys):
+        """Test a parse cache size below one is a usage error."""
+        with pytest.raises(SystemExit):
+            main.main(["--parse-cache", "0"])
+        assert "--parse-cache must be at least 1" in capsys.readouterr().err
+
+    def test_main_input_limits(self, monkeypatch, capsys):
+        """Test --max-line-length and --max-digits apply to the evaluated input."""
+        monkeypatch.setattr(validation, "MAX_LINE_LENGTH", validation.MAX_LINE_LENGTH)
+        monkeypatch.setattr(
+            validation, "MAX_NUMBER_DIGITS", validation.MAX_NUMBER_DIGITS
+        )
+        argv = ["--max-line-length", "9", "--max-digits", "3", "999 + 1"]
+        assert main.main(argv + ["1000 + 1", "(1 + 2) * 3"]) == 1
+
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == ["1000"]
+        assert captured.err.splitlines() == [
+            "InvalidInputError: Number has 4 digits; the limit is 3",
+            "InvalidInputError: Input is 11 characters long; the limit is 9",
+        ]
+
+    @pytest.mark.parametrize("option", ["--max-line-length", "--max-digits"])
+    def test_main_rejects_invalid_input_limits(self, option, capsys):
+        """Test input limits below one are usage errors."""
+        with pytest.raises(SystemExit):
+            main.main([option, "0", "1 + 1"])
+        assert f"{option} must be at least 1" in capsys.readouterr().err
+
+    def test_main_rejects_invalid_workers(self, capsys):
+        """Test a worker count below one is a usage error."""
+        with pytest.raises(SystemExit):
+            main.main(["--batch", "--workers", "0"])
+        assert "--workers must be at least 1" in capsys.readouterr().err
+
+    def test_main_batch_metrics_textfile(self, tmp_path, capfd):
+        """Test --metrics-textfile leaves final metrics behind after batch mode."""
+        input_path = tmp_path / "input.txt"
+        input_path.write_text("1 + 2\n4 / 0\n")
+        metrics_path = tmp_path / "calculator.prom"
+
+        argv = ["--batch", str(input_path), "--metrics-textfile", str(metrics_path)]
+        assert main.main(argv) == 0
+
+        assert capfd.readouterr().out.splitlines()[0] == "3"
+        text = metrics_path.read_text()
+        assert 'calculator_calculations_total{op="+"} 1' in text
+        assert (
+            'calculator_calculation_errors_total{op="/",error="DivisionByZeroError"} 1'
+            in text
+        )
+        assert "calculator_parses_total 2" in text
+
+    @patch("calculator.exporter.MetricsExporter")
+    def test_main_metrics_port(self, mock_exporter_class, tmp_path, capfd):
+        """Test --metrics-port serves metrics until the run finishes."""
+        input_path = tmp_path / "input.txt"
+        input_path.write_text("1 + 2\n")
+
+        assert main.main(["--batch", str(input_path), "--metrics-port", "0"]) == 0
+
+        exporter = mock_exporter_class.return_value
+        exporter.serve.assert_called_once_with("127.0.0.1", 0)
+        exporter.start_textfile.assert_not_called()
+        exporter.close.assert_called_once()
+        assert "Serving metrics on http://127.0.0.1:0/metrics" in capfd.readouterr().err
+
+    def test_main_rejects_invalid_metrics_interval(self, capsys):
+        """Test a non-positive textfile interval is a usage error."""
+        with pytest.raises(SystemExit):
+            main.main(["--metrics-textfile", "x.prom", "--metrics-interval", "0"])
+        assert "--metrics-interval must be positive" in capsys.readouterr().err
+
+    def test_main_one_shot(self, capsys):
+        """Test positional and -e expressions are evaluated without the REPL."""
+        status = main.main(["12.5 * 4", "-e", "1 / 0", "-2 * (3 + 1)"])
+
+        captured = capsys.readouterr()
+        assert status == 1
+        assert captured.out.splitlines() == ["50.0", "-8"]
+        assert captured.err == (
+            "DivisionByZeroError: Division by zero is not allowed\n"
+        )
+
+    def test_main_one_shot_success(self, capsys):
+        """Test one-shot evaluation exits with status 0 when all succeed."""
+        assert main.main(["-e", "2 + 2", "-e", "3 * 3"]) == 0
+        assert capsys.readouterr().out.splitlines() == ["4", "9"]
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (
+                ["1 + 1", "-e", "2 * 3", "3 + 3", "--expr=4 - 1", "-e5 - 4"]
+                + ["--expression", "6 / 2", "-5 * 2"],
+                ["2", "6", "6", "3", "1", "3.0", "-10"],
+            ),
+            (["2 + 2", "-e", "1 + 1", "--", "-2 * 2"], ["4", "2", "-4"]),
+        ],
+    )
+    def test_main_one_shot_in_argument_order(self, argv, expected, capsys):
+        """Test -e and positional expressions are evaluated in argv order."""
+        main.main(argv)
+        captured = capsys.readouterr()
+        assert captured.out.splitlines() == expected
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["-5*2"], ["-e", "-5*2"], ["--", "-5*2"], ["-e", "-(3+2)*2"], ["-.5*20"]],
+    )
+    def test_main_one_shot_leading_minus(self, argv, capsys):
+        """Test expressions starting with "-" are not taken for options."""
+        assert main.main(argv) == 0
+        assert capsys.readouterr().out.strip() in ("-10", "-10.0")
+
+    def test_main_help_shows_textfile_interval(self, capsys):
+        """Test the --metrics-interval help shows the exporter's default."""
+        main.build_parser().print_help()
+        help_text = " ".join(capsys.readouterr().out.split())
+        assert f"(default: {DEFAULT_TEXTFILE_INTERVAL:g})" in help_text
+
+    def test_main_one_shot_with_metrics(self, tmp_path, capsys):
+        """Test one-shot evaluation is instrumented when metrics are requested."""
+        metrics_path = tmp_path / "calculator.prom"
+
+        assert main.main(["1 + 1", "--metrics-textfile", str(metrics_path)]) == 0
+
+        assert capsys.readouterr().out == "2\n"
+        assert 'calculator_calculations_total{op="+"} 1' in metrics_path.read_text()
+
+    def test_main_one_shot_rejects_other_modes(self, capsys):
+        """Test expressions cannot be combined with batch or server modes."""
+        with pytest.raises(SystemExit):
+            main.main(["1 + 1", "--batch"])
+        assert "cannot be combined" in capsys.readouterr().err
+
+    def test_main_one_shot_imports(self):
+        """Test one-shot evaluation imports neither batch mode, metrics nor servers."""
+        code = (
+            "import sys, main\n"
+            "main.main(['1 + 2'])\n"
+            "heavy = ('calculator.cli', 'calculator.exporter', 'calculator.server', "
+            "'calculator.http_server', 'calculator.batch', 'calculator.metrics', "
+            "'concurrent.futures', 'csv', 'json', 'mmap', 'numpy')\n"
+            "print([name for name in heavy if name in sys.modules])\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(main.__file__)),
+        ).stdout
+        assert output.splitlines() == ["3", "[]"]
+
+    def test_main_batch_missing_file(self, tmp_path, capsys):
+        """Test batch mode reports unreadable input files."""
+        assert main.main(["--batch", str(tmp_path / "missing.txt")]) == 1
+        assert "Failed to start calculator" in capsys.readouterr().out
+
+    @patch("calculator.cli.CalculatorCLI", side_effect=RuntimeError("boom"))
+    def test_main_startup_failure(self, mock_cli_class, capsys):
+        """Test startup failures are reported with a non-zero exit code."""
+        assert main.main([]) == 1
+        assert "Failed to start calculator: boom" in capsys.readouterr().out
+
     @patch("main.main")
     def test_name_main_guard(self, mock_main):
         """Test that main is called when script is run directly."""
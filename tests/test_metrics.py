@@ -0,0 +1,145 @@
+"""Unit tests for operation metrics."""
+
+import threading
+
+import pytest
+
+from calculator.exceptions import DivisionByZeroError
+from calculator.metrics import LATENCY_BUCKETS, OperationMetrics, timed
+
+
+class TestOperationMetrics:
+    """Test class for OperationMetrics functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metrics = OperationMetrics()
+
+    def test_latency_buckets_are_log_scale(self):
+        """Test buckets grow by a constant factor from 100 ns to 1 s."""
+        assert LATENCY_BUCKETS[0] == 1e-7
+        assert LATENCY_BUCKETS[-1] == 1.0
+        ratios = {
+            round(upper / lower, 6)
+            for lower, upper in zip(LATENCY_BUCKETS, LATENCY_BUCKETS[1:])
+        }
+        assert ratios == {round(10**0.5, 6)}
+
+    def test_record_and_snapshot(self):
+        """Test calls, errors, latency sums and histogram counts are recorded."""
+        self.metrics.record("+", 5e-7)
+        self.metrics.record("+", 2.0)
+        self.metrics.record("/", 1e-7, "DivisionByZeroError")
+
+        snapshot = self.metrics.snapshot()
+
+        assert snapshot["+"]["calls"] == 2
+        assert snapshot["+"]["errors"] == {}
+        assert snapshot["+"]["latency_sum"] == 2.0000005
+        histogram = dict(snapshot["+"]["histogram"])
+        assert histogram[10**-6] == 1
+        assert histogram[float("inf")] == 1
+        assert sum(histogram.values()) == 2
+        assert snapshot["/"]["errors"] == {"DivisionByZeroError": 1}
+        assert dict(snapshot["/"]["histogram"])[1e-7] == 1
+
+    def test_threads_are_aggregated(self):
+        """Test measurements from several threads are merged in snapshots."""
+
+        def work():
+            for _ in range(100):
+                self.metrics.record("*", 1e-6, "OverflowError")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = self.metrics.snapshot()
+        assert snapshot["*"]["calls"] == 400
+        assert snapshot["*"]["errors"] == {"OverflowError": 400}
+
+    def test_ended_threads_are_folded(self):
+        """Test the tables of ended threads are folded into one aggregate."""
+
+        def work():
+            self.metrics.record("+", 1e-6)
+            self.metrics.record("/", 1e-6, "DivisionByZeroError")
+
+        for _ in range(200):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+        self.metrics.record("+", 1e-6)
+
+        assert len(self.metrics._threads) <= 2
+        snapshot = self.metrics.snapshot()
+        assert snapshot["+"]["calls"] == 201
+        assert snapshot["/"]["errors"] == {"DivisionByZeroError": 200}
+        assert sum(count for _, count in snapshot["/"]["histogram"]) == 200
+
+    def test_reset_discards_live_and_ended_threads(self):
+        """Test reset discards tables of running threads, which end later."""
+        recorded = threading.Event()
+        finish = threading.Event()
+
+        def work():
+            self.metrics.record("*", 1e-6)
+            recorded.set()
+            finish.wait()
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        recorded.wait()
+        self.metrics.reset()
+        finish.set()
+        thread.join()
+
+        assert self.metrics.snapshot() == {}
+
+    def test_merge(self):
+        """Test a snapshot from elsewhere is added to the measurements."""
+        other = OperationMetrics()
+        other.record("+", 1e-6)
+        other.record("/", 2.0, "DivisionByZeroError")
+        self.metrics.record("+", 1e-6)
+        self.metrics.merge(other.snapshot())
+        self.metrics.merge(other.snapshot())
+
+        snapshot = self.metrics.snapshot()
+        assert snapshot["+"]["calls"] == 3
+        assert snapshot["/"]["errors"] == {"DivisionByZeroError": 2}
+        assert snapshot["/"]["latency_sum"] == 4.0
+        assert snapshot["/"]["histogram"][-1] == (float("inf"), 2)
+
+    def test_reset(self):
+        """Test reset discards measurements from every thread."""
+        self.metrics.record("-", 1e-6)
+        self.metrics.reset()
+        assert self.metrics.snapshot() == {}
+        self.metrics.record("-", 1e-6)
+        assert self.metrics.snapshot()["-"]["calls"] == 1
+
+
+class TestTimed:
+    """Test class for the timed wrapper."""
+
+    def test_records_calls_and_errors(self):
+        """Test successful and failing calls are recorded under one label."""
+        metrics = OperationMetrics()
+
+        def divide(a, b):
+            if b == 0:
+                raise DivisionByZeroError("Division by zero is not allowed")
+            return a / b
+
+        wrapped = timed(divide, metrics, "divide")
+
+        assert wrapped(6, 3) == 2
+        with pytest.raises(DivisionByZeroError):
+            wrapped(1, 0)
+
+        entry = metrics.snapshot()["divide"]
+        assert entry["calls"] == 2
+        assert entry["errors"] == {"DivisionByZeroError": 1}
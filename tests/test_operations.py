@@ -1,9 +1,23 @@
 """Unit tests for arithmetic operations."""
 
+import math
+
 import pytest
 
-from calculator.exceptions import DivisionByZeroError, OverflowError
-from calculator.operations import Addition, Division, Multiplication, Subtraction
+from calculator.exceptions import (
+    CalculatorError,
+    DivisionByZeroError,
+    InvalidInputError,
+    OverflowError,
+)
+from calculator.operations import (
+    Addition,
+    Division,
+    Multiplication,
+    Operation,
+    Subtraction,
+)
+from calculator.status import Status
 
 
 class TestAddition:
@@ -115,6 +129,23 @@ class TestMultiplication:
         with pytest.raises(OverflowError):
             self.operation.execute(large_num, large_num)
 
+    def test_max_bits(self):
+        """Test a bounded multiplication rejects longer int products."""
+        operation = Multiplication(max_bits=64)
+        assert operation.execute(2**32, -(2**31)) == -(2**63)
+        assert operation.execute(10**30, 0) == 0
+        assert operation.execute(2.0**70, 2) == 2.0**71
+        with pytest.raises(OverflowError, match="Multiplication overflow: 4294967296"):
+            operation.execute(2**32, 2**32)
+        with pytest.raises(OverflowError, match="<100001-bit int> \\* 2"):
+            operation.execute(2**100000, 2)
+        assert Multiplication().max_bits is None
+
+    def test_max_bits_negative(self):
+        """Test a negative bit limit is rejected."""
+        with pytest.raises(ValueError, match="must not be negative, got -1"):
+            Multiplication(max_bits=-1)
+
 
 class TestDivision:
     """Test class for Division operation."""
@@ -262,3 +293,154 @@ class TestOperationsParameterized:
             DivisionByZeroError, match="Division by zero is not allowed"
         ):
             operation.execute(10, zero_value)
+
+
+class TestTryExecute:
+    """Tests for the exception-free try_execute path."""
+
+    @pytest.mark.parametrize(
+        "operation_class, a, b, expected",
+        [
+            (Addition, 2, 3, 5),
+            (Subtraction, 2.5, 3, -0.5),
+            (Multiplication, -4, 2.5, -10.0),
+            (Division, 9, 2, 4.5),
+        ],
+    )
+    def test_success(self, operation_class, a, b, expected):
+        """Test successful operations return OK and the result."""
+        assert operation_class().try_execute(a, b) == (Status.OK, expected)
+
+    @pytest.mark.parametrize(
+        "operation_class, a, b, status",
+        [
+            (Addition, 1e308, 1e308, Status.OVERFLOW),
+            (Subtraction, -1e308, 1e308, Status.OVERFLOW),
+            (Multiplication, 1e200, 1e200, Status.OVERFLOW),
+            (Division, 1e308, 0.1, Status.OVERFLOW),
+            (Division, 1, 0, Status.DIVISION_BY_ZERO),
+        ],
+    )
+    def test_errors_match_execute(self, operation_class, a, b, status):
+        """Test error statuses and messages match what execute() raises."""
+        operation = operation_class()
+        outcome = operation.try_execute(a, b)
+
+        with pytest.raises(status.exception) as info:
+            operation.execute(a, b)
+        assert outcome == (status, str(info.value))
+
+    def test_default_for_execute_only_operations(self):
+        """Test operations implementing only execute() get a converting default."""
+
+        class Checked(Operation):
+            def execute(self, a, b):
+                if b < 0:
+                    raise InvalidInputError("negative")
+                if b == 0:
+                    raise CalculatorError("plugin specific")
+                return a
+
+            def get_symbol(self):
+                return "?"
+
+            def get_name(self):
+                return "checked"
+
+        operation = Checked()
+        assert operation.try_execute(1, 1) == (Status.OK, 1)
+        assert operation.try_execute(1, -1) == (Status.INVALID_INPUT, "negative")
+        with pytest.raises(CalculatorError, match="plugin specific"):
+            operation.try_execute(1, 0)
+        assert operation.execute_array([1, 1], [0, -1])[1] == [
+            "CalculatorError",
+            "InvalidInputError",
+        ]
+
+
+class TestExecuteArray:
+    """Tests for the column-wise execute_array path."""
+
+    @pytest.mark.parametrize(
+        "operation_class, a, b",
+        [
+            (Addition, [1, 2.5, -3], [4, 0.5, 3]),
+            (Subtraction, [10, 2.5, 0], [4, 0.5, 3]),
+            (Multiplication, [3, -2, 0.5], [7, 4, 8]),
+            (Division, [15, 7, -1], [3, 2, 4]),
+        ],
+    )
+    def test_execute_array_matches_execute(self, backend, operation_class, a, b):
+        """Test column results agree with scalar execute()."""
+        operation = operation_class()
+        results, errors = operation.execute_array(a, b)
+        assert list(results) == [operation.execute(x, y) for x, y in zip(a, b)]
+        assert errors == [None, None, None]
+
+    def test_execute_array_division_by_zero(self, backend):
+        """Test divide-by-zero rows are flagged and hold NaN."""
+        results, errors = Division().execute_array(
+            [1, 0, 4, 1e300], [0, 0.0, 2, 1e-300]
+        )
+        assert errors == [
+            "DivisionByZeroError",
+            "DivisionByZeroError",
+            None,
+            "OverflowError",
+        ]
+        assert math.isnan(results[0]) and math.isnan(results[1])
+        assert results[2] == 2.0
+        assert math.isnan(results[3])
+
+    @pytest.mark.parametrize(
+        "operation_class, a, b",
+        [
+            (Addition, [1e308, 1.0], [1e308, 1.0]),
+            (Subtraction, [-1e308, 1.0], [1e308, 1.0]),
+            (Multiplication, [1e200, 1.0], [1e200, 1.0]),
+        ],
+    )
+    def test_execute_array_overflow(self, backend, operation_class, a, b):
+        """Test overflowing rows are flagged and other rows are kept."""
+        results, errors = operation_class().execute_array(a, b)
+        assert errors == ["OverflowError", None]
+        assert math.isnan(results[0])
+
+    def test_execute_array_ints_beyond_float_range(self, backend):
+        """Test int operands beyond float range are computed exactly per row."""
+        big = 10**400
+        results, errors = Addition().execute_array([big, big, 2], [1, -big, 3])
+        assert errors == ["OverflowError", None, None]
+        assert math.isnan(results[0])
+        assert list(results[1:]) == [0, 5]
+
+    def test_execute_array_empty(self, backend):
+        """Test empty columns produce empty results."""
+        results, errors = Addition().execute_array([], [])
+        assert list(results) == []
+        assert errors == []
+
+    def test_execute_array_length_mismatch(self, backend):
+        """Test columns of different lengths are rejected."""
+        with pytest.raises(ValueError, match="differ"):
+            Addition().execute_array([1, 2], [1])
+
+    def test_execute_array_without_kernel_uses_python_path(self, backend):
+        """Test operations without a vectorized kernel still work on columns."""
+
+        class Modulo(Operation):
+            def execute(self, a, b):
+                if b == 0:
+                    raise DivisionByZeroError("Modulo by zero is not allowed")
+                return a % b
+
+            def get_symbol(self):
+                return "%"
+
+            def get_name(self):
+                return "modulo"
+
+        results, errors = Modulo().execute_array([7, 9], [4, 0])
+        assert results[0] == 3
+        assert math.isnan(results[1])
+        assert errors == [None, "DivisionByZeroError"]
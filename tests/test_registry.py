@@ -0,0 +1,206 @@
+"""Unit tests for the lazy operation registry."""
+
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import calculator
+from calculator import registry
+from calculator.calculator import Calculator
+from calculator.exceptions import InvalidOperationError
+from calculator.operations import Addition, Operation
+from calculator.registry import (
+    BUILTIN_OPERATIONS,
+    OperationRegistry,
+    default_registry,
+    register_operation,
+)
+
+
+class Modulo(Operation):
+    """Third-party style operation used by the tests."""
+
+    def execute(self, a, b):
+        """Return a modulo b."""
+        return a % b
+
+    def get_symbol(self):
+        """Get the symbol."""
+        return "%"
+
+    def get_name(self):
+        """Get the name."""
+        return "modulo"
+
+
+class TestOperationRegistry:
+    """Test class for OperationRegistry functionality."""
+
+    def test_builtins_load_on_first_lookup(self):
+        """Test operations are instantiated only when first looked up."""
+        operations = OperationRegistry(BUILTIN_OPERATIONS)
+
+        assert "+" in operations
+        assert operations._loaded == {}
+
+        addition = operations["+"]
+        assert isinstance(addition, Addition)
+        assert operations["+"] is addition
+        assert list(operations._loaded) == ["+"]
+
+    def test_operation_instances(self):
+        """Test configured operation instances are registered as they are."""
+        modulo = Modulo()
+        operations = OperationRegistry({"%": modulo})
+
+        assert operations["%"] is modulo
+        assert Calculator(registry=operations).calculate(7, "%", 4) == 3
+
+    def test_mapping_interface(self):
+        """Test the registry behaves as a read-only mapping."""
+        operations = OperationRegistry(BUILTIN_OPERATIONS)
+
+        assert len(operations) == 4
+        assert list(operations) == ["+", "-", "*", "/"]
+        assert operations.get("@") is None
+        assert "@" not in operations
+        with pytest.raises(KeyError):
+            operations["@"]
+
+    def test_unused_specs_are_never_imported(self):
+        """Test registering many operations does not import any of them."""
+        operations = OperationRegistry(BUILTIN_OPERATIONS)
+        for index in range(50):
+            operations.register(f"op{index}", f"missing_module_{index}:Operation")
+
+        assert Calculator(registry=operations).calculate(6, "*", 7) == 42
+        assert len(operations) == 54
+
+    def test_register_class_and_spec(self):
+        """Test operations can be registered as classes or import paths."""
+        operations = OperationRegistry()
+        operations.register("%", Modulo)
+        operations.register("+", "calculator.operations:Addition")
+
+        assert operations["%"].execute(7, 3) == 1
+        assert operations["+"].execute(7, 3) == 10
+
+    def test_register_duplicate(self):
+        """Test a symbol cannot be registered twice."""
+        operations = OperationRegistry(BUILTIN_OPERATIONS)
+        with pytest.raises(ValueError, match="already registered"):
+            operations.register("+", Modulo)
+
+    def test_unregister(self):
+        """Test unregistered operations are removed along with loaded instances."""
+        operations = OperationRegistry(BUILTIN_OPERATIONS)
+        operations["-"]
+        operations.unregister("-")
+
+        assert "-" not in operations
+        assert "-" not in operations._loaded
+        with pytest.raises(KeyError):
+            operations.unregister("-")
+
+    def test_rejects_non_operations(self):
+        """Test specs must name Operation subclasses."""
+        operations = OperationRegistry({"x": "collections:OrderedDict"})
+        with pytest.raises(TypeError, match="is not an Operation"):
+            operations["x"]
+
+    def test_rejects_symbol_mismatch(self):
+        """Test an operation must report the symbol it is registered under."""
+        operations = OperationRegistry({"mod": Modulo})
+        with pytest.raises(ValueError, match="reports symbol '%'"):
+            operations["mod"]
+
+
+class TestEntryPoints:
+    """Test class for entry point discovery."""
+
+    def entry_points(self, *pairs):
+        """Build a fake importlib.metadata.entry_points() result."""
+        points = [SimpleNamespace(name=name, value=value) for name, value in pairs]
+        return SimpleNamespace(select=lambda group: points)
+
+    def test_discovered_on_unknown_symbol(self):
+        """Test entry points are read once, when an unknown symbol is requested."""
+        fake = self.entry_points(("%", f"{__name__}:Modulo"))
+        operations = OperationRegistry(BUILTIN_OPERATIONS, "calculator.operations")
+
+        with patch("importlib.metadata.entry_points", return_value=fake) as read:
+            assert "+" in operations
+            read.assert_not_called()
+
+            assert operations["%"].execute(8, 5) == 3
+            assert "@" not in operations
+            read.assert_called_once()
+
+    def test_explicit_registrations_win(self):
+        """Test entry points do not replace built-in or registered operations."""
+        fake = self.entry_points(("+", f"{__name__}:Modulo"))
+        operations = OperationRegistry(BUILTIN_OPERATIONS, "calculator.operations")
+
+        with patch("importlib.metadata.entry_points", return_value=fake):
+            assert list(operations) == ["+", "-", "*", "/"]
+        assert isinstance(operations["+"], Addition)
+
+    def test_default_registry_reads_installed_entry_points(self):
+        """Test discovery against the real installed distributions."""
+        operations = OperationRegistry({}, registry.ENTRY_POINT_GROUP)
+        assert isinstance(len(operations), int)
+
+
+class TestCalculatorRegistry:
+    """Test class for Calculator integration with the registry."""
+
+    def test_register_operation(self):
+        """Test register_operation makes an operation available to calculators."""
+        register_operation("%", Modulo)
+        try:
+            calc = Calculator()
+            assert calc.calculate(10, "%", 4) == 2
+            assert calc.get_available_operations()["%"] == "modulo"
+            assert calc.calculate_many([9, 9], "%", [2, 4]) == ([1, 1], [None, None])
+        finally:
+            default_registry.unregister("%")
+
+        with pytest.raises(InvalidOperationError):
+            Calculator().calculate(10, "%", 4)
+
+    def test_calculator_with_custom_registry(self):
+        """Test a calculator only offers the operations of its registry."""
+        calc = Calculator(registry=OperationRegistry({"%": Modulo}))
+
+        assert calc.calculate(7, "%", 2) == 1
+        with pytest.raises(InvalidOperationError, match="Valid operations: %"):
+            calc.calculate(7, "+", 2)
+
+
+class TestLazyImports:
+    """Test class for lazy package imports."""
+
+    def test_package_attributes(self):
+        """Test public names resolve from their submodules."""
+        assert calculator.Calculator is Calculator
+        assert calculator.register_operation is register_operation
+        assert "OperationRegistry" in dir(calculator)
+        with pytest.raises(AttributeError):
+            calculator.missing_name
+
+    def test_import_does_not_load_numpy_or_submodules(self):
+        """Test importing the package and calculating stays lightweight."""
+        code = (
+            "import sys, calculator\n"
+            "loaded = [name for name in ('calculator.calculator', 'numpy') "
+            "if name in sys.modules]\n"
+            "calculator.Calculator().calculate(1, '+', 2)\n"
+            "print(loaded, 'numpy' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "[] False"
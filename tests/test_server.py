@@ -0,0 +1,137 @@
+"""Unit tests for the asyncio calculation server."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from calculator import validation
+from calculator.server import (
+    CalculationServer,
+    percentile,
+    run_load,
+    run_server,
+    stream_limit,
+)
+
+
+def run_with_server(client, server=None):
+    """Start a server on a free port, run the client coroutine against it."""
+
+    async def scenario():
+        running = await (server or CalculationServer()).start("127.0.0.1", 0)
+        port = running.sockets[0].getsockname()[1]
+        async with running:
+            return await client(port)
+
+    return asyncio.run(scenario())
+
+
+class TestCalculationServer:
+    """Test class for CalculationServer functionality."""
+
+    def test_respond_result(self):
+        """Test successful requests return an OK line."""
+        assert CalculationServer().respond(b"(2 + 3) * 4\n") == b"OK 20\n"
+
+    def test_respond_error(self):
+        """Test failed requests return the exception class and message."""
+        assert CalculationServer().respond(b"1 / 0\n") == (
+            b"ERR DivisionByZeroError Division by zero is not allowed\n"
+        )
+
+    def test_respond_invalid_utf8(self):
+        """Test undecodable requests are reported as invalid input."""
+        assert CalculationServer().respond(b"\xff\n") == (
+            b"ERR InvalidInputError Request is not valid UTF-8\n"
+        )
+
+    def test_respond_unexpected_error(self):
+        """Test exceptions outside CalculatorError are answered with an ERR line."""
+        server = CalculationServer()
+        server.validator = Mock()
+        server.validator.parse_input.side_effect = RuntimeError("boom")
+        assert server.respond(b"1 + 1\n") == b"ERR RuntimeError boom\n"
+
+    def test_stream_limit_follows_line_limit(self, monkeypatch):
+        """Test the stream buffer holds any line within the input line limit."""
+        monkeypatch.setattr(validation, "MAX_LINE_LENGTH", 10)
+        assert stream_limit() == 42
+        assert CalculationServer().stream_limit == 42
+
+    def test_pipelined_requests_are_answered_in_order(self):
+        """Test many requests sent at once are answered in request order."""
+
+        async def client(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"".join(f"{i} * 2\n".encode() for i in range(100)))
+            writer.write(b"5 / 0\n")
+            await writer.drain()
+            responses = [await reader.readline() for _ in range(101)]
+            writer.close()
+            await writer.wait_closed()
+            return responses
+
+        responses = run_with_server(client)
+        assert responses[:100] == [f"OK {i * 2}\n".encode() for i in range(100)]
+        assert responses[100].startswith(b"ERR DivisionByZeroError")
+
+    def test_oversized_request_closes_connection(self):
+        """Test requests beyond the line limit get an error and a close."""
+
+        async def client(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"1" * (70 * 1024) + b"\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+
+        response = run_with_server(client)
+        assert response.startswith(b"ERR InvalidInputError Request exceeds")
+
+    def test_client_reset_is_ignored(self):
+        """Test a connection error while serving does not escape the handler."""
+        server = CalculationServer()
+
+        async def client(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"1 + 1\n")
+            await writer.drain()
+            await reader.readline()
+            writer.close()
+
+        with patch.object(server, "respond", side_effect=ConnectionResetError):
+            run_with_server(client, server)
+
+    def test_run_server(self):
+        """Test run_server binds a server and serves until serve_forever ends."""
+        with patch.object(
+            asyncio.base_events.Server, "serve_forever", new=AsyncMock()
+        ) as mock_serve:
+            run_server("127.0.0.1", 0)
+        mock_serve.assert_awaited_once()
+
+
+class TestLoadGenerator:
+    """Test class for the load-generator client."""
+
+    def test_run_load_reports_throughput_and_latency(self):
+        """Test the load generator answers every request and reports latency."""
+        requests = [f"{i} + 1" for i in range(200)]
+
+        async def client(port):
+            return await run_load(
+                "127.0.0.1", port, requests, connections=2, pipeline_depth=16
+            )
+
+        report = run_with_server(client)
+        assert report.requests == 200
+        assert report.throughput > 0
+        assert 0 < report.p50_latency <= report.p99_latency
+
+    def test_percentile(self):
+        """Test percentiles of sorted values."""
+        values = [float(i) for i in range(100)]
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile(values, 1.0) == 99.0
+        assert percentile([], 0.5) == 0.0
@@ -0,0 +1,50 @@
+"""Unit tests for result statuses."""
+
+import pytest
+
+from calculator.exceptions import (
+    CalculatorError,
+    DivisionByZeroError,
+    InvalidInputError,
+    InvalidOperationError,
+    OverflowError,
+)
+from calculator.status import Status, unwrap
+
+
+class TestStatus:
+    """Test class for Status functionality."""
+
+    @pytest.mark.parametrize(
+        "status, exception",
+        [
+            (Status.INVALID_INPUT, InvalidInputError),
+            (Status.INVALID_OPERATION, InvalidOperationError),
+            (Status.DIVISION_BY_ZERO, DivisionByZeroError),
+            (Status.OVERFLOW, OverflowError),
+        ],
+    )
+    def test_error_statuses_map_to_exceptions(self, status, exception):
+        """Test each error status is named after and maps to its exception."""
+        assert status.value == exception.__name__
+        assert status.exception is exception
+        assert Status.for_exception(exception("message")) is status
+
+    def test_ok_has_no_exception(self):
+        """Test OK has no exception class."""
+        assert Status.OK.exception is None
+
+    def test_unknown_exceptions_have_no_status(self):
+        """Test exceptions without their own status map to None."""
+
+        class PluginError(DivisionByZeroError):
+            pass
+
+        assert Status.for_exception(CalculatorError("x")) is None
+        assert Status.for_exception(PluginError("x")) is None
+
+    def test_unwrap(self):
+        """Test unwrap returns OK values and raises for error statuses."""
+        assert unwrap((Status.OK, 42)) == 42
+        with pytest.raises(OverflowError, match="too big"):
+            unwrap((Status.OVERFLOW, "too big"))
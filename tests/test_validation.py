@@ -4,8 +4,15 @@ from unittest.mock import patch
 
 import pytest
 
+from calculator import validation
 from calculator.exceptions import InvalidInputError
-from calculator.validation import InputValidator
+from calculator.expression import compile_expression, tokenize
+from calculator.status import Status
+from calculator.validation import (
+    CachingInputValidator,
+    InputValidator,
+    set_input_limits,
+)
 
 
 class TestInputValidator:
@@ -113,3 +120,385 @@ class TestInputValidator:
             self.validator.parse_calculation_input("+ 3")
         with pytest.raises(InvalidInputError):
             self.validator.parse_calculation_input("abc + 3")
+
+    @pytest.mark.parametrize(
+        "input_str, expected",
+        [
+            ("5 + 3", (5, "+", 3)),
+            ("-5*2.5", (-5, "*", 2.5)),
+            ("10 / -3", (10, "/", -3)),
+            ("1e3 - 2", (1000.0, "-", 2)),
+            ("+7 + -2E-1", (7, "+", -0.2)),
+            ("2.0 * 3", (2.0, "*", 3)),
+        ],
+    )
+    def test_parse_calculation_input_operand_types(self, input_str, expected):
+        """Test parsed operands match validate_number() in value and type."""
+        result = self.validator.parse_calculation_input(input_str)
+        assert result == expected
+        assert [type(part) for part in result] == [type(part) for part in expected]
+
+    @pytest.mark.parametrize(
+        "operand",
+        ["7", "-7", "+0.5", "1e3", "2E+2", "-3.5e-2", "\u0665", "\u0665.5e1"]
+        + ["+", "-", "+-1", "1.", ".5", "1.2.3", "1e", "1e+", "1e2.5", "1e2e3"]
+        + ["e5", "1_0", "\u00b2", "inf", "nan", "0x1", "1ee2", "1.e2", "-+1"],
+    )
+    def test_spaced_and_unspaced_lines_agree(self, operand):
+        """Test the word scanner accepts the operands the pattern accepts."""
+        spaced = InputValidator.try_parse(f"{operand} * {operand}")
+        assert spaced == InputValidator.try_parse(f"{operand}*{operand}")
+        assert (spaced[0] is Status.OK) == bool(
+            validation._match_calculation(operand + "+1")
+        )
+
+    @pytest.mark.parametrize("operand", ["1e999", "-1.5e400"])
+    def test_parse_calculation_input_out_of_range(self, operand):
+        """Test float operands beyond the double range are rejected."""
+        with pytest.raises(InvalidInputError, match="is out of range"):
+            self.validator.parse_calculation_input(f"1 + {operand}")
+
+    def test_parse_calculation_input_too_many_digits(self):
+        """Test integer operands beyond the digit limit are rejected."""
+        operand = "9" * 5000
+        with pytest.raises(InvalidInputError, match="Number has 5000 digits"):
+            self.validator.parse_calculation_input(f"{operand} + 1")
+
+
+class TestFixedPointValidation:
+    """Test class for parsing numbers into scaled fixed-point ints."""
+
+    @pytest.mark.parametrize(
+        "input_str, scale, expected",
+        [
+            ("12.5", 2, 1250),
+            ("-0.07", 2, -7),
+            ("+.5", 1, 5),
+            ("7.", 0, 7),
+            ("0.10", 1, 1),
+            ("1.5e-2", 4, 150),
+            ("25E3", 2, 2500000),
+            ("12.300e-1", 2, 123),
+            ("0.000e-999999999", 2, 0),
+            ("9223372036854775807", 0, 2**63 - 1),
+            ("-9.223372036854775807", 18, -(2**63 - 1)),
+        ],
+    )
+    def test_validate_number_with_scale(self, input_str, scale, expected):
+        """Test numbers are scaled exactly, whatever their notation."""
+        result = InputValidator.validate_number(input_str, scale)
+        assert result == expected and type(result) is int
+
+    @pytest.mark.parametrize(
+        "input_str, message",
+        [
+            ("0.125", "has more than 2 decimal places"),
+            ("1e-3", "has more than 2 decimal places"),
+            ("5e-1000000000", "has more than 2 decimal places"),
+            ("92233720368547758.08", "is out of range"),
+            ("100000000000000000000", "is out of range"),
+            ("1e17", "is out of range"),
+            ("1e1000000000", "is out of range"),
+            ("9.3e16", "is out of range"),
+            ("1.5.5", "is not a valid number format"),
+            ("nan", "is not a valid number format"),
+            (".", "is not a valid number format"),
+        ],
+    )
+    def test_validate_number_with_scale_rejects(self, input_str, message):
+        """Test inexact, out-of-range and malformed numbers are rejected."""
+        with pytest.raises(InvalidInputError, match=message):
+            InputValidator.validate_number(input_str, 2)
+        status, _ = InputValidator.try_validate_number(input_str, 2)
+        assert status is Status.INVALID_INPUT
+
+    @pytest.mark.parametrize(
+        "input_str", ["1.5", " -.25 ", "+7.", "1.5e-1", "0.001", "--5", "5 .", "1_0"]
+    )
+    def test_convert_fixed_point(self, input_str):
+        """Test bulk conversion accepts exactly what validate_number() accepts."""
+        status, value = InputValidator.try_validate_number(input_str, 2)
+        expected = value if status is Status.OK else None
+        assert InputValidator.convert_fixed_point(input_str, 2) == expected
+
+    def test_parse_fixed_point_input(self):
+        """Test both operands of a calculation are scaled."""
+        assert InputValidator.parse_fixed_point_input(" 0.1 + -2.25 ", 2) == (
+            10,
+            "+",
+            -225,
+        )
+        with pytest.raises(InvalidInputError, match="Invalid input format"):
+            InputValidator.parse_fixed_point_input("0.1 +", 2)
+        with pytest.raises(InvalidInputError, match="more than 1 decimal places"):
+            InputValidator.parse_fixed_point_input("0.1 * 0.25", 1)
+
+
+class TestInputLimits:
+    """Test class for the input line and number digit limits."""
+
+    @pytest.fixture(autouse=True)
+    def restore_limits(self, monkeypatch):
+        """Restore the module's limits after each test."""
+        monkeypatch.setattr(validation, "MAX_LINE_LENGTH", validation.MAX_LINE_LENGTH)
+        monkeypatch.setattr(
+            validation, "MAX_NUMBER_DIGITS", validation.MAX_NUMBER_DIGITS
+        )
+
+    def test_long_line_rejected_before_matching(self, monkeypatch):
+        """Test lines beyond the limit are rejected by length alone."""
+        set_input_limits(max_line_length=10)
+        monkeypatch.setattr(validation, "_match_calculation", None)
+        assert InputValidator.try_parse("1" * 9 + " + 1") == (
+            Status.INVALID_INPUT,
+            "Input is 13 characters long; the limit is 10",
+        )
+        with pytest.raises(InvalidInputError, match="13 characters long"):
+            InputValidator.check_line_length("1" * 9 + " + 1")
+        InputValidator.check_line_length("1" * 10)
+
+    def test_long_expression_rejected_before_tokenizing(self):
+        """Test the expression tokenizer and compiler apply the line limit."""
+        assert compile_expression("(1 + 2) * 3").variables == ()
+        set_input_limits(max_line_length=8)
+        assert len(tokenize("(1+2)*3")) == 7
+        with pytest.raises(InvalidInputError, match="the limit is 8"):
+            tokenize("(1 + 2) * 3")
+        # Programs compiled under the old limit are not reused
+        with pytest.raises(InvalidInputError, match="the limit is 8"):
+            compile_expression("(1 + 2) * 3")
+
+    def test_digit_limit(self):
+        """Test numbers are limited by their digits, not their other characters."""
+        set_input_limits(max_number_digits=5)
+        assert InputValidator.validate_number(" -123.45 ") == -123.45
+        assert InputValidator.validate_number("123e-10") == 123e-10
+        assert InputValidator.validate_number("12345", scale=2) == 1234500
+        with pytest.raises(InvalidInputError, match="Number has 6 digits; the limit"):
+            InputValidator.validate_number("-1234.56")
+        with pytest.raises(InvalidInputError, match="Number has 6 digits"):
+            InputValidator.validate_number("123456", scale=0)
+
+    def test_digit_limit_in_bulk_conversion(self):
+        """Test the bulk converters apply the digit limit."""
+        set_input_limits(max_number_digits=3)
+        assert InputValidator.convert_number("-123") == -123
+        assert InputValidator.convert_number("1.25") == 1.25
+        assert InputValidator.convert_number("1234") is None
+        assert InputValidator.convert_number("12.3_4") is None
+        assert InputValidator.convert_fixed_point("1.25", 2) == 125
+        assert InputValidator.convert_fixed_point("1.2e-1", 2) == 12
+        assert InputValidator.convert_fixed_point("12.25", 2) is None
+
+    @pytest.mark.parametrize(
+        "input_str, expected",
+        [
+            ("123 + 4.5e1", (Status.OK, (123, "+", 45.0))),
+            ("1234 + 1", (Status.INVALID_INPUT, "Number has 4 digits; the limit is 3")),
+            ("1 * 1234", (Status.INVALID_INPUT, "Number has 4 digits; the limit is 3")),
+        ],
+    )
+    def test_digit_limit_in_calculations(self, input_str, expected):
+        """Test operands of long lines are checked against the digit limit."""
+        set_input_limits(max_number_digits=3)
+        outcome = InputValidator.try_parse(input_str)
+        assert outcome == expected
+        if outcome[0] is Status.OK:
+            assert [type(part) for part in outcome[1]] == [int, str, float]
+
+    def test_digit_limit_raised_past_int_limit(self):
+        """Test numbers int() itself refuses are invalid, not errors."""
+        set_input_limits(max_number_digits=10**5)
+        line = "9" * 5000 + " + 1"
+        try:
+            expected = (Status.OK, (int("9" * 5000), "+", 1))
+        except ValueError:
+            expected = (Status.INVALID_INPUT, f"'{'9' * 5000}' is not a valid number")
+        assert InputValidator.try_parse(line) == expected
+        parsed = expected[1] if expected[0] is Status.OK else None
+        assert list(InputValidator.scan_bytes(line.encode())) == [(0, 5004, parsed)]
+
+    def test_scan_bytes_leaves_long_lines_to_try_parse(self):
+        """Test lines long enough to be beyond a limit are not parsed from bytes."""
+        set_input_limits(max_number_digits=5)
+        data = b"1 + 2\n123 + 4\n"
+        assert list(InputValidator.scan_bytes(data)) == [
+            (0, 5, (1, "+", 2)),
+            (6, 13, None),
+        ]
+
+    def test_set_input_limits(self):
+        """Test limits are changed independently and must be positive."""
+        set_input_limits(max_line_length=100)
+        set_input_limits(max_number_digits=7)
+        assert (validation.MAX_LINE_LENGTH, validation.MAX_NUMBER_DIGITS) == (100, 7)
+        with pytest.raises(ValueError, match="at least 1, got 0"):
+            set_input_limits(max_number_digits=0)
+        with pytest.raises(ValueError, match="at least 1, got -5"):
+            set_input_limits(max_line_length=-5)
+        assert (validation.MAX_LINE_LENGTH, validation.MAX_NUMBER_DIGITS) == (100, 7)
+
+
+class TestConvertNumber:
+    """Test class for bulk number conversion."""
+
+    @pytest.mark.parametrize(
+        "input_str",
+        [
+            "5",
+            " -0 ",
+            "+12",
+            "1.",
+            ".5",
+            "-2.5e3",
+            "1E+5",
+            "5e",
+            "",
+            "abc",
+            "inf",
+            "-Infinity",
+            "nan",
+            "1_000",
+            "1_0.5",
+            "1.2.3",
+            "1e999",
+            "9" * 5000,
+        ],
+    )
+    def test_convert_number_matches_try_validate_number(self, input_str):
+        """Test convert_number accepts exactly what try_validate_number accepts."""
+        status, value = InputValidator.try_validate_number(input_str)
+        converted = InputValidator.convert_number(input_str)
+        if status is Status.OK:
+            assert (converted, type(converted)) == (value, type(value))
+        else:
+            assert converted is None
+
+
+class TestScanBytes:
+    """Test class for parsing calculation lines straight from bytes."""
+
+    @pytest.mark.parametrize(
+        "input_str", ["5 + 3", " -2.5e3*4\t", "10 / -3", "1.5 - 0.5", "7 %  2", "abc"]
+    )
+    def test_scan_bytes_matches_try_parse(self, input_str):
+        """Test scan_bytes agrees with try_parse on every line it parses."""
+        found = list(InputValidator.scan_bytes(input_str.encode()))
+        status, value = InputValidator.try_parse(input_str)
+        if found:
+            [(start, end, parsed)] = found
+            assert (start, end) == (0, len(input_str))
+            assert (status, parsed) == (Status.OK, value)
+            assert [type(part) for part in parsed] == [type(part) for part in value]
+        else:
+            assert status is Status.INVALID_INPUT
+
+    def test_scan_bytes_line_offsets(self):
+        """Test lines are found between offsets and other lines are skipped."""
+        data = b"1 + 1\r\n(2)\n\n 2.5 * 4\n1 +\r 1\n3 - 1"
+        assert list(InputValidator.scan_bytes(data)) == [
+            (0, 6, (1, "+", 1)),
+            (12, 20, (2.5, "*", 4)),
+            (28, 33, (3, "-", 1)),
+        ]
+        assert list(InputValidator.scan_bytes(data, 12, 20)) == [
+            (12, 20, (2.5, "*", 4))
+        ]
+
+    @pytest.mark.parametrize(
+        "data", [b"1e999 + 1", b"1 + 1e999", ("9" * 5000 + " + 1").encode()]
+    )
+    def test_scan_bytes_leaves_out_of_range_operands(self, data):
+        """Test lines with out-of-range operands are found but not parsed."""
+        assert list(InputValidator.scan_bytes(data)) == [(0, len(data), None)]
+
+
+class TestTryParse:
+    """Test class for the exception-free parsing API."""
+
+    @pytest.mark.parametrize(
+        "input_str",
+        ["5 + 3", "-2.5e3*4", "", "   ", "5 +", "abc", "1e999 + 1", "1 + 1e999"],
+    )
+    def test_try_parse_matches_parse_calculation_input(self, input_str):
+        """Test try_parse agrees with parse_calculation_input on every input."""
+        status, value = InputValidator.try_parse(input_str)
+        if status is Status.OK:
+            assert value == InputValidator.parse_calculation_input(input_str)
+        else:
+            assert status is Status.INVALID_INPUT
+            with pytest.raises(InvalidInputError) as info:
+                InputValidator.parse_calculation_input(input_str)
+            assert value == str(info.value)
+
+    @pytest.mark.parametrize("input_str", ["42", " 2.5 ", "", "1.2.3", "1e999"])
+    def test_try_validate_number_matches_validate_number(self, input_str):
+        """Test try_validate_number agrees with validate_number."""
+        status, value = InputValidator.try_validate_number(input_str)
+        if status is Status.OK:
+            assert value == InputValidator.validate_number(input_str)
+        else:
+            with pytest.raises(InvalidInputError) as info:
+                InputValidator.validate_number(input_str)
+            assert value == str(info.value)
+
+    def test_parse_input(self):
+        """Test simple lines are parsed and other lines are compiled."""
+        validator = InputValidator()
+        assert validator.parse_input("5 + 3", compile_expression) == (5, "+", 3)
+        program = validator.parse_input("(5 + 3) * 2", compile_expression)
+        assert program.evaluate(lambda a, op, b: a * b if op == "*" else a + b) == 16
+        for input_str in ("abc + def", "x * (y + 1)"):
+            with pytest.raises(InvalidInputError, match="Invalid input format"):
+                validator.parse_input(input_str, compile_expression)
+
+    def test_caching_try_parse(self):
+        """Test the caching validator memoizes try_parse outcomes."""
+        validator = CachingInputValidator(8)
+        assert validator.try_parse("2 * 3") == (Status.OK, (2, "*", 3))
+        assert validator.try_parse("2 * 3") == (Status.OK, (2, "*", 3))
+        assert validator.try_parse("bad")[0] is Status.INVALID_INPUT
+        assert validator.cache_info().hits == 1
+
+
+class TestCachingInputValidator:
+    """Test class for the memoizing parse layer."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.validator = CachingInputValidator(cache_size=2)
+
+    def test_parse_results_are_cached(self):
+        """Test repeated lines are served from the cache."""
+        assert self.validator.parse_calculation_input("5 + 3") == (5, "+", 3)
+        with patch.object(
+            InputValidator, "parse_calculation_input", side_effect=AssertionError
+        ):
+            assert self.validator.parse_calculation_input("5 + 3") == (5, "+", 3)
+        info = self.validator.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_failed_parses_are_cached(self):
+        """Test invalid lines are cached as negative entries."""
+        for _ in range(2):
+            with pytest.raises(InvalidInputError, match="Invalid input format"):
+                self.validator.parse_calculation_input("5 +")
+        assert self.validator.cache_info().hits == 1
+
+    def test_cache_is_bounded(self):
+        """Test the least recently used line is evicted."""
+        for line in ("1 + 1", "2 + 2", "3 + 3"):
+            self.validator.parse_calculation_input(line)
+        info = self.validator.cache_info()
+        assert (info.size, info.evictions) == (2, 1)
+
+    def test_clear_cache(self):
+        """Test the cache can be cleared."""
+        self.validator.parse_calculation_input("1 + 1")
+        self.validator.clear_cache()
+        assert self.validator.cache_info().size == 0
+
+    def test_is_an_input_validator(self):
+        """Test the caching validator keeps the InputValidator interface."""
+        assert isinstance(self.validator, InputValidator)
+        assert self.validator.validate_number("7") == 7